@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from apps.exam_board.models import ExamPost
+from apps.exam_board.sanitizer import SANITIZER_VERSION
+
+
+class Command(BaseCommand):
+    """
+    시험정보 본문 재정화 (ALLOWED_TAGS/ALLOWED_ATTRS 등 정책 변경 후 배포 시 실행)
+    python manage.py resanitize_exam_posts          # 이전 정책 버전 글만
+    python manage.py resanitize_exam_posts --all    # 전체
+    수정일(updated_at)은 바뀌지 않는다.
+    """
+
+    help = "정화 정책 버전이 다른 시험정보 글의 content_html/excerpt 를 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--all", action="store_true", help="버전과 무관하게 전체 재정화")
+        parser.add_argument("--batch-size", type=int, default=200)
+
+    def handle(self, *args, **options):
+        qs = ExamPost.objects.only("pk", "content")
+        if not options["all"]:
+            qs = qs.exclude(sanitizer_version=SANITIZER_VERSION)
+        size = max(options["batch_size"], 1)
+
+        done, batch = 0, []
+        for post in qs.order_by("pk").iterator(chunk_size=size):
+            post.sanitize()
+            batch.append(post)
+            if len(batch) >= size:
+                done += self._flush(batch)
+                batch = []
+        if batch:
+            done += self._flush(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"재정화 완료: {done}건 (정책 버전 {SANITIZER_VERSION})")
+        )
+
+    def _flush(self, batch):
+        ExamPost.objects.bulk_update(batch, ExamPost.SANITIZED_FIELDS)
+        return len(batch)
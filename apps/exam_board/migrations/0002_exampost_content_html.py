@@ -0,0 +1,41 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:00
+
+from django.db import migrations, models
+
+from apps.exam_board.sanitizer import SANITIZER_VERSION, sanitize_html
+
+
+def sanitize_existing(apps, schema_editor):
+    """기존 글 본문을 정화해 content_html 채우기 (updated_at 은 건드리지 않음)"""
+    ExamPost = apps.get_model("exam_board", "ExamPost")
+    batch = []
+    for post in ExamPost.objects.only("pk", "content").iterator(chunk_size=200):
+        post.content_html = sanitize_html(post.content)
+        post.sanitizer_version = SANITIZER_VERSION
+        batch.append(post)
+        if len(batch) >= 200:
+            ExamPost.objects.bulk_update(batch, ["content_html", "sanitizer_version"])
+            batch = []
+    if batch:
+        ExamPost.objects.bulk_update(batch, ["content_html", "sanitizer_version"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam_board', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exampost',
+            name='content_html',
+            field=models.TextField(blank=True, editable=False, verbose_name='정화된 본문(HTML)'),
+        ),
+        migrations.AddField(
+            model_name='exampost',
+            name='sanitizer_version',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=16, verbose_name='정화 정책 버전'),
+        ),
+        migrations.RunPython(sanitize_existing, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:02
+
+from django.db import migrations, models
+
+from apps.exam_board.sanitizer import make_excerpt
+
+
+def fill_excerpts(apps, schema_editor):
+    ExamPost = apps.get_model("exam_board", "ExamPost")
+    batch = []
+    for post in ExamPost.objects.only("pk", "content_html").iterator(chunk_size=200):
+        post.excerpt = make_excerpt(post.content_html)
+        batch.append(post)
+        if len(batch) >= 200:
+            ExamPost.objects.bulk_update(batch, ["excerpt"])
+            batch = []
+    if batch:
+        ExamPost.objects.bulk_update(batch, ["excerpt"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('exam_board', '0002_exampost_content_html'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='exampost',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=150, verbose_name='요약'),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
@@ -1,11 +1,15 @@
 # apps/exam_board/models.py
 from django.conf import settings
 from django.db import models
+from django.db.models import Count, Exists, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
 from django.utils.translation import gettext_lazy as _
 import mimetypes
 
+from .sanitizer import EXCERPT_LENGTH, SANITIZER_VERSION, make_excerpt, sanitize_html
+
 # (운영 기준) 허용 확장자: 이미지 + 일반 문서 + 한글(HWP/HWPX) + 압축
 ALLOWED_EXTS = [
     # 이미지
@@ -46,10 +50,50 @@ def exam_upload_to(instance, filename):
     return f"exam_board/{post_id}/{filename}"
 
 
+class ExamPostQuerySet(models.QuerySet):
+    # 게시판 목록에 필요한 컬럼 (본문/정화본은 읽지 않음)
+    LIST_FIELDS = (
+        "title",
+        "excerpt",
+        "author__name",
+        "is_pinned",
+        "status",
+        "view_count",
+        "published_at",
+        "created_at",
+        "updated_at",
+    )
+
+    def for_list(self):
+        """
+        목록용: 필요한 컬럼만 + 첨부 수/이미지 여부를 상관 서브쿼리로 annotate
+        (첨부 prefetch 없이 1쿼리, GROUP BY 없음)
+        """
+        attachments = Attachment.objects.filter(post=OuterRef("pk"))
+        return (
+            self.select_related("author")
+            .only(*self.LIST_FIELDS)
+            .annotate(
+                attachment_count=Coalesce(
+                    Subquery(
+                        attachments.order_by()
+                        .values("post")
+                        .annotate(n=Count("pk"))
+                        .values("n")
+                    ),
+                    0,
+                ),
+                has_image=Exists(attachments.filter(kind=Attachment.Kind.IMAGE)),
+            )
+        )
+
+
 class ExamPost(models.Model):
     """
     시험정보 게시글.
     - content: CKEditor 등 리치텍스트 에디터의 HTML을 그대로 저장
+    - content_html: 저장 시 정화한 결과 (조회 API 는 이 컬럼만 읽음)
+    - excerpt: 목록용 평문 요약 (목록은 본문 컬럼을 읽지 않음)
     """
 
     class Status(models.TextChoices):
@@ -58,6 +102,13 @@ class ExamPost(models.Model):
 
     title = models.CharField("제목", max_length=200)
     content = models.TextField("본문(HTML)")  # 리치 텍스트 결과물(HTML) 저장
+    content_html = models.TextField("정화된 본문(HTML)", blank=True, editable=False)
+    excerpt = models.CharField(
+        "요약", max_length=EXCERPT_LENGTH, blank=True, editable=False
+    )
+    sanitizer_version = models.CharField(
+        "정화 정책 버전", max_length=16, blank=True, editable=False, db_index=True
+    )
     author = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         verbose_name="작성자",
@@ -76,6 +127,8 @@ class ExamPost(models.Model):
     created_at = models.DateTimeField("작성일", auto_now_add=True)
     updated_at = models.DateTimeField("수정일", auto_now=True)
 
+    objects = ExamPostQuerySet.as_manager()
+
     class Meta:
         verbose_name = "시험정보 게시글"
         verbose_name_plural = "시험정보 게시글"
@@ -89,6 +142,23 @@ class ExamPost(models.Model):
     def __str__(self):
         return f"[#{self.pk}] {self.title}"
 
+    def save(self, *args, **kwargs):
+        # 본문이 저장될 때만 정화 (update_fields 로 다른 컬럼만 저장하면 생략)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None or "content" in update_fields:
+            self.sanitize()
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, *self.SANITIZED_FIELDS}
+        super().save(*args, **kwargs)
+
+    # 본문에서 파생되는 컬럼 (재정화 시 함께 갱신)
+    SANITIZED_FIELDS = ("content_html", "excerpt", "sanitizer_version")
+
+    def sanitize(self):
+        self.content_html = sanitize_html(self.content)
+        self.excerpt = make_excerpt(self.content_html)
+        self.sanitizer_version = SANITIZER_VERSION
+
 
 class Attachment(models.Model):
     """
@@ -0,0 +1,127 @@
+# apps/exam_board/sanitizer.py
+"""
+시험정보 본문(CKEditor HTML) 정화 정책.
+- 게시글 저장 시 sanitize_html 결과를 ExamPost.content_html 에 저장 → 조회는 컬럼만 읽음
+- SANITIZER_VERSION 은 정책(태그/속성/CSS/링크 규칙) 해시라 목록을 고치면 자동으로 바뀜
+  → python manage.py resanitize_exam_posts 로 이전 버전 글만 다시 정화
+- 목록용 평문 요약(excerpt)도 같은 시점에 만든다
+"""
+import hashlib
+import html
+import re
+
+import bleach
+from bleach.sanitizer import Cleaner
+from bleach.css_sanitizer import CSSSanitizer
+
+# CKEditor 등 리치텍스트에서 사용하는 대표 태그/속성 화이트리스트
+ALLOWED_TAGS = [
+    "p",
+    "br",
+    "div",
+    "span",
+    "strong",
+    "em",
+    "u",
+    "s",
+    "code",
+    "pre",
+    "blockquote",
+    "hr",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "ul",
+    "ol",
+    "li",
+    "table",
+    "thead",
+    "tbody",
+    "tr",
+    "th",
+    "td",
+    "a",
+    "img",
+    "figure",
+    "figcaption",
+]
+ALLOWED_ATTRS = {
+    "*": ["class", "style"],
+    "a": ["href", "title", "target", "rel"],
+    "img": ["src", "alt", "title", "width", "height"],
+    "table": ["border", "cellpadding", "cellspacing"],
+    "th": ["colspan", "rowspan"],
+    "td": ["colspan", "rowspan"],
+}
+css_sanitizer = CSSSanitizer(
+    allowed_css_properties=[
+        "color",
+        "background-color",
+        "font-size",
+        "font-weight",
+        "font-style",
+        "text-decoration",
+        "text-align",
+        "font-family",
+        "line-height",
+        "letter-spacing",
+        "margin",
+        "padding",
+        "border",
+        "border-color",
+        "border-width",
+        "border-style",
+        "width",
+        "height",
+        "max-width",
+    ]
+)
+cleaner = Cleaner(
+    tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRS, css_sanitizer=css_sanitizer, strip=True
+)
+
+
+def _link_target_blank(attrs, new=False):
+    if not new:
+        return attrs
+    # bleach 콜백의 속성 키는 (namespace, name) 튜플
+    attrs[(None, "target")] = "_blank"
+    attrs[(None, "rel")] = "noopener noreferrer nofollow"
+    return attrs
+
+
+# 링크 처리 등 목록 밖의 규칙을 바꿨다면 올려서 재정화 대상으로 만든다
+POLICY_REVISION = 1
+
+SANITIZER_VERSION = hashlib.sha1(
+    repr(
+        (
+            POLICY_REVISION,
+            ALLOWED_TAGS,
+            sorted(ALLOWED_ATTRS.items()),
+            sorted(css_sanitizer.allowed_css_properties),
+        )
+    ).encode("utf-8")
+).hexdigest()[:12]
+
+
+def sanitize_html(raw_html):
+    """에디터 HTML → 화이트리스트 정화 + URL 자동 링크(새 창)"""
+    safe = cleaner.clean(raw_html or "")
+    return bleach.linkify(safe, callbacks=[_link_target_blank])
+
+
+EXCERPT_LENGTH = 150
+_TAG_RE = re.compile(r"<[^>]*>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def make_excerpt(safe_html, length=EXCERPT_LENGTH):
+    """정화된 HTML → 태그/연속 공백을 걷어낸 평문 앞부분 (넘치면 … 로 자름)"""
+    text = _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", safe_html or ""))).strip()
+    if len(text) <= length:
+        return text
+    return text[: length - 1].rstrip() + "…"
@@ -1,89 +1,9 @@
 # apps/exam_board/serializers.py
 from rest_framework import serializers
 from django.utils import timezone
+from apps.search.serializers import SearchResultMixin
 from .models import ExamPost, Attachment
 
-import bleach
-from bleach.sanitizer import Cleaner
-from bleach.css_sanitizer import CSSSanitizer
-
-# CKEditor 등 리치텍스트에서 사용하는 대표 태그/속성 화이트리스트
-ALLOWED_TAGS = [
-    "p",
-    "br",
-    "div",
-    "span",
-    "strong",
-    "em",
-    "u",
-    "s",
-    "code",
-    "pre",
-    "blockquote",
-    "hr",
-    "h1",
-    "h2",
-    "h3",
-    "h4",
-    "h5",
-    "h6",
-    "ul",
-    "ol",
-    "li",
-    "table",
-    "thead",
-    "tbody",
-    "tr",
-    "th",
-    "td",
-    "a",
-    "img",
-    "figure",
-    "figcaption",
-]
-ALLOWED_ATTRS = {
-    "*": ["class", "style"],
-    "a": ["href", "title", "target", "rel"],
-    "img": ["src", "alt", "title", "width", "height"],
-    "table": ["border", "cellpadding", "cellspacing"],
-    "th": ["colspan", "rowspan"],
-    "td": ["colspan", "rowspan"],
-}
-css_sanitizer = CSSSanitizer(
-    allowed_css_properties=[
-        "color",
-        "background-color",
-        "font-size",
-        "font-weight",
-        "font-style",
-        "text-decoration",
-        "text-align",
-        "font-family",
-        "line-height",
-        "letter-spacing",
-        "margin",
-        "padding",
-        "border",
-        "border-color",
-        "border-width",
-        "border-style",
-        "width",
-        "height",
-        "max-width",
-    ]
-)
-cleaner = Cleaner(
-    tags=ALLOWED_TAGS, attributes=ALLOWED_ATTRS, css_sanitizer=css_sanitizer, strip=True
-)
-
-
-def _link_target_blank(attrs, new=False):
-    if not new:
-        return attrs
-    attrs["target"] = "_blank"
-    attrs["rel"] = "noopener noreferrer nofollow"
-    return attrs
-
 
 class AttachmentSerializer(serializers.ModelSerializer):
     url = serializers.SerializerMethodField()
@@ -109,10 +29,44 @@ class AttachmentSerializer(serializers.ModelSerializer):
             return None
 
 
+class ExamPostListSerializer(SearchResultMixin, serializers.ModelSerializer):
+    """
+    게시판 목록용 (본문/정화본/첨부 목록 없음).
+    ExamPost.objects.for_list() 의 annotate 값(attachment_count/has_image)을 읽는다.
+    ?search= 결과면 search_rank/search_snippet 도 포함 (SearchResultMixin).
+    """
+
+    author_name = serializers.CharField(source="author.name", read_only=True)
+    attachment_count = serializers.IntegerField(read_only=True)
+    has_image = serializers.BooleanField(read_only=True)
+
+    class Meta:
+        model = ExamPost
+        fields = (
+            "id",
+            "title",
+            "excerpt",
+            "author_name",
+            "is_pinned",
+            "status",
+            "view_count",
+            "published_at",
+            "created_at",
+            "updated_at",
+            "attachment_count",
+            "has_image",
+        )
+
+
 class ExamPostReadSerializer(serializers.ModelSerializer):
-    author_name = serializers.CharField(source="author.username", read_only=True)
+    """
+    상세용. fields=[...] 를 넘기면 해당 필드만 직렬화 (?fields= 부분 응답)
+    """
+
+    author_name = serializers.CharField(source="author.name", read_only=True)
     attachments = AttachmentSerializer(many=True, read_only=True)
-    content_html = serializers.SerializerMethodField()
+    # 저장 시 정화해 둔 컬럼 (sanitizer.py, resanitize_exam_posts 커맨드 참고)
+    content_html = serializers.CharField(read_only=True)
 
     class Meta:
         model = ExamPost
@@ -131,11 +85,11 @@ class ExamPostReadSerializer(serializers.ModelSerializer):
             "attachments",
         )
 
-    def get_content_html(self, obj):
-        raw_html = obj.content or ""
-        safe = cleaner.clean(raw_html)
-        safe = bleach.linkify(safe, callbacks=[_link_target_blank])
-        return safe
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
 
 
 class ExamPostWriteSerializer(serializers.ModelSerializer):
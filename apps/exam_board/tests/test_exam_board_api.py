@@ -2,9 +2,13 @@
 import shutil
 import tempfile
 from datetime import timedelta
+from io import StringIO
 from typing import cast
+from unittest import mock
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
 from django.test import override_settings
 from django.utils import timezone
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -14,6 +18,8 @@ from rest_framework.test import APITestCase, APIClient
 from rest_framework.response import Response as DRFResponse
 
 from apps.exam_board.models import ExamPost, Attachment
+from apps.exam_board.sanitizer import SANITIZER_VERSION, sanitize_html
+from utils.view_counts import flush as flush_view_counts
 
 User = get_user_model()
 
@@ -36,6 +42,7 @@ class BaseExamBoardTest(APITestCase):
     def setUp(self):
         super().setUp()
         self.client = APIClient()
+        cache.clear()  # 조회수 버퍼 카운터
 
         # 임시 미디어 디렉터리
         self.tmp_media = tempfile.mkdtemp(prefix="test_media_")
@@ -225,9 +232,13 @@ class ExamBoardAPITests(BaseExamBoardTest):
 
         r1 = self.req_get(f"{self.list_url}{pub.pk}/")
         self.assertEqual(r1.status_code, 200)
+        self.assertEqual(self.j(r1)["view_count"], 1)  # DB 값 + 캐시에 쌓인 증가분
+        flush_view_counts(drain=True)
         pub.refresh_from_db()
         self.assertEqual(pub.view_count, 1)
-        self.req_get(f"{self.list_url}{pub.pk}/")
+        r1b = self.req_get(f"{self.list_url}{pub.pk}/")
+        self.assertEqual(self.j(r1b)["view_count"], 2)
+        flush_view_counts(drain=True)
         pub.refresh_from_db()
         self.assertEqual(pub.view_count, 2)
 
@@ -357,6 +368,116 @@ class ExamBoardAPITests(BaseExamBoardTest):
         self.assertIn("link", html)
         self.assertNotIn("<script>", html)
 
+    def test_content_html_stored_at_write_time(self):
+        self.as_admin()
+        r = self.req_post(
+            self.list_url,
+            data={
+                "title": "t",
+                "content": "<p>a</p><script>x</script>",
+                "status": "PUBLISHED",
+            },
+            format="multipart",
+        )
+        self.assertEqual(r.status_code, 201)
+        post = self.latest_post()
+        self.assertEqual(post.content_html, "<p>a</p>x")
+        self.assertEqual(post.sanitizer_version, SANITIZER_VERSION)
+
+        # 조회는 저장된 컬럼만 읽음 (정화 호출 없음)
+        with mock.patch("apps.exam_board.models.sanitize_html") as sanitize:
+            self.req_get(self.list_url)
+            detail = self.req_get(f"{self.list_url}{post.pk}/")
+        sanitize.assert_not_called()
+        self.assertEqual(self.j(detail)["content_html"], "<p>a</p>x")
+
+        r = self.req_patch(
+            f"{self.list_url}{post.pk}/",
+            data={"content": "<p>b https://example.com</p>"},
+            format="multipart",
+        )
+        self.assertEqual(r.status_code, 200)
+        post.refresh_from_db()
+        self.assertIn('href="https://example.com"', post.content_html)
+        self.assertIn('target="_blank"', post.content_html)
+
+    def test_resanitize_command_only_touches_stale_versions(self):
+        current = ExamPost.objects.create(
+            title="현재", content="<p>ok</p>", author=self.admin
+        )
+        stale = ExamPost.objects.create(
+            title="이전", content="<p>ok</p><iframe></iframe>", author=self.admin
+        )
+        ExamPost.objects.filter(pk=stale.pk).update(
+            content_html="<iframe></iframe>", sanitizer_version="old"
+        )
+        stale.refresh_from_db()
+
+        out = StringIO()
+        with mock.patch(
+            "apps.exam_board.models.sanitize_html", wraps=sanitize_html
+        ) as sanitize:
+            call_command("resanitize_exam_posts", stdout=out)
+        self.assertEqual(sanitize.call_count, 1)
+        self.assertIn("재정화 완료: 1건", out.getvalue())
+
+        refreshed = ExamPost.objects.get(pk=stale.pk)
+        self.assertEqual(refreshed.content_html, "<p>ok</p>")
+        self.assertEqual(refreshed.sanitizer_version, SANITIZER_VERSION)
+        self.assertEqual(refreshed.updated_at, stale.updated_at)
+        self.assertEqual(ExamPost.objects.get(pk=current.pk).content_html, "<p>ok</p>")
+
+    # ───────── 목록 경량 응답 / 부분 응답 ─────────
+
+    def test_list_rows_are_light_with_attachment_summary(self):
+        post = ExamPost.objects.create(
+            title="공지",
+            content="<p>1회  필기 &amp; 실기</p>" + "<p>긴 본문</p>" * 100,
+            author=self.admin,
+            status=ExamPost.Status.PUBLISHED,
+            published_at=timezone.now(),
+        )
+        Attachment.objects.create(post=post, file=uf("a.pdf"))
+        Attachment.objects.create(post=post, file=uf("b.png", b"img", "image/png"))
+        ExamPost.objects.create(
+            title="첨부 없음",
+            content="<p>x</p>",
+            author=self.admin,
+            status=ExamPost.Status.PUBLISHED,
+            published_at=timezone.now(),
+        )
+
+        with self.assertNumQueries(2):  # COUNT + 페이지 (첨부 prefetch 없음)
+            res = self.req_get(self.list_url + "?ordering=created_at")
+        first, second = res.json()["results"]
+        self.assertNotIn("content", first)
+        self.assertNotIn("content_html", first)
+        self.assertNotIn("attachments", first)
+        self.assertTrue(first["excerpt"].startswith("1회 필기 & 실기 긴 본문"))
+        self.assertLessEqual(len(first["excerpt"]), 150)
+        self.assertEqual(
+            (first["author_name"], first["attachment_count"], first["has_image"]),
+            ("관리자", 2, True),
+        )
+        self.assertEqual((second["attachment_count"], second["has_image"]), (0, False))
+
+    def test_detail_fields_selects_subset(self):
+        post = ExamPost.objects.create(
+            title="공지",
+            content="<p>본문</p>",
+            author=self.admin,
+            status=ExamPost.Status.PUBLISHED,
+            published_at=timezone.now(),
+        )
+        url = f"{self.list_url}{post.pk}/"
+        # 글 1건 (조회수는 캐시에 누적, 첨부 prefetch 없음)
+        with self.assertNumQueries(1):
+            res = self.req_get(url + "?fields=id,title,view_count")
+        self.assertEqual(res.json(), {"id": post.pk, "title": "공지", "view_count": 1})
+
+        res = self.req_get(url + "?fields=title,body")
+        self.assertEqual(res.status_code, 400)
+
     # ───────── CKEditor 인라인 이미지 업로드 ─────────
 
     def test_richtext_image_upload_admin_only(self):
@@ -0,0 +1,68 @@
+# apps/exam_board/tests/test_view_counts.py
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.exam_board.models import ExamPost
+from apps.news.models import News
+from utils.view_counts import flush
+
+User = get_user_model()
+
+
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=0)
+class ExamPostViewCountTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        admin = User.objects.create_user(
+            email="admin@example.com", password="pass1234", is_staff=True, name="관리자"
+        )
+        self.posts = [
+            ExamPost.objects.create(
+                title=f"시험 {n}",
+                content="내용",
+                author=admin,
+                status=ExamPost.Status.PUBLISHED,
+                published_at=timezone.now(),
+            )
+            for n in range(2)
+        ]
+        self.news = News.objects.create(title="공지", content="본문")
+
+    def view(self, url, field):
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, 200)
+        return res.json()[field]
+
+    def test_flush_applies_one_update_per_model(self):
+        first, second = self.posts
+        for _ in range(3):
+            self.view(f"/api/exam-board/exam-posts/{first.pk}/", "view_count")
+        self.view(f"/api/exam-board/exam-posts/{second.pk}/", "view_count")
+        for _ in range(2):
+            self.view(f"/api/news/{self.news.pk}/", "views")
+
+        with CaptureQueriesContext(connection) as ctx:
+            result = flush(drain=True)
+        updates = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith("UPDATE")]
+        # 모델마다 1번 + 반영 세대 기록 1번
+        self.assertEqual(len(updates), 3)
+        self.assertIn("utils_viewcountflush", updates[-1])
+        self.assertEqual(
+            result, {("exam_board.ExamPost", "view_count"): 2, ("news.News", "views"): 1}
+        )
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.news.refresh_from_db()
+        self.assertEqual((first.view_count, second.view_count, self.news.views), (3, 1, 2))
+        # 반영 후에는 DB 값에서 이어서 증가 (이중 반영 없음)
+        self.assertEqual(
+            self.view(f"/api/exam-board/exam-posts/{first.pk}/", "view_count"), 4
+        )
+        self.assertEqual(flush(drain=True), {("exam_board.ExamPost", "view_count"): 1})
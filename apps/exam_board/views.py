@@ -1,8 +1,8 @@
 # apps/exam_board/views.py
-from django.db.models import F
 from rest_framework import generics, status
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import OrderingFilter
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -13,25 +13,30 @@ import os
 
 from .models import ExamPost, Attachment
 from .serializers import (
+    ExamPostListSerializer,
     ExamPostReadSerializer,
     ExamPostWriteSerializer,
     AttachmentSerializer,
 )
+from apps.search.filters import FullTextSearchFilter
 from utils.permissions import IsAdminOrReadOnly
 from utils.pagination import CustomPageNumberPagination
+from utils.view_counts import record_view
 
 
 class ExamPostListCreateView(generics.ListCreateAPIView):
     permission_classes = [IsAdminOrReadOnly]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
-    filter_backends = [SearchFilter, OrderingFilter]
-    search_fields = ["title", "content"]
+    # ?search= 는 검색 문서 색인 (관련도 순, search_rank/search_snippet 포함)
+    filter_backends = [OrderingFilter, FullTextSearchFilter]
+    search_source = "exam_post"
     ordering_fields = ["created_at", "view_count", "is_pinned", "published_at"]
     ordering = ["-is_pinned", "-created_at"]
     pagination_class = CustomPageNumberPagination
 
     def get_queryset(self):
-        qs = ExamPost.objects.select_related("author").prefetch_related("attachments")
+        # 목록은 본문/첨부 없이 요약 + 첨부 수/이미지 여부만 (ExamPostListSerializer)
+        qs = ExamPost.objects.for_list()
 
         # 핀 고정 필터 (?is_pinned=true/false)
         is_pinned = (self.request.GET.get("is_pinned") or "").lower()
@@ -52,16 +57,40 @@ class ExamPostListCreateView(generics.ListCreateAPIView):
         return (
             ExamPostWriteSerializer
             if self.request.method == "POST"
-            else ExamPostReadSerializer
+            else ExamPostListSerializer
         )
 
 
 class ExamPostDetailView(generics.RetrieveUpdateDestroyAPIView):
+    """
+    GET ?fields=id,title,content_html → 요청 필드만 응답
+    (본문/정화본/첨부를 빼면 해당 컬럼 조회와 첨부 prefetch 도 생략)
+    """
+
     permission_classes = [IsAdminOrReadOnly]
     parser_classes = [MultiPartParser, FormParser, JSONParser]
 
+    def requested_fields(self):
+        raw = self.request.query_params.get("fields")
+        if not raw or self.request.method != "GET":
+            return None
+        fields = [f.strip() for f in raw.split(",") if f.strip()]
+        unknown = set(fields) - set(ExamPostReadSerializer.Meta.fields)
+        if unknown:
+            raise ValidationError(
+                {"detail": f"알 수 없는 필드: {', '.join(sorted(unknown))}"}
+            )
+        return fields
+
     def get_queryset(self):
-        qs = ExamPost.objects.select_related("author").prefetch_related("attachments")
+        fields = self.requested_fields()
+        qs = ExamPost.objects.select_related("author")
+        if fields is None or "attachments" in fields:
+            qs = qs.prefetch_related("attachments")
+        if fields is not None:
+            deferred = [f for f in ("content", "content_html") if f not in fields]
+            if deferred:
+                qs = qs.defer(*deferred)
         if not (self.request.user and self.request.user.is_staff):
             return qs.filter(status=ExamPost.Status.PUBLISHED)
         return qs
@@ -74,13 +103,10 @@ class ExamPostDetailView(generics.RetrieveUpdateDestroyAPIView):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        # 발행 글만 조회수 증가
+        # 발행 글만 조회수 증가 (캐시에 누적 → 주기적으로 일괄 반영, 응답은 DB 값 + 미반영분)
         if instance.status == ExamPost.Status.PUBLISHED:
-            ExamPost.objects.filter(pk=instance.pk).update(
-                view_count=F("view_count") + 1
-            )
-            instance.view_count += 1  # 즉시 반영용
-        serializer = ExamPostReadSerializer(instance)
+            record_view(instance, "view_count")
+        serializer = ExamPostReadSerializer(instance, fields=self.requested_fields())
         return Response(serializer.data)
 
 
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.3 on 2026-10-18 10:00
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import F
+
+
+def copy_uploaded_at(apps, schema_editor):
+    # 기존 이미지는 업로드 시각을 수정 시각으로
+    GalleryImage = apps.get_model("gallery", "GalleryImage")
+    GalleryImage.objects.update(updated_at=F("uploaded_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("gallery", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="galleryimage",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True,
+                default=django.utils.timezone.now,
+                verbose_name="수정일시",
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_uploaded_at, migrations.RunPython.noop),
+    ]
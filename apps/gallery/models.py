@@ -12,6 +12,7 @@ class GalleryImage(models.Model):
                 )
     views       = models.PositiveIntegerField('조회수', default=0)
     uploaded_at = models.DateTimeField('업로드일시', auto_now_add=True)
+    updated_at  = models.DateTimeField('수정일시', auto_now=True)
 
     class Meta:
         ordering = ['-uploaded_at']
@@ -0,0 +1,21 @@
+# apps/gallery/tests/test_conditional_get.py
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from apps.gallery.models import GalleryImage
+from utils.testing import ConditionalGetAssertions
+
+
+class GalleryConditionalGetTests(ConditionalGetAssertions, APITestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_etag_changes_on_edit(self):
+        image = GalleryImage.objects.create(title="사진", image="gallery/a.jpg")
+
+        def edit():
+            image.title = "사진 (수정)"
+            image.save()
+
+        self.assert_304_until_changed("/api/gallery/", edit)
@@ -0,0 +1,33 @@
+# apps/gallery/tests/test_view_counts.py
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from apps.gallery.models import GalleryImage
+from utils.view_counts import flush
+
+
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=0)
+class GalleryViewCountTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.image = GalleryImage.objects.create(title="사진", image="gallery/a.jpg")
+        self.url = f"/api/gallery/{self.image.pk}/"
+
+    def views(self):
+        res = self.client.get(self.url)
+        self.assertEqual(res.status_code, 200)
+        return res.json()["views"]
+
+    def test_detail_buffers_views_until_flush(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.views(), 1)
+        self.assertEqual(self.views(), 2)
+        self.image.refresh_from_db()
+        self.assertEqual(self.image.views, 0)
+
+        self.assertEqual(flush(drain=True), {("gallery.GalleryImage", "views"): 1})
+        self.image.refresh_from_db()
+        self.assertEqual(self.image.views, 2)
+        self.assertEqual(self.views(), 3)
@@ -1,16 +1,17 @@
-from django.db.models import F
 from rest_framework import generics, filters
 from rest_framework.parsers import JSONParser, MultiPartParser, FormParser
 from rest_framework.response import Response
+from utils.conditional import ConditionalListMixin
 from utils.permissions import IsAdminOrReadOnly
 from utils.pagination import CustomPageNumberPagination
+from utils.view_counts import record_view
 from .models import GalleryImage
 from .serializers import GalleryImageSerializer
 
 
-class GalleryListCreateView(generics.ListCreateAPIView):
+class GalleryListCreateView(ConditionalListMixin, generics.ListCreateAPIView):
     """
-    GET  /api/gallery/        → 리스트 (검색/정렬/페이지네이션)
+    GET  /api/gallery/        → 리스트 (검색/정렬/페이지네이션, ETag/304 지원)
     POST /api/gallery/        → 관리자만 이미지 업로드
     """
 
@@ -24,6 +25,9 @@ class GalleryListCreateView(generics.ListCreateAPIView):
     ordering_fields = ["uploaded_at", "views"]
     ordering = ["-uploaded_at"]
 
+    # 조회수는 updated_at 을 바꾸지 않으므로 합계도 지문에 포함
+    etag_sum_fields = ("views",)
+
 
 class GalleryRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     """
@@ -45,8 +49,7 @@ class GalleryRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        # 조회수 atomic 증가
-        GalleryImage.objects.filter(pk=instance.pk).update(views=F("views") + 1)
-        instance.refresh_from_db(fields=["views"])
+        # 조회수 +1 (캐시에 누적 → 주기적으로 일괄 반영, 응답은 DB 값 + 미반영분)
+        record_view(instance, "views")
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
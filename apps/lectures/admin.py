@@ -1,5 +1,12 @@
 from django.contrib import admin
-from .models import Lecture
+from .models import (
+    HRDCourse,
+    Lecture,
+    LectureIndex,
+    SeatReservation,
+    Tag,
+    UpstreamSnapshot,
+)
 
 
 @admin.register(Lecture)
@@ -20,3 +27,60 @@ class LectureAdmin(admin.ModelAdmin):
     date_hierarchy = "created_at"
     ordering = ("-created_at",)
     readonly_fields = ("created_at",)
+    exclude = ("tag_set",)  # tags 문자열에서 자동 동기화
+
+
+@admin.register(HRDCourse)
+class HRDCourseAdmin(admin.ModelAdmin):
+    list_display = (
+        "trpr_id",
+        "degree",
+        "title",
+        "organ_name",
+        "start_date",
+        "end_date",
+        "capacity",
+        "applied",
+        "synced_at",
+    )
+    search_fields = ("trpr_id", "title", "organ_name")
+    list_filter = ("organ_name", "start_date")
+    readonly_fields = ("synced_at",)
+
+
+@admin.register(UpstreamSnapshot)
+class UpstreamSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("key", "updated_at")
+    search_fields = ("key",)
+    readonly_fields = ("updated_at",)
+
+
+@admin.register(LectureIndex)
+class LectureIndexAdmin(admin.ModelAdmin):
+    list_display = (
+        "source",
+        "source_key",
+        "title",
+        "start_date",
+        "end_date",
+        "remaining",
+        "updated_at",
+    )
+    search_fields = ("source_key", "title", "tags")
+    list_filter = ("source", "start_date")
+    readonly_fields = ("updated_at",)
+    exclude = ("tag_set",)  # 색인 갱신 때 tags 문자열에서 자동으로 채움
+
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ("name",)
+    search_fields = ("name",)
+
+
+@admin.register(SeatReservation)
+class SeatReservationAdmin(admin.ModelAdmin):
+    list_display = ("id", "lecture", "idempotency_key", "remaining", "created_at")
+    search_fields = ("idempotency_key",)
+    list_select_related = ("lecture",)
+    readonly_fields = ("created_at",)
@@ -1,6 +1,46 @@
+import os
+import sys
+
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class LecturesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.lectures'
+
+    def ready(self):
+        from . import signals  # noqa: F401  (Lecture 저장 → 강의 색인 갱신)
+
+        # 배포 직후 첫 방문자가 work24 호출을 기다리지 않도록 (WARM_CACHES_ON_STARTUP=True)
+        if getattr(settings, "WARM_CACHES_ON_STARTUP", False) and _is_server_process():
+            from .warmup import warm_in_background
+
+            warm_in_background()
+
+
+SERVER_PROGRAMS = {"gunicorn", "uvicorn", "daphne", "hypercorn"}
+
+
+def _is_server_process(argv=None, environ=None):
+    """
+    gunicorn/uvicorn/daphne/hypercorn 워커 또는 runserver 본 프로세스만 True.
+    그 외(migrate, shell, celery, pytest, 임의 스크립트 등)는 모두 False.
+    """
+    argv = sys.argv if argv is None else argv
+    environ = os.environ if environ is None else environ
+    if not argv:
+        return False
+
+    # python -m gunicorn → argv[0] 이 .../gunicorn/__main__.py
+    path = os.path.normpath(argv[0])
+    program = os.path.basename(path)
+    if program == "__main__.py":
+        program = os.path.basename(os.path.dirname(path))
+    if os.path.splitext(program)[0] in SERVER_PROGRAMS:
+        return True
+
+    if program == "manage.py" and len(argv) > 1 and argv[1] == "runserver":
+        # 자동 리로더 자식 프로세스(RUN_MAIN)에서만, --noreload 면 본 프로세스가 서버
+        return "RUN_MAIN" in environ or "--noreload" in argv
+    return False
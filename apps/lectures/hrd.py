@@ -0,0 +1,571 @@
+# apps/lectures/hrd.py
+"""
+고용24(work24) 310L01 목록 연동/정규화/동기화.
+- 뷰에서 매 요청마다 원격 호출하지 않도록, 목록을 DB(HRDCourse)에 적재해 둔다.
+"""
+import asyncio
+import logging
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from utils import timing, upstream, upstream_async
+
+from .hrd_xml import first_scn, iter_scn_list, parse_scn_list
+from .lecture_index import index_hrd_courses
+from .models import HRDCourse, UpstreamSnapshot
+
+logger = logging.getLogger(__name__)
+
+HRD_API_KEY = os.getenv("HRD_API_KEY")
+HRD_TORG_ID = os.getenv("HRD_TORG_ID")
+
+LIST_API_PATH = "/cm/openApi/call/hr/callOpenApiSvcInfo310L01.do"
+DETAIL_API_PATH = "/cm/openApi/call/hr/callOpenApiSvcInfo310L03.do"
+LIST_API_URL = settings.WORK24_BASE_URL + LIST_API_PATH
+DETAIL_API_URL = settings.WORK24_BASE_URL + DETAIL_API_PATH
+REGISTRATION_URL = "https://www.work24.go.kr/hr/a/a/3100/selectTracseDetl.do"
+LIST_PAGE_SIZE = 100
+LIST_MAX_PAGES = 50  # 안전장치(100건 x 50페이지)
+LOOKUP_MAX_PAGES = 10  # 기관ID 역조회 시 최대 탐색 페이지
+LOOKUP_WORKERS = 4  # 역조회 동시 호출 수
+
+# 상세 캐시 TTL(초): 신청 인원(totTrpCnt)은 하루 몇 번 바뀌는 수준이라 10분이면 충분
+DETAIL_TTL = 60 * 10
+DETAIL_NOT_FOUND_TTL = 60 * 2  # 없는 과정/빈 응답
+DETAIL_ERROR_TTL = 30  # 원격 장애 (짧게 막아서 폭주만 방지)
+# 원격 오류 메시지에는 authKey 가 든 요청 URL 이 섞이므로 응답/캐시에는 고정 문구만
+DETAIL_ERROR_MESSAGE = "상세 정보를 불러오지 못했습니다. 잠시 후 다시 시도해 주세요."
+TORG_TTL = 60 * 60 * 24  # 동기화 대상이 아닌 과정의 역조회 결과 (기관ID는 거의 바뀌지 않음)
+
+# 기관ID는 응답마다 키 이름이 달라서 순서대로 시도
+TORG_ID_KEYS = (
+    "trainstCstmrId",
+    "trainstCstmrID",
+    "torgId",
+    "TorgId",
+    "torgID",
+    "insttOrgNo",
+    "trainstId",
+)
+
+
+def default_organizations():
+    return list(getattr(settings, "HRD_ORGANIZATIONS", None) or ["다모아요리학원"])
+
+
+def is_known_organization(organ):
+    """목록 조회 허용 기관 = 동기화 대상 (settings.HRD_ORGANIZATIONS)"""
+    return organ in default_organizations()
+
+
+def search_window(today=None):
+    """조회 기간(올해 1/1 ~ +2년 12/31)"""
+    today = today or timezone.localdate()
+    return date(today.year, 1, 1), date(today.year + 2, 12, 31)
+
+
+def dataset_cache_key(organ, window_start, window_end):
+    """목록 뷰가 쓰는 기관/기간 단위 데이터셋 캐시 키"""
+    return f"hrd:dataset:{organ}:{window_start:%Y%m%d}-{window_end:%Y%m%d}"
+
+
+def extract_torg_id(item):
+    for key in TORG_ID_KEYS:
+        if item.get(key):
+            return str(item.get(key))
+    return None
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except (TypeError, ValueError):
+        return None
+
+
+def normalize_course(item, organ_name=""):
+    """
+    310L01 scn_list 한 건 → HRDCourse 필드 dict.
+    날짜가 없거나 깨진 항목은 None (목록 뷰와 동일한 기준)
+    """
+    start = _parse_date(item.get("traStartDate"))
+    end = _parse_date(item.get("traEndDate"))
+    if not start or not end or not item.get("trprId"):
+        return None
+
+    return {
+        "trpr_id": str(item.get("trprId")),
+        "degree": str(item.get("trprDegr") or ""),
+        "torg_id": extract_torg_id(item) or HRD_TORG_ID,
+        "organ_name": organ_name,
+        "title": item.get("title") or "",
+        "train_target_cd": item.get("trainTargetCd"),
+        "start_date": start,
+        "end_date": end,
+        "address": item.get("address"),
+        "contents": item.get("contents"),
+        "tel_no": item.get("telNo"),
+        "satisfaction": item.get("stdgScor"),
+        "capacity": int(item.get("yardMan") or 0),
+        "applied": int(item.get("regCourseMan") or 0),
+    }
+
+
+def fetch_course_page(organ, start, end, page_num, page_size=LIST_PAGE_SIZE):
+    """310L01 한 페이지 호출 → scn_list(list[dict])"""
+    params = {
+        "authKey": HRD_API_KEY,
+        "returnType": "XML",
+        "outType": "2",
+        "pageNum": page_num,
+        "pageSize": page_size,
+        "srchTraStDt": start.strftime("%Y%m%d"),
+        "srchTraEndDt": end.strftime("%Y%m%d"),
+        "srchTraOrganNm": organ,
+        "sort": "ASC",
+        "sortCol": 2,
+    }
+    r = upstream.get(LIST_API_URL, params=params)
+    with timing.span("xml"):
+        return list(iter_scn_list(r.content))
+
+
+def trpr_params(trpr_id, page_num, page_size=LIST_PAGE_SIZE):
+    """날짜 필터 없이 trprId 로만 310L01 조회하는 파라미터 (과거/미래 회차 전부)"""
+    return {
+        "authKey": HRD_API_KEY,
+        "returnType": "XML",
+        "outType": "2",
+        "pageNum": page_num,
+        "pageSize": page_size,
+        "srchTrprId": trpr_id,
+    }
+
+
+def fetch_trpr_page(trpr_id, page_num, page_size=LIST_PAGE_SIZE):
+    """trprId 로 310L01 한 페이지 → (scn_list, 전체 건수 또는 None)"""
+    r = upstream.get(LIST_API_URL, params=trpr_params(trpr_id, page_num, page_size))
+    with timing.span("xml"):
+        return parse_scn_list(r.content)
+
+
+async def afetch_trpr_page(trpr_id, page_num, page_size=LIST_PAGE_SIZE):
+    """fetch_trpr_page 의 비동기 버전 (aiohttp 공용 세션)"""
+    content = await upstream_async.get(
+        LIST_API_URL, params=trpr_params(trpr_id, page_num, page_size)
+    )
+    with timing.span("xml"):
+        return parse_scn_list(content)
+
+
+def fetch_all_courses(organ, start, end):
+    """모든 페이지를 돌며 정규화된 과정 목록 반환"""
+    courses = []
+    for page_num in range(1, LIST_MAX_PAGES + 1):
+        items = fetch_course_page(organ, start, end, page_num)
+        for item in items:
+            row = normalize_course(item, organ_name=organ)
+            if row:
+                courses.append(row)
+        if len(items) < LIST_PAGE_SIZE:
+            break
+    return courses
+
+
+def upsert_courses(rows):
+    """(trpr_id, degree) 기준 일괄 upsert"""
+    if not rows:
+        return 0
+    # 같은 회차가 중복으로 내려오는 경우 마지막 값 사용
+    unique = {(r["trpr_id"], r["degree"]): r for r in rows}
+    objs = [HRDCourse(**r) for r in unique.values()]
+    update_fields = [
+        f for f in rows[0].keys() if f not in ("trpr_id", "degree")
+    ] + ["synced_at"]
+    HRDCourse.objects.bulk_create(
+        objs,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["trpr_id", "degree"],
+        update_fields=update_fields,
+    )
+    return len(objs)
+
+
+def sync_courses(organ, today=None):
+    """
+    기관 하나의 조회 기간 전체를 동기화.
+    - 전 페이지를 받은 뒤에만 DB 반영(중간 실패 시 기존 데이터 유지)
+    - 원격에서 사라진 회차는 삭제
+    - 강의 색인(LectureIndex)도 같은 트랜잭션에서 갱신 (삭제 회차는 CASCADE)
+    """
+    start, end = search_window(today)
+    rows = fetch_all_courses(organ, start, end)
+
+    with transaction.atomic():
+        count = upsert_courses(rows)
+        seen = {(r["trpr_id"], r["degree"]) for r in rows}
+        stale_ids = [
+            pk
+            for pk, trpr_id, degree in HRDCourse.objects.filter(
+                organ_name=organ, start_date__gte=start, start_date__lte=end
+            ).values_list("pk", "trpr_id", "degree")
+            if (trpr_id, degree) not in seen
+        ]
+        if stale_ids:
+            HRDCourse.objects.filter(pk__in=stale_ids).delete()
+        index_hrd_courses(
+            HRDCourse.objects.filter(
+                organ_name=organ, start_date__gte=start, start_date__lte=end
+            )
+        )
+
+    # 동기화 직후 요청부터 새 데이터가 보이도록
+    cache.delete(dataset_cache_key(organ, start, end))
+
+    logger.info(
+        "hrd_sync_done",
+        extra={"organ": organ, "upserted": count, "deleted": len(stale_ids)},
+    )
+    return count, len(stale_ids)
+
+
+def _match_torg_id(items, degree):
+    for it in items:
+        if str(it.get("trprDegr")) == str(degree):
+            cand = extract_torg_id(it)
+            if cand:
+                return cand
+    return None
+
+
+def _lookup_last_page(total):
+    # 1페이지 실패로 건수를 모르면 최대 페이지까지 탐색
+    if total is None:
+        return LOOKUP_MAX_PAGES
+    return min(LOOKUP_MAX_PAGES, math.ceil(total / LIST_PAGE_SIZE))
+
+
+def _scan_torg_id(trpr_id, degree):
+    """
+    310L01 을 trprId 로 훑어 기관ID 찾기.
+    1페이지로 전체 건수를 확인한 뒤 나머지 페이지는 동시에 요청하고,
+    일치 회차를 찾는 즉시 남은 요청은 취소한다.
+    → (기관ID 또는 None, 조회된 원본 행들)
+    """
+    try:
+        items, total = fetch_trpr_page(trpr_id, 1)
+    except Exception:
+        # 1페이지 실패 시 건수를 모르므로 최대 페이지까지 탐색
+        items, total = [], None
+
+    found = _match_torg_id(items, degree)
+    if found or (total is not None and not items):
+        return found, items
+
+    last_page = _lookup_last_page(total)
+    rows = list(items)
+    pool = ThreadPoolExecutor(max_workers=LOOKUP_WORKERS)
+    try:
+        futures = [
+            pool.submit(fetch_trpr_page, trpr_id, page)
+            for page in range(2, last_page + 1)
+        ]
+        for fut in as_completed(futures):
+            try:
+                page_items, _ = fut.result()
+            except Exception:
+                # 네트워크/파싱 에러 페이지는 건너뜀
+                continue
+            rows.extend(page_items)
+            found = _match_torg_id(page_items, degree)
+            if found:
+                break
+    finally:
+        # 대기 중인 페이지 요청 취소 (진행 중인 요청은 결과만 버림)
+        pool.shutdown(wait=False, cancel_futures=True)
+    return found, rows
+
+
+def _torg_cache_key(trpr_id, degree):
+    return f"hrd:torg:{trpr_id}:{degree}"
+
+
+def _remember_torg_ids(trpr_id, degree, torg_id, rows):
+    """
+    역조회 결과 반영.
+    - 동기화된 HRDCourse 행은 비어 있는 torg_id 만 채움 (행 추가는 sync_courses 만 →
+      기관별 정리/강의 색인과 어긋나는 행이 생기지 않음)
+    - 색인에 없는 과정(다른 기관 등)은 캐시에만 기억
+    """
+    degrees_by_torg = {}
+    for it in rows:
+        found = extract_torg_id(it)
+        if found and it.get("trprDegr"):
+            degrees_by_torg.setdefault(found, set()).add(str(it.get("trprDegr")))
+    for found, degrees in degrees_by_torg.items():
+        HRDCourse.objects.filter(
+            Q(torg_id__isnull=True) | Q(torg_id=""), trpr_id=trpr_id, degree__in=degrees
+        ).update(torg_id=found)
+    if torg_id:
+        cache.set(_torg_cache_key(trpr_id, degree), torg_id, TORG_TTL)
+
+
+async def _ascan_torg_id(trpr_id, degree):
+    """_scan_torg_id 의 비동기 버전 (나머지 페이지는 이벤트 루프에서 동시에, 찾으면 취소)"""
+    try:
+        items, total = await afetch_trpr_page(trpr_id, 1)
+    except Exception:
+        items, total = [], None
+
+    found = _match_torg_id(items, degree)
+    if found or (total is not None and not items):
+        return found, items
+
+    rows = list(items)
+    tasks = [
+        asyncio.ensure_future(afetch_trpr_page(trpr_id, page))
+        for page in range(2, _lookup_last_page(total) + 1)
+    ]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                page_items, _ = await next_done
+            except Exception:
+                continue
+            rows.extend(page_items)
+            found = _match_torg_id(page_items, degree)
+            if found:
+                break
+    finally:
+        for task in tasks:
+            task.cancel()
+    return found, rows
+
+
+def _indexed_torg_ids(trpr_id, degree):
+    return (
+        HRDCourse.objects.filter(trpr_id=trpr_id, degree=str(degree))
+        .exclude(torg_id__isnull=True)
+        .exclude(torg_id="")
+        .values_list("torg_id", flat=True)
+    )
+
+
+def lookup_torg_id(trpr_id, degree):
+    """
+    (trpr_id, 회차) → 기관ID.
+    HRDCourse 색인(목록 동기화 때마다 채워짐) → 역조회 캐시 순으로 보고, 없을 때만 원격 역조회.
+    """
+    torg_id = _indexed_torg_ids(trpr_id, degree).first() or cache.get(
+        _torg_cache_key(trpr_id, degree)
+    )
+    if torg_id:
+        return torg_id
+
+    torg_id, rows = _scan_torg_id(trpr_id, degree)
+    try:
+        _remember_torg_ids(trpr_id, degree, torg_id, rows)
+    except Exception:
+        logger.exception("hrd_torg_index_fail", extra={"trpr_id": trpr_id})
+    return torg_id
+
+
+async def alookup_torg_id(trpr_id, degree):
+    """lookup_torg_id 의 비동기 버전 (역조회 원격 호출이 스레드를 잡지 않음)"""
+    torg_id = await _indexed_torg_ids(trpr_id, degree).afirst() or await cache.aget(
+        _torg_cache_key(trpr_id, degree)
+    )
+    if torg_id:
+        return torg_id
+
+    torg_id, rows = await _ascan_torg_id(trpr_id, degree)
+    try:
+        await sync_to_async(_remember_torg_ids)(trpr_id, degree, torg_id, rows)
+    except Exception:
+        logger.exception("hrd_torg_index_fail", extra={"trpr_id": trpr_id})
+    return torg_id
+
+
+def circuit_state():
+    """work24 서킷 브레이커 상태 (X-Circuit 헤더용)"""
+    breaker = upstream.breaker_for(LIST_API_URL)
+    return breaker.state() if breaker else "closed"
+
+
+def save_snapshot(key, payload):
+    """마지막 정상 결과 저장 (실패해도 응답에는 영향 없음)"""
+    try:
+        UpstreamSnapshot.objects.update_or_create(
+            key=key, defaults={"payload": payload}
+        )
+    except Exception:
+        logger.exception("hrd_snapshot_save_fail", extra={"snapshot_key": key})
+
+
+def load_snapshot(key):
+    snapshot = UpstreamSnapshot.objects.filter(key=key).first()
+    return snapshot.payload if snapshot else None
+
+
+class HRDCourseNotFound(Exception):
+    """310L03 응답에 과정이 없음"""
+
+
+NOT_FOUND_ENTRY = {"error": "과정 정보를 찾을 수 없습니다.", "status": 404}
+
+
+def detail_cache_key(trpr_id, degree, torg_id):
+    """상세 캐시 키 (요청에 넘어온 torg_id 그대로, 없으면 None)"""
+    return f"hrd:detail:{trpr_id}:{degree}:{torg_id}"
+
+
+def detail_params(trpr_id, degree, torg_id):
+    return {
+        "authKey": HRD_API_KEY,
+        "returnType": "XML",
+        "outType": "2",
+        "srchTrprId": trpr_id,
+        "srchTrprDegr": degree,
+        "srchTorgId": torg_id,
+    }
+
+
+def fetch_course_detail(trpr_id, degree, torg_id):
+    """
+    310L03 상세 → 날짜와 무관한 필드만 담은 dict.
+    상태/D-day 는 with_day_status() 로 읽을 때 계산.
+    """
+    r = upstream.get(DETAIL_API_URL, params=detail_params(trpr_id, degree, torg_id))
+    return parse_course_detail(r.content, trpr_id, degree, torg_id)
+
+
+def parse_course_detail(content, trpr_id, degree, torg_id):
+    """310L03 원본 bytes → 상세 dict (과정이 없으면 HRDCourseNotFound)"""
+    with timing.span("xml"):
+        detail = first_scn(content)
+    if not detail.get("trprNm"):
+        raise HRDCourseNotFound(trpr_id)
+
+    capacity = int(detail.get("totFxnum") or 0)
+    applied = int(detail.get("totTrpCnt") or 0)
+    return {
+        "course_id": trpr_id,
+        "course_name": detail.get("trprNm"),
+        "start_date": detail.get("trStaDt") or "미정",
+        "end_date": detail.get("trEndDt") or "미정",
+        "capacity": capacity,
+        "applied": applied,
+        "remaining_slots": max(capacity - applied, 0),
+        "graduates": detail.get("finiCnt"),
+        "fee": detail.get("totTrco"),
+        "empl_rate_6m": detail.get("eiEmplRate6"),
+        "non_insured_rate": detail.get("hrdEmplRate6"),
+        "registration_url": (
+            f"{REGISTRATION_URL}"
+            f"?tracseId={trpr_id}&tracseTme={degree}"
+            f"&crseTracseSe={detail.get('trainTargetCd')}"
+            f"&trainstCstmrId={torg_id}"
+        ),
+    }
+
+
+def resolve_course_detail(trpr_id, degree, torg_id):
+    """
+    원격 조회 결과를 캐시 항목으로 만들어 저장 후 반환.
+    - 성공: {"detail": {...}} (DETAIL_TTL)
+    - 과정 없음: {"error": ..., "status": 404} (DETAIL_NOT_FOUND_TTL)
+    - 원격 오류/서킷 OPEN: 마지막 정상 스냅샷이 있으면 {"detail": ..., "fallback": True},
+      없으면 {"error": ..., "status": 500} (DETAIL_ERROR_TTL)
+    torg_id 가 없으면 색인/역조회 → 환경변수 고정값 순으로 채운다.
+    """
+    key = detail_cache_key(trpr_id, degree, torg_id)
+    try:
+        torg = torg_id or lookup_torg_id(trpr_id, degree) or HRD_TORG_ID
+        if not torg:
+            raise HRDCourseNotFound(trpr_id)
+        detail = fetch_course_detail(trpr_id, degree, torg)
+        entry, ttl = {"detail": detail}, DETAIL_TTL
+        save_snapshot(key, detail)
+    except HRDCourseNotFound:
+        entry, ttl = NOT_FOUND_ENTRY, DETAIL_NOT_FOUND_TTL
+    except Exception as e:
+        entry, ttl = detail_error_entry(key, e), DETAIL_ERROR_TTL
+    cache.set(key, entry, ttl)
+    return entry
+
+
+async def aresolve_course_detail(trpr_id, degree, torg_id):
+    """resolve_course_detail 의 비동기 버전 (310L03 은 aiohttp 공용 세션으로 호출)"""
+    key = detail_cache_key(trpr_id, degree, torg_id)
+    try:
+        torg = (
+            torg_id
+            or await alookup_torg_id(trpr_id, degree)
+            or HRD_TORG_ID
+        )
+        if not torg:
+            raise HRDCourseNotFound(trpr_id)
+        content = await upstream_async.get(
+            DETAIL_API_URL, params=detail_params(trpr_id, degree, torg)
+        )
+        detail = parse_course_detail(content, trpr_id, degree, torg)
+        entry, ttl = {"detail": detail}, DETAIL_TTL
+        await sync_to_async(save_snapshot)(key, detail)
+    except HRDCourseNotFound:
+        entry, ttl = NOT_FOUND_ENTRY, DETAIL_NOT_FOUND_TTL
+    except Exception as e:
+        entry, ttl = await sync_to_async(detail_error_entry)(key, e), DETAIL_ERROR_TTL
+    await cache.aset(key, entry, ttl)
+    return entry
+
+
+def detail_error_entry(key, error):
+    """원격 오류 → 스냅샷 폴백 항목 (없으면 500 항목). 오류 내용은 서버 로그에만"""
+    logger.warning("hrd_detail_fail", extra={"cache_key": key}, exc_info=error)
+    snapshot = load_snapshot(key)
+    if snapshot is not None:
+        return {"detail": snapshot, "fallback": True}
+    return {"error": DETAIL_ERROR_MESSAGE, "status": 500}
+
+
+def with_day_status(detail, today):
+    """상세 dict 에 오늘 기준 status_label / d_day / is_closed 추가"""
+    start = _parse_date(detail.get("start_date"))
+    end = _parse_date(detail.get("end_date"))
+    if not (start and end):
+        start = end = None
+
+    is_full = detail["applied"] >= detail["capacity"]
+    is_ongoing = bool(start and end and start <= today <= end)
+    is_expired = bool(end and end < today)
+
+    if is_expired:
+        status_label, d_day = "종료", "종료"
+    elif is_ongoing:
+        status_label, d_day = "진행중", "진행중"
+    elif is_full:
+        status_label = "모집 마감"
+        d_day = f"D-{(start - today).days}" if start else "D-DAY"
+    else:
+        status_label = "모집중" if start else "정보 없음"
+        d_day = f"D-{(start - today).days}" if start else "미정"
+
+    result = dict(detail)
+    result.update(
+        status_label=status_label,
+        d_day=d_day,
+        is_closed=is_expired or is_full,
+    )
+    return result
@@ -0,0 +1,183 @@
+# apps/lectures/hrd_dataset.py
+"""
+기관/기간 단위로 정규화한 HRD 과정 전체 목록(캐시 1건).
+- 행은 필드명 없이 tuple 로 보관 (캐시 용량 절약)
+- 정렬 키별 인덱스 순서를 미리 계산해 두고, 요청마다 필터/페이지네이션만 수행
+→ 페이지/정렬/필터 조합이 늘어도 캐시 항목·원격 호출은 기관 수만큼만 생김
+"""
+import hashlib
+from datetime import date
+
+from .models import HRDCourse
+
+# 날짜와 무관한 필드만 캐시에 저장
+ROW_FIELDS = (
+    "title",
+    "process_id",
+    "process_time",
+    "torg_id",
+    "crse_tracse_se",
+    "start_date",
+    "end_date",
+    "location",
+    "summary",
+    "tel",
+    "satisfaction",
+    "capacity",
+    "applied",
+    "remaining_slots",
+)
+# 읽을 때마다 오늘(Asia/Seoul) 기준으로 계산하는 필드
+DAY_FIELDS = ("status_label", "d_day", "is_closed")
+
+# ?ordering= 허용 값 (앞에 '-' 붙이면 내림차순)
+SORT_KEYS = ("start_date", "end_date", "remaining")
+DEFAULT_ORDERING = "-start_date"
+
+STATUS_FULL = "모집 마감"
+STATUS_ONGOING = "진행중"
+STATUS_OPEN = "모집중"
+
+
+def serialize_course(course):
+    """HRDCourse → 날짜 무관 행 dict"""
+    return {
+        "title": course.title,
+        "process_id": course.trpr_id,
+        "process_time": course.degree,
+        "torg_id": course.torg_id,
+        "crse_tracse_se": course.train_target_cd,
+        "start_date": course.start_date.isoformat(),
+        "end_date": course.end_date.isoformat(),
+        "location": course.address,
+        "summary": course.contents,
+        "tel": course.tel_no,
+        "satisfaction": course.satisfaction,
+        "capacity": course.capacity,
+        "applied": course.applied,
+        "remaining_slots": course.remaining,
+    }
+
+
+class HRDDataset:
+    """
+    정규화된 과정 목록(날짜 무관) + 정렬 키별 미리 계산한 인덱스 순서.
+    시작/종료일은 ordinal 열로 따로 들고 있어서, 요청마다 오늘 날짜와 정수 비교만으로
+    종료 여부/상태/D-day 를 계산한다 (캐시를 몇 시간 유지해도 자정에 틀어지지 않음).
+    """
+
+    def __init__(self, rows):
+        self.rows = []
+        self.start_ord = []
+        self.end_ord = []
+        self.is_full = []
+        for r in rows:
+            self.rows.append(tuple(r[f] for f in ROW_FIELDS))
+            self.start_ord.append(date.fromisoformat(r["start_date"]).toordinal())
+            self.end_ord.append(date.fromisoformat(r["end_date"]).toordinal())
+            self.is_full.append(r["applied"] >= r["capacity"])
+
+        # 내용 해시 (ETag 용, 캐시에 함께 저장)
+        self._etag = self._content_hash()
+
+        n = len(self.rows)
+        remaining = [row[ROW_FIELDS.index("remaining_slots")] for row in self.rows]
+        # 동률이면 원래 순서(시작일/과정ID/회차) 유지
+        self.orders = {
+            "start_date": sorted(range(n), key=lambda i: (self.start_ord[i], i)),
+            "end_date": sorted(range(n), key=lambda i: (self.end_ord[i], i)),
+            "remaining": sorted(range(n), key=lambda i: (remaining[i], i)),
+        }
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _content_hash(self):
+        return hashlib.sha1(repr(self.rows).encode("utf-8")).hexdigest()
+
+    @property
+    def etag(self):
+        # 해시 도입 전에 캐시된 데이터셋도 처리
+        if getattr(self, "_etag", None) is None:
+            self._etag = self._content_hash()
+        return self._etag
+
+    def day_fields(self, today_ord):
+        """
+        오늘 기준 (status_label, d_day, is_closed) 열을 한 번에 계산.
+        종료된 과정은 None (목록에서 제외)
+        """
+        result = []
+        for start, end, full in zip(self.start_ord, self.end_ord, self.is_full):
+            if end < today_ord:
+                result.append(None)
+                continue
+            ongoing = start <= today_ord <= end
+            label = STATUS_FULL if full else (STATUS_ONGOING if ongoing else STATUS_OPEN)
+            if ongoing:
+                d_day = "진행중"
+            elif start > today_ord:
+                d_day = f"D-{start - today_ord}"
+            else:
+                d_day = "D-DAY"
+            result.append((label, d_day, full))
+        return result
+
+    def select(
+        self,
+        today,
+        ordering=DEFAULT_ORDERING,
+        status_label=None,
+        available=False,
+        start_from=None,
+        start_to=None,
+    ):
+        """
+        필터를 통과한 행을 정렬 순서대로 반환 → (인덱스 목록, 오늘 기준 day_fields)
+        start_from/start_to 는 date
+        """
+        key = ordering.lstrip("-")
+        if key not in self.orders:
+            key, ordering = DEFAULT_ORDERING.lstrip("-"), DEFAULT_ORDERING
+        order = self.orders[key]
+        if ordering.startswith("-"):
+            order = reversed(order)
+
+        days = self.day_fields(today.toordinal())
+        from_ord = start_from.toordinal() if start_from else None
+        to_ord = start_to.toordinal() if start_to else None
+        remain_col = ROW_FIELDS.index("remaining_slots")
+
+        selected = []
+        for i in order:
+            if days[i] is None:
+                continue
+            if status_label and days[i][0] != status_label:
+                continue
+            if available and self.rows[i][remain_col] <= 0:
+                continue
+            if from_ord and self.start_ord[i] < from_ord:
+                continue
+            if to_ord and self.start_ord[i] > to_ord:
+                continue
+            selected.append(i)
+        return selected, days
+
+    def row(self, index, days):
+        data = dict(zip(ROW_FIELDS, self.rows[index]))
+        data.update(zip(DAY_FIELDS, days[index]))
+        return data
+
+
+def build_dataset(organ, window_start, window_end):
+    """
+    HRDCourse 에서 기관/기간 전체를 읽어 데이터셋 생성.
+    원격 동기화는 하지 않음 (sync_hrd_courses / 예열만 동기화)
+    """
+    # 종료 여부는 읽을 때 판단하므로 기간 내 전체를 담는다
+    courses = HRDCourse.objects.filter(
+        organ_name=organ,
+        start_date__gte=window_start,
+        start_date__lte=window_end,
+    ).order_by("start_date", "trpr_id", "degree")
+    return HRDDataset(serialize_course(c) for c in courses)
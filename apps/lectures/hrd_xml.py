@@ -0,0 +1,101 @@
+# apps/lectures/hrd_xml.py
+"""
+고용24 XML 응답 스트리밍 파서.
+- xmltodict 처럼 문서 전체를 dict 트리로 만들지 않고, 원본 bytes 를 iterparse 로 훑으며
+  scn_list 레코드에서 필요한 필드만 뽑아낸다.
+- 처리한 레코드 엘리먼트는 바로 clear 해서 메모리를 유지하지 않는다.
+"""
+import io
+from xml.etree import ElementTree as ET
+
+RECORD_TAG = "scn_list"
+COUNT_TAG = "scn_cnt"
+
+# 310L01 목록: 동기화/역조회에서 쓰는 필드
+LIST_FIELDS = (
+    "trprId",
+    "trprDegr",
+    "title",
+    "traStartDate",
+    "traEndDate",
+    "yardMan",
+    "regCourseMan",
+    "trainTargetCd",
+    "address",
+    "contents",
+    "telNo",
+    "stdgScor",
+    "trainstCstmrId",
+    "trainstCstmrID",
+    "torgId",
+    "TorgId",
+    "torgID",
+    "insttOrgNo",
+    "trainstId",
+)
+
+# 310L03 상세: 상세 응답에서 쓰는 필드
+DETAIL_FIELDS = (
+    "trprNm",
+    "trStaDt",
+    "trEndDt",
+    "totFxnum",
+    "totTrpCnt",
+    "finiCnt",
+    "totTrco",
+    "eiEmplRate6",
+    "hrdEmplRate6",
+    "trainTargetCd",
+)
+
+
+def _iter(content, fields, meta):
+    wanted = frozenset(fields)
+    record = None
+    depth = 0  # 레코드 내부 깊이 (1 = scn_list 의 직계 자식)
+
+    for event, elem in ET.iterparse(io.BytesIO(content), events=("start", "end")):
+        if event == "start":
+            if record is not None:
+                depth += 1
+            elif elem.tag == RECORD_TAG:
+                record, depth = {}, 0
+            continue
+
+        if record is None:
+            if elem.tag == COUNT_TAG and meta is not None:
+                meta["total"] = (elem.text or "").strip()
+            continue
+
+        if depth == 0:
+            # </scn_list>
+            yield record
+            record = None
+            elem.clear()
+            continue
+
+        if depth == 1 and elem.tag in wanted:
+            text = (elem.text or "").strip()
+            record[elem.tag] = text or None
+        depth -= 1
+
+
+def iter_scn_list(content, fields=LIST_FIELDS):
+    """원본 bytes → scn_list 레코드(dict, 지정 필드만) 제너레이터"""
+    return _iter(content, fields, None)
+
+
+def parse_scn_list(content, fields=LIST_FIELDS):
+    """원본 bytes → (레코드 목록, scn_cnt 또는 None)"""
+    meta = {}
+    rows = list(_iter(content, fields, meta))
+    try:
+        total = int(meta.get("total"))
+    except (TypeError, ValueError):
+        total = None
+    return rows, total
+
+
+def first_scn(content, fields=DETAIL_FIELDS):
+    """상세(310L03)처럼 레코드가 하나인 응답 → dict (없으면 빈 dict)"""
+    return next(iter_scn_list(content, fields), {})
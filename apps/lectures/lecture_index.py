@@ -0,0 +1,133 @@
+# apps/lectures/lecture_index.py
+"""
+강의 색인(LectureIndex) 갱신.
+- 자체 강의: Lecture post_save 시그널 → index_lecture
+- HRD 과정: sync_courses 가 upsert 직후 index_hrd_courses 로 기관/기간 단위 일괄 반영
+- 원본 삭제는 FK CASCADE 로 색인도 함께 삭제 (tag_set 조인 행도 함께)
+- 태그 필터용 tag_set 은 upsert 직후 같은 자리에서 다시 채움 (HRD 과정은 태그 없음)
+- 전체 재구성: python manage.py rebuild_lecture_index
+"""
+from .models import HRDCourse, Lecture, LectureIndex, Tag
+from .tags import parse_tags
+
+INDEX_FIELDS = (
+    "lecture",
+    "hrd_course",
+    "organ_name",
+    "title",
+    "start_date",
+    "end_date",
+    "day_of_week",
+    "capacity",
+    "applied",
+    "remaining",
+    "tags",
+    "process_id",
+    "process_time",
+    "torg_id",
+)
+
+
+def normalize_tags(raw):
+    """'한식, 제과 ,한식' → ',한식,제과,' (응답 표시용 tags 컬럼)"""
+    tags = parse_tags(raw)
+    return f",{','.join(tags)}," if tags else ""
+
+
+def lecture_entry(lecture):
+    """Lecture → 저장 전 색인 행"""
+    remaining = None
+    if lecture.capacity is not None:
+        remaining = max(lecture.capacity - (lecture.applied or 0), 0)
+    return LectureIndex(
+        source=LectureIndex.SOURCE_ACADEMY,
+        source_key=str(lecture.pk),
+        lecture=lecture,
+        organ_name=lecture.institution_name or "",
+        title=lecture.title,
+        start_date=lecture.start_date,
+        end_date=lecture.end_date,
+        day_of_week=lecture.day_of_week,
+        capacity=lecture.capacity,
+        applied=lecture.applied or 0,
+        remaining=remaining,
+        tags=normalize_tags(lecture.tags),
+        process_id=lecture.process_id,
+    )
+
+
+def hrd_entry(course):
+    """HRDCourse → 저장 전 색인 행"""
+    return LectureIndex(
+        source=LectureIndex.SOURCE_HRD,
+        source_key=f"{course.trpr_id}:{course.degree}",
+        hrd_course=course,
+        organ_name=course.organ_name,
+        title=course.title,
+        start_date=course.start_date,
+        end_date=course.end_date,
+        capacity=course.capacity,
+        applied=course.applied,
+        remaining=course.remaining,
+        process_id=course.trpr_id,
+        process_time=course.degree,
+        torg_id=course.torg_id,
+    )
+
+
+def _upsert(entries):
+    if not entries:
+        return 0
+    LectureIndex.objects.bulk_create(
+        entries,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["source", "source_key"],
+        update_fields=[*INDEX_FIELDS, "updated_at"],
+    )
+    academy = [e for e in entries if e.source == LectureIndex.SOURCE_ACADEMY]
+    for start in range(0, len(academy), 500):
+        _sync_tag_links(academy[start:start + 500])
+    return len(entries)
+
+
+def _sync_tag_links(entries):
+    """색인 행 tags 문자열 → tag_set 조인 행 (기존 행 지우고 다시 넣음)"""
+    wanted = {e.source_key: parse_tags(e.tags) for e in entries}
+    names = {n for tags in wanted.values() for n in tags}
+    if names:
+        Tag.objects.bulk_create([Tag(name=n) for n in names], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.filter(name__in=names).values_list("name", "pk"))
+    index_ids = dict(
+        LectureIndex.objects.filter(
+            source=LectureIndex.SOURCE_ACADEMY, source_key__in=list(wanted)
+        ).values_list("source_key", "pk")
+    )
+
+    Link = LectureIndex.tag_set.through
+    Link.objects.filter(lectureindex_id__in=list(index_ids.values())).delete()
+    Link.objects.bulk_create(
+        [
+            Link(lectureindex_id=index_ids[key], tag_id=tag_ids[n])
+            for key, tags in wanted.items()
+            for n in tags
+        ],
+        batch_size=500,
+    )
+
+
+def index_lecture(lecture):
+    return _upsert([lecture_entry(lecture)])
+
+
+def index_hrd_courses(queryset):
+    """HRDCourse queryset 을 색인에 일괄 반영 → 반영 건수"""
+    return _upsert([hrd_entry(c) for c in queryset.iterator(chunk_size=500)])
+
+
+def rebuild_index():
+    """색인 전체 재구성 → (자체 강의 수, HRD 과정 수)"""
+    LectureIndex.objects.all().delete()
+    academy = _upsert([lecture_entry(l) for l in Lecture.objects.iterator(chunk_size=500)])
+    hrd = index_hrd_courses(HRDCourse.objects.all())
+    return academy, hrd
@@ -0,0 +1,168 @@
+import csv
+import statistics
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+# 엔드포인트 이름 → 경로 (detail 은 대상 과정을 채워서 사용)
+ENDPOINTS = {
+    "list": "hrd/",
+    "detail": "hrd/{trpr_id}/?tracse_tme={tracse_tme}&torg_id={torg_id}",
+    "all": "all/",
+}
+CSV_HEADER = ("idx", "xcache", "xelapsed_ms", "total_ms")
+
+
+def percentile(values, pct):
+    """선형 보간 백분위 (값이 하나뿐이면 그 값)"""
+    if not values:
+        return None
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def write_csv(path, samples):
+    """bench_hrd_*.csv 형식 (UTF-8 BOM, 값은 따옴표, 없는 값은 빈 칸)"""
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n")
+        writer.writerow(CSV_HEADER)
+        for s in samples:
+            writer.writerow(
+                (
+                    str(s["idx"]),
+                    s["xcache"] or None,
+                    f"{s['xelapsed_ms']:.1f}" if s["xelapsed_ms"] is not None else None,
+                    f"{s['total_ms']:.1f}",
+                )
+            )
+
+
+def summarize(samples):
+    totals = [s["total_ms"] for s in samples]
+    server = [s["xelapsed_ms"] for s in samples if s["xelapsed_ms"] is not None]
+    return {
+        "count": len(samples),
+        "errors": sum(1 for s in samples if s["status"] >= 400),
+        "xcache": Counter(s["xcache"] or "-" for s in samples),
+        "total_ms": {p: percentile(totals, p) for p in (50, 95, 99)},
+        "xelapsed_ms": {p: percentile(server, p) for p in (50, 95, 99)},
+    }
+
+
+class Command(BaseCommand):
+    """
+    HRD 엔드포인트 부하 벤치마크 (실행 중인 서버에 HTTP 요청)
+    python manage.py upstream_standin --latency-ms 300          # 1) 대역 서버
+    WORK24_BASE_URL=http://127.0.0.1:8900 python manage.py runserver --noreload  # 2) 앱
+    python manage.py bench_hrd --requests 200 --concurrency 16   # 3) 측정
+    엔드포인트마다 bench_hrd_<endpoint>_<일시>.csv 와 p50/p95/p99 요약 출력
+    """
+
+    help = "HRD 목록/상세/전체 목록을 동시 요청으로 측정해 CSV 와 백분위 요약을 남깁니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument(
+            "--endpoint",
+            action="append",
+            dest="endpoints",
+            choices=sorted(ENDPOINTS),
+            help="측정 대상 (여러 번 지정 가능, 기본: 전부)",
+        )
+        parser.add_argument("--requests", type=int, default=50, help="엔드포인트별 요청 수")
+        parser.add_argument("--concurrency", type=int, default=8, help="동시 요청 수")
+        parser.add_argument(
+            "--async",
+            action="store_true",
+            dest="use_async",
+            help="/api/lectures/async/ (ASGI) 버전 측정",
+        )
+        parser.add_argument(
+            "--detail",
+            help="상세 대상 trpr_id:tracse_tme:torg_id (기본: 목록 첫 행)",
+        )
+        parser.add_argument("--out-dir", default=".", help="CSV 저장 디렉터리")
+
+    def handle(self, *args, **options):
+        prefix = options["base_url"].rstrip("/") + (
+            "/api/lectures/async/" if options["use_async"] else "/api/lectures/"
+        )
+        out_dir = Path(options["out_dir"])
+        out_dir.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+
+        for name in options["endpoints"] or list(ENDPOINTS):
+            path = ENDPOINTS[name]
+            if name == "detail":
+                path = path.format(**self._detail_target(prefix, options["detail"]))
+            samples = self._run(
+                prefix + path, options["requests"], options["concurrency"]
+            )
+            csv_path = out_dir / f"bench_hrd_{name}_{stamp}.csv"
+            write_csv(csv_path, samples)
+            self._report(name, csv_path, summarize(samples))
+
+    def _detail_target(self, prefix, spec):
+        if spec:
+            try:
+                trpr_id, tracse_tme, torg_id = spec.split(":")
+            except ValueError:
+                raise CommandError("--detail 은 trpr_id:tracse_tme:torg_id 형식입니다.")
+            return {"trpr_id": trpr_id, "tracse_tme": tracse_tme, "torg_id": torg_id}
+
+        rows = requests.get(prefix + "hrd/?page_size=1", timeout=30).json().get("results")
+        if not rows:
+            raise CommandError("목록이 비어 있어 상세 대상을 고를 수 없습니다 (--detail 지정).")
+        row = rows[0]
+        return {
+            "trpr_id": row["process_id"],
+            "tracse_tme": row["process_time"],
+            "torg_id": row.get("torg_id") or "",
+        }
+
+    def _run(self, url, total, concurrency):
+        local = threading.local()
+
+        def one(idx):
+            # 스레드마다 세션 하나 (keep-alive 재사용)
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = requests.Session()
+            t0 = time.perf_counter()
+            try:
+                resp = session.get(url, timeout=60)
+                status, headers = resp.status_code, resp.headers
+            except requests.RequestException:
+                status, headers = 599, {}
+            elapsed = headers.get("X-Elapsed-ms")
+            return {
+                "idx": idx,
+                "status": status,
+                "xcache": headers.get("X-Cache"),
+                "xelapsed_ms": float(elapsed) if elapsed else None,
+                "total_ms": (time.perf_counter() - t0) * 1000,
+            }
+
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+            return list(pool.map(one, range(1, total + 1)))
+
+    def _report(self, name, csv_path, summary):
+        def fmt(values):
+            return " / ".join(
+                f"p{p} {v:.1f}" if v is not None else f"p{p} -" for p, v in values.items()
+            )
+
+        caches = ", ".join(f"{k} {v}" for k, v in summary["xcache"].most_common())
+        self.stdout.write(self.style.SUCCESS(f"[{name}] {csv_path}"))
+        self.stdout.write(
+            f"  요청 {summary['count']}건 (오류 {summary['errors']}) | X-Cache: {caches}"
+        )
+        self.stdout.write(f"  total_ms    {fmt(summary['total_ms'])}")
+        self.stdout.write(f"  xelapsed_ms {fmt(summary['xelapsed_ms'])}")
@@ -0,0 +1,79 @@
+import statistics
+import time
+import tracemalloc
+from pathlib import Path
+
+import xmltodict
+from django.core.management.base import BaseCommand
+
+from apps.lectures.hrd_xml import parse_scn_list
+
+FIXTURE = Path(__file__).resolve().parents[2] / "fixtures" / "work24" / "310L01_100rows.xml"
+
+
+def parse_with_xmltodict(content):
+    """기존 방식: bytes → str 디코드 → 전체 dict 트리 → scn_list"""
+    data = xmltodict.parse(content.decode("utf-8"))
+    items = (data.get("HRDNet") or {}).get("srchList") or {}
+    items = items.get("scn_list") or []
+    if isinstance(items, dict):
+        items = [items]
+    return items
+
+
+def parse_streaming(content):
+    return parse_scn_list(content)[0]
+
+
+class Command(BaseCommand):
+    """
+    310L01 응답 파싱 마이크로 벤치마크 (xmltodict vs 스트리밍 파서)
+    python manage.py bench_hrd_parse --repeat 200
+    """
+
+    help = "work24 310L01 XML 파싱 시간/최대 메모리를 xmltodict 와 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--file", default=str(FIXTURE), help="XML 파일 경로")
+        parser.add_argument("--repeat", type=int, default=100, help="반복 횟수")
+
+    def handle(self, *args, **options):
+        content = Path(options["file"]).read_bytes()
+        repeat = max(options["repeat"], 1)
+
+        rows_a = parse_with_xmltodict(content)
+        rows_b = parse_streaming(content)
+        self.stdout.write(
+            f"payload: {len(content):,} bytes, rows: xmltodict={len(rows_a)} "
+            f"streaming={len(rows_b)}"
+        )
+
+        results = {}
+        for name, fn in (
+            ("xmltodict", parse_with_xmltodict),
+            ("streaming", parse_streaming),
+        ):
+            timings = []
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                fn(content)
+                timings.append((time.perf_counter() - t0) * 1000)
+
+            tracemalloc.start()
+            fn(content)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            results[name] = (statistics.median(timings), min(timings), peak)
+            self.stdout.write(
+                f"{name:>10}: median {results[name][0]:.2f} ms, "
+                f"min {results[name][1]:.2f} ms, peak {peak / 1024:.0f} KiB"
+            )
+
+        base, new = results["xmltodict"], results["streaming"]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"speedup x{base[0] / new[0]:.2f}, "
+                f"peak memory -{(1 - new[2] / base[2]) * 100:.0f}%"
+            )
+        )
@@ -0,0 +1,109 @@
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from apps.lectures.management.commands.bench_hrd import percentile
+from apps.lectures.models import Lecture
+from apps.lectures.reservations import LectureFull, reserve_seat
+
+
+def naive_reserve(lecture_id, key):
+    """비교용: 읽고-고치고-쓰기 (동시 요청 시 증가분 유실)"""
+    lecture = Lecture.objects.get(pk=lecture_id)
+    if lecture.applied >= lecture.capacity:
+        raise LectureFull(lecture_id)
+    lecture.applied += 1
+    lecture.save(update_fields=["applied"])
+
+
+class Command(BaseCommand):
+    """
+    좌석 예약 경합 벤치마크 (한 강의에 여러 스레드가 동시에 예약)
+    python manage.py bench_reservations --threads 32 --requests 500 --capacity 300
+    python manage.py bench_reservations --naive        # 읽고-고치고-쓰기와 비교
+    성공/마감 건수, 최종 applied 와 유실 건수, 지연 p50/p95/p99 출력
+    (SQLite 는 쓰기가 직렬화되므로 Postgres 에서 측정할 것)
+    """
+
+    help = "한 강의에 동시 좌석 예약을 몰아 넣어 증가분 유실/정원 초과 여부와 지연을 측정합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=16, help="동시 스레드 수")
+        parser.add_argument("--requests", type=int, default=200, help="전체 예약 시도 수")
+        parser.add_argument("--capacity", type=int, default=100, help="임시 강의 정원")
+        parser.add_argument(
+            "--lecture", type=int, help="기존 강의 ID (기본: 임시 강의를 만들고 끝나면 삭제)"
+        )
+        parser.add_argument(
+            "--naive", action="store_true", help="조건부 UPDATE 대신 읽고-고치고-쓰기"
+        )
+
+    def handle(self, *args, **options):
+        temporary = options["lecture"] is None
+        if temporary:
+            lecture = Lecture.objects.create(
+                type="academy",
+                title="[bench] 좌석 예약 경합",
+                capacity=options["capacity"],
+            )
+        else:
+            lecture = Lecture.objects.filter(pk=options["lecture"]).first()
+            if lecture is None or lecture.capacity is None:
+                raise CommandError("정원이 있는 기존 강의 ID 를 지정하세요.")
+
+        try:
+            self._bench(lecture, options)
+        finally:
+            if temporary:
+                lecture.delete()
+
+    def _bench(self, lecture, options):
+        reserve = naive_reserve if options["naive"] else reserve_seat
+        run_id = uuid.uuid4().hex[:8]
+        before = lecture.applied
+
+        def one(idx):
+            t0 = time.perf_counter()
+            try:
+                reserve(lecture.pk, f"bench-{run_id}-{idx}")
+                outcome = "reserved"
+            except LectureFull:
+                outcome = "full"
+            except Exception:
+                outcome = "error"
+            elapsed = (time.perf_counter() - t0) * 1000
+            # 풀 스레드의 커넥션은 CONN_MAX_AGE 와 무관하게 닫음 (스레드 종료 후엔 닫을 방법이 없음)
+            connection.close()
+            return outcome, elapsed
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max(options["threads"], 1)) as pool:
+            results = list(pool.map(one, range(options["requests"])))
+        wall = time.perf_counter() - t0
+
+        lecture.refresh_from_db()
+        outcomes = Counter(o for o, _ in results)
+        latencies = [ms for _, ms in results]
+        gained = lecture.applied - before
+        lost = outcomes["reserved"] - gained
+
+        mode = "naive" if options["naive"] else "conditional UPDATE"
+        self.stdout.write(self.style.SUCCESS(f"[{mode}] 강의 {lecture.pk}"))
+        self.stdout.write(
+            f"  시도 {len(results)}건 / {options['threads']}스레드 | "
+            f"예약 {outcomes['reserved']} / 마감 {outcomes['full']} / 오류 {outcomes['error']}"
+        )
+        self.stdout.write(
+            f"  applied {before} → {lecture.applied} (정원 {lecture.capacity}), 유실 {lost}건"
+        )
+        self.stdout.write(
+            "  latency_ms "
+            + " / ".join(f"p{p} {percentile(latencies, p):.1f}" for p in (50, 95, 99))
+            + f" | {len(results) / wall:.0f} req/s"
+        )
+        if lost or lecture.applied > lecture.capacity:
+            self.stdout.write(self.style.WARNING("  ⚠ 증가분 유실 또는 정원 초과"))
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.lectures.lecture_index import rebuild_index
+
+
+class Command(BaseCommand):
+    """
+    강의 색인(LectureIndex) 전체 재구성
+    python manage.py rebuild_lecture_index
+    평소에는 Lecture 저장/HRD 동기화 때 자동 갱신되므로,
+    loaddata 나 queryset.update() 등 시그널을 거치지 않은 변경 뒤에만 실행하면 된다.
+    """
+
+    help = "자체 강의와 HRD 과정으로 강의 색인 테이블을 다시 만듭니다."
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            academy, hrd = rebuild_index()
+        self.stdout.write(
+            self.style.SUCCESS(f"색인 재구성 완료: 자체 강의 {academy}건, HRD {hrd}건")
+        )
@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.lectures.hrd import (
+    DETAIL_API_URL,
+    HRD_TORG_ID,
+    LIST_API_URL,
+    detail_params,
+    extract_torg_id,
+    search_window,
+)
+from apps.lectures.hrd_xml import iter_scn_list
+from utils import upstream
+from utils.qnet import EXAM_SCHEDULE_PATH
+
+DEFAULT_OUT = Path(__file__).resolve().parents[2] / "fixtures" / "recorded"
+
+
+class Command(BaseCommand):
+    """
+    실제 work24 / Q-Net API 응답을 fixture 로 녹화 (수동 실행 전용, 인증키 필요)
+    python manage.py record_upstream_fixtures --org 다모아요리학원 --jmcd 7910 --year 2025
+    녹화 결과는 upstream_standin --list-fixture/--detail-fixture/--qnet-fixture 로 재생
+    """
+
+    help = "실제 공공데이터 API 를 호출해 대역 서버용 fixture 를 새로 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--org", default="다모아요리학원", help="310L01 기관명")
+        parser.add_argument("--jmcd", help="Q-Net 종목코드 (없으면 Q-Net 생략)")
+        parser.add_argument("--year", help="Q-Net 시행연도")
+        parser.add_argument("--out-dir", default=str(DEFAULT_OUT))
+
+    def handle(self, *args, **options):
+        if not settings.HRD_API_KEY:
+            raise CommandError("HRD_API_KEY 가 설정되지 않았습니다.")
+        if "work24.go.kr" not in LIST_API_URL:
+            # 대역 서버를 녹화하는 실수 방지
+            raise CommandError(f"WORK24_BASE_URL 이 실제 API 가 아닙니다: {LIST_API_URL}")
+
+        out = Path(options["out_dir"])
+        out.mkdir(parents=True, exist_ok=True)
+
+        window_start, window_end = search_window()
+        resp = upstream.get(
+            LIST_API_URL,
+            params={
+                "authKey": settings.HRD_API_KEY,
+                "returnType": "XML",
+                "outType": "1",
+                "pageNum": 1,
+                "pageSize": 100,
+                "srchTraStDt": window_start.strftime("%Y%m%d"),
+                "srchTraEndDt": window_end.strftime("%Y%m%d"),
+                "srchTraOrganNm": options["org"],
+                "sort": "DESC",
+                "sortCol": 2,
+            },
+        )
+        self._write(out / "310L01.xml", resp.content)
+
+        first = next(iter_scn_list(resp.content), None)
+        if first is None:
+            self.stderr.write(self.style.WARNING("310L01 결과가 없어 310L03 은 생략합니다."))
+        else:
+            torg = extract_torg_id(first) or HRD_TORG_ID
+            resp = upstream.get(
+                DETAIL_API_URL,
+                params=detail_params(first["trprId"], first["trprDegr"], torg),
+            )
+            self._write(out / "310L03.xml", resp.content)
+
+        if options["jmcd"]:
+            resp = upstream.get(
+                settings.DATA_GO_KR_BASE_URL + EXAM_SCHEDULE_PATH,
+                params={
+                    "serviceKey": settings.QNET_API_KEY,
+                    "implYy": options["year"],
+                    "qualgbCd": "T",
+                    "jmCd": options["jmcd"],
+                    "dataFormat": "json",
+                    "pageNo": 1,
+                    "numOfRows": 50,
+                },
+            )
+            payload = json.dumps(resp.json(), ensure_ascii=False, indent=2)
+            self._write(out / "getQualExamSchdList.json", payload.encode("utf-8"))
+
+    def _write(self, path, content):
+        path.write_bytes(content)
+        self.stdout.write(self.style.SUCCESS(f"저장: {path} ({len(content)} bytes)"))
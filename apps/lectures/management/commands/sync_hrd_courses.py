@@ -0,0 +1,51 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from apps.lectures.hrd import default_organizations, sync_courses
+
+
+class Command(BaseCommand):
+    """
+    고용24 310L01 목록 → HRDCourse 동기화
+    python manage.py sync_hrd_courses                   # 1회 실행 (cron 등록용)
+    python manage.py sync_hrd_courses --loop --interval 600   # 주기 실행(워커 프로세스)
+    """
+
+    help = "고용24(HRD) 과정 목록을 전 페이지 조회해 DB에 일괄 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--org",
+            action="append",
+            dest="orgs",
+            help="기관명 (여러 번 지정 가능, 기본값: settings.HRD_ORGANIZATIONS)",
+        )
+        parser.add_argument(
+            "--loop", action="store_true", help="종료하지 않고 주기적으로 동기화"
+        )
+        parser.add_argument(
+            "--interval", type=int, default=600, help="--loop 주기(초), 기본 600"
+        )
+
+    def handle(self, *args, **options):
+        orgs = options["orgs"] or default_organizations()
+        while True:
+            self._sync_once(orgs)
+            if not options["loop"]:
+                break
+            time.sleep(max(options["interval"], 1))
+
+    def _sync_once(self, orgs):
+        for organ in orgs:
+            try:
+                upserted, deleted = sync_courses(organ)
+            except Exception as e:
+                # 한 기관 실패가 전체 동기화를 막지 않도록
+                self.stderr.write(self.style.ERROR(f"[{organ}] 동기화 실패: {e}"))
+                continue
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"[{organ}] 동기화 완료: upsert {upserted}건, 삭제 {deleted}건"
+                )
+            )
@@ -0,0 +1,78 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from utils.standin import Fixtures, StandinConfig, build_server
+
+WORK24_FIXTURES = Path(__file__).resolve().parents[2] / "fixtures" / "work24"
+QNET_FIXTURES = Path(settings.BASE_DIR) / "apps" / "certificates" / "fixtures" / "qnet"
+
+
+class Command(BaseCommand):
+    """
+    work24 / Q-Net 로컬 대역 서버 (녹화 응답 재생)
+    python manage.py upstream_standin --port 8900 --latency-ms 300 --jitter-ms 200 \\
+        --error-rate 0.05 --total-rows 5000
+    앱 쪽 환경변수:
+    WORK24_BASE_URL=http://127.0.0.1:8900 DATA_GO_KR_BASE_URL=http://127.0.0.1:8900
+    """
+
+    help = "녹화한 work24/Q-Net 응답을 재생하는 부하 테스트용 대역 서버를 실행합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--host", default="127.0.0.1")
+        parser.add_argument("--port", type=int, default=8900)
+        parser.add_argument(
+            "--latency-ms", type=float, default=0, help="응답마다 추가 지연(ms)"
+        )
+        parser.add_argument(
+            "--jitter-ms", type=float, default=0, help="0~N ms 무작위 추가 지연"
+        )
+        parser.add_argument(
+            "--error-rate", type=float, default=0, help="503 응답 비율 (0~1)"
+        )
+        parser.add_argument(
+            "--total-rows",
+            type=int,
+            default=0,
+            help="310L01 전체 건수 (fixture 반복, 0 이면 fixture 그대로)",
+        )
+        parser.add_argument(
+            "--list-fixture", default=str(WORK24_FIXTURES / "310L01_100rows.xml")
+        )
+        parser.add_argument(
+            "--detail-fixture", default=str(WORK24_FIXTURES / "310L03_detail.xml")
+        )
+        parser.add_argument(
+            "--qnet-fixture",
+            default=str(QNET_FIXTURES / "getQualExamSchdList.json"),
+        )
+        parser.add_argument("--verbose", action="store_true", help="요청 로그 출력")
+
+    def handle(self, *args, **options):
+        fixtures = Fixtures(
+            options["list_fixture"], options["detail_fixture"], options["qnet_fixture"]
+        )
+        config = StandinConfig(
+            latency_ms=options["latency_ms"],
+            jitter_ms=options["jitter_ms"],
+            error_rate=options["error_rate"],
+            total_rows=options["total_rows"],
+            verbose=options["verbose"],
+        )
+        server = build_server(options["host"], options["port"], fixtures, config)
+        host, port = server.server_address[:2]
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"대역 서버 실행: http://{host}:{port} "
+                f"(310L01 {config.total_rows or len(fixtures.records)}건, "
+                f"지연 {config.latency_ms}+{config.jitter_ms}ms, 오류율 {config.error_rate})"
+            )
+        )
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from apps.lectures.warmup import DEFAULT_TOP_N, DEFAULT_WORKERS, warm_caches
+
+
+class Command(BaseCommand):
+    """
+    HRD 목록/상위 N개 상세 캐시 예열 (배포 직후 실행, 전체 목록도 같은 캐시 사용)
+    python manage.py warm_caches --top 30
+    공유 캐시(REDIS_URL)일 때 의미가 있고, 프로세스별 LocMem 캐시라면
+    WARM_CACHES_ON_STARTUP=True 로 워커마다 예열한다.
+    """
+
+    help = "HRD 목록과 상위 과정 상세를 동시에 미리 조회해 캐시에 저장합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--org",
+            action="append",
+            dest="orgs",
+            help="기관명 (여러 번 지정 가능, 기본값: settings.HRD_ORGANIZATIONS)",
+        )
+        parser.add_argument(
+            "--top", type=int, default=DEFAULT_TOP_N, help="상세를 예열할 상위 과정 수"
+        )
+        parser.add_argument(
+            "--workers", type=int, default=DEFAULT_WORKERS, help="동시 작업 수"
+        )
+
+    def handle(self, *args, **options):
+        summary = warm_caches(
+            orgs=options["orgs"], top_n=options["top"], workers=options["workers"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"예열 완료: 목록 {summary['lists']}건, 상세 {summary['details']}건"
+            )
+        )
+        for error in summary["errors"]:
+            self.stderr.write(self.style.WARNING(f"실패: {error}"))
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HRDCourse',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('trpr_id', models.CharField(max_length=50, verbose_name='과정 ID')),
+                ('degree', models.CharField(max_length=20, verbose_name='회차')),
+                ('torg_id', models.CharField(blank=True, max_length=50, null=True, verbose_name='기관 ID')),
+                ('organ_name', models.CharField(blank=True, max_length=255, verbose_name='검색 기관명')),
+                ('title', models.CharField(max_length=255, verbose_name='과정명')),
+                ('train_target_cd', models.CharField(blank=True, max_length=20, null=True, verbose_name='훈련대상 코드')),
+                ('start_date', models.DateField(verbose_name='훈련 시작일')),
+                ('end_date', models.DateField(verbose_name='훈련 종료일')),
+                ('address', models.CharField(blank=True, max_length=255, null=True, verbose_name='주소')),
+                ('contents', models.TextField(blank=True, null=True, verbose_name='과정 요약')),
+                ('tel_no', models.CharField(blank=True, max_length=50, null=True, verbose_name='전화번호')),
+                ('satisfaction', models.CharField(blank=True, max_length=20, null=True, verbose_name='만족도')),
+                ('capacity', models.PositiveIntegerField(default=0, verbose_name='정원')),
+                ('applied', models.PositiveIntegerField(default=0, verbose_name='신청 인원')),
+                ('synced_at', models.DateTimeField(auto_now=True, verbose_name='동기화 일시')),
+            ],
+            options={
+                'verbose_name': 'HRD 과정',
+                'verbose_name_plural': 'HRD 과정',
+                'ordering': ('-start_date',),
+                'indexes': [models.Index(fields=['organ_name', 'start_date'], name='lectures_hr_organ_n_45b55e_idx'), models.Index(fields=['end_date'], name='lectures_hr_end_dat_2f810b_idx')],
+                'constraints': [models.UniqueConstraint(fields=('trpr_id', 'degree'), name='uniq_hrd_course_degree')],
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0002_hrdcourse'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UpstreamSnapshot',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=255, unique=True, verbose_name='키')),
+                ('payload', models.JSONField(verbose_name='데이터')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='저장 일시')),
+            ],
+            options={
+                'verbose_name': '원격 응답 스냅샷',
+                'verbose_name_plural': '원격 응답 스냅샷',
+            },
+        ),
+    ]
@@ -0,0 +1,96 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_index(apps, schema_editor):
+    """기존 강의/HRD 과정으로 색인 채우기 (이후에는 시그널/동기화가 갱신)"""
+    Lecture = apps.get_model("lectures", "Lecture")
+    HRDCourse = apps.get_model("lectures", "HRDCourse")
+    LectureIndex = apps.get_model("lectures", "LectureIndex")
+
+    def tags(raw):
+        items = dict.fromkeys(t.strip() for t in (raw or "").split(","))
+        items.pop("", None)
+        return f",{','.join(items)}," if items else ""
+
+    entries = [
+        LectureIndex(
+            source="academy",
+            source_key=str(l.pk),
+            lecture=l,
+            organ_name=l.institution_name or "",
+            title=l.title,
+            start_date=l.start_date,
+            end_date=l.end_date,
+            day_of_week=l.day_of_week,
+            capacity=l.capacity,
+            applied=l.applied or 0,
+            remaining=(
+                max(l.capacity - (l.applied or 0), 0) if l.capacity is not None else None
+            ),
+            tags=tags(l.tags),
+            process_id=l.process_id,
+        )
+        for l in Lecture.objects.iterator()
+    ]
+    entries += [
+        LectureIndex(
+            source="hrd",
+            source_key=f"{c.trpr_id}:{c.degree}",
+            hrd_course=c,
+            organ_name=c.organ_name,
+            title=c.title,
+            start_date=c.start_date,
+            end_date=c.end_date,
+            capacity=c.capacity,
+            applied=c.applied,
+            remaining=max(c.capacity - c.applied, 0),
+            process_id=c.trpr_id,
+            process_time=c.degree,
+            torg_id=c.torg_id,
+        )
+        for c in HRDCourse.objects.iterator()
+    ]
+    LectureIndex.objects.bulk_create(entries, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0003_upstreamsnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LectureIndex',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('academy', '학원 강의'), ('hrd', 'HRD-Net 강의')], max_length=10, verbose_name='출처')),
+                ('source_key', models.CharField(max_length=120, verbose_name='원본 키')),
+                ('organ_name', models.CharField(blank=True, max_length=255, verbose_name='기관명')),
+                ('title', models.CharField(max_length=255, verbose_name='제목')),
+                ('start_date', models.DateField(blank=True, null=True, verbose_name='시작일')),
+                ('end_date', models.DateField(blank=True, null=True, verbose_name='종료일')),
+                ('day_of_week', models.CharField(blank=True, max_length=50, null=True, verbose_name='요일')),
+                ('capacity', models.PositiveIntegerField(blank=True, null=True, verbose_name='정원')),
+                ('applied', models.PositiveIntegerField(default=0, verbose_name='신청 인원')),
+                ('remaining', models.PositiveIntegerField(blank=True, null=True, verbose_name='잔여석')),
+                ('tags', models.CharField(blank=True, max_length=255, verbose_name='태그')),
+                ('process_id', models.CharField(blank=True, max_length=100, null=True, verbose_name='과정 ID')),
+                ('process_time', models.CharField(blank=True, max_length=20, null=True, verbose_name='회차')),
+                ('torg_id', models.CharField(blank=True, max_length=50, null=True, verbose_name='기관 ID')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='색인 일시')),
+                ('hrd_course', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='lectures.hrdcourse')),
+                ('lecture', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='lectures.lecture')),
+            ],
+            options={
+                'verbose_name': '강의 색인',
+                'verbose_name_plural': '강의 색인',
+                'indexes': [models.Index(fields=['-start_date', '-id'], name='lecture_idx_start_id'), models.Index(fields=['source', 'start_date'], name='lecture_idx_source'), models.Index(fields=['end_date'], name='lecture_idx_end'), models.Index(fields=['remaining'], name='lecture_idx_remaining'), models.Index(fields=['tags'], name='lecture_idx_tags')],
+                'constraints': [models.UniqueConstraint(fields=('source', 'source_key'), name='uniq_lecture_index_source')],
+            },
+        ),
+        migrations.RunPython(backfill_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0004_lectureindex'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lecture',
+            index=models.Index(fields=['end_date'], name='lecture_end_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='lecture',
+            index=models.Index(fields=['start_date'], name='lecture_start_date_idx'),
+        ),
+    ]
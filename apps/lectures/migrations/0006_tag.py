@@ -0,0 +1,57 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:57
+
+from django.db import migrations, models
+
+
+def split_tags(apps, schema_editor):
+    """기존 Lecture.tags 콤마 문자열 → Tag + 조인 테이블"""
+    Lecture = apps.get_model("lectures", "Lecture")
+    Tag = apps.get_model("lectures", "Tag")
+    Link = Lecture.tag_set.through
+
+    parsed = {}
+    for pk, raw in Lecture.objects.exclude(tags="").values_list("pk", "tags"):
+        names = dict.fromkeys(t.strip() for t in (raw or "").split(","))
+        names.pop("", None)
+        parsed[pk] = list(names)
+
+    all_names = {n for names in parsed.values() for n in names}
+    Tag.objects.bulk_create([Tag(name=n) for n in all_names], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.values_list("name", "pk"))
+    Link.objects.bulk_create(
+        [
+            Link(lecture_id=pk, tag_id=tag_ids[n])
+            for pk, names in parsed.items()
+            for n in names
+        ],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0005_lecture_date_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Tag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255, unique=True, verbose_name='태그')),
+            ],
+            options={
+                'verbose_name': '강의 태그',
+                'verbose_name_plural': '강의 태그',
+                'ordering': ('name',),
+            },
+        ),
+        migrations.AddField(
+            model_name='lecture',
+            name='tag_set',
+            field=models.ManyToManyField(blank=True, related_name='lectures', to='lectures.tag'),
+        ),
+        migrations.RunPython(split_tags, migrations.RunPython.noop),
+    ]
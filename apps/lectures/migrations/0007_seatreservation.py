@@ -0,0 +1,28 @@
+# Generated by Django 5.2.3 on 2026-10-18 15:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0006_tag'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SeatReservation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('idempotency_key', models.CharField(max_length=64, unique=True, verbose_name='멱등 키')),
+                ('remaining', models.PositiveIntegerField(verbose_name='예약 직후 잔여석')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='예약 일시')),
+                ('lecture', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reservations', to='lectures.lecture')),
+            ],
+            options={
+                'verbose_name': '좌석 예약',
+                'verbose_name_plural': '좌석 예약',
+            },
+        ),
+    ]
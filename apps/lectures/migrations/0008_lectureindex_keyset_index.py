@@ -0,0 +1,26 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:22
+
+import apps.lectures.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0007_seatreservation'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lectureindex',
+            name='lecture_idx_start_id',
+        ),
+        migrations.RemoveIndex(
+            model_name='lectureindex',
+            name='lecture_idx_tags',
+        ),
+        migrations.AddIndex(
+            model_name='lectureindex',
+            index=apps.lectures.models.NullsLastIndex(models.OrderBy(models.F('start_date'), descending=True, nulls_last=True), models.OrderBy(models.F('id'), descending=True), name='lecture_idx_start_id'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:23
+
+from django.db import migrations, models
+
+
+def link_index_tags(apps, schema_editor):
+    """기존 색인 행 tags(",a,b,") → Tag + 색인 조인 테이블"""
+    LectureIndex = apps.get_model("lectures", "LectureIndex")
+    Tag = apps.get_model("lectures", "Tag")
+    Link = LectureIndex.tag_set.through
+
+    parsed = {
+        pk: [t for t in raw.split(",") if t]
+        for pk, raw in LectureIndex.objects.exclude(tags="").values_list("pk", "tags")
+    }
+    all_names = {n for names in parsed.values() for n in names}
+    Tag.objects.bulk_create([Tag(name=n) for n in all_names], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.values_list("name", "pk"))
+    Link.objects.bulk_create(
+        [
+            Link(lectureindex_id=pk, tag_id=tag_ids[n])
+            for pk, names in parsed.items()
+            for n in names
+        ],
+        batch_size=500,
+        ignore_conflicts=True,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0008_lectureindex_keyset_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lectureindex',
+            name='tag_set',
+            field=models.ManyToManyField(blank=True, related_name='+', to='lectures.tag'),
+        ),
+        migrations.RunPython(link_index_tags, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def drop_lookup_only_courses(apps, schema_editor):
+    """
+    기관ID 역조회가 넣었던 기관명 없는 과정 행 삭제.
+    sync_courses 는 항상 기관명을 채우고 기관별로만 정리하므로 이 행들은 지워지지 않고
+    강의 색인 재구성에 섞여 들어갔다 (강의 색인 행은 CASCADE 로 함께 삭제)
+    """
+    HRDCourse = apps.get_model("lectures", "HRDCourse")
+    HRDCourse.objects.filter(organ_name="").delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('lectures', '0009_lectureindex_tag_set'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_lookup_only_courses, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,67 @@
+from datetime import timedelta
+
 from django.db import models
+from django.db.models import Case, F, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+
+class LectureQuerySet(models.QuerySet):
+    def with_status(self, today=None):
+        """
+        remain / status / days_left 를 DB 에서 계산해 annotate.
+        → ?status= 필터, ?ordering=remain 등이 쿼리 한 번으로 처리됨
+        (days_left 는 DurationField: 종료일까지 남은 기간, 종료됐으면 0)
+        """
+        today = today or timezone.localdate()
+        return self.annotate(
+            remain=Case(
+                When(capacity__isnull=True, then=Value(None)),
+                default=Greatest(F("capacity") - F("applied"), Value(0)),
+                output_field=models.IntegerField(),
+            ),
+            status=Case(
+                When(end_date__lt=today, then=Value(Lecture.STATUS_CLOSED)),
+                When(
+                    capacity__isnull=False,
+                    capacity__lte=F("applied"),
+                    then=Value(Lecture.STATUS_FULL),
+                ),
+                default=Value(Lecture.STATUS_OPEN),
+                output_field=models.CharField(),
+            ),
+            days_left=Case(
+                When(
+                    end_date__gte=today,
+                    then=F("end_date") - Value(today, output_field=models.DateField()),
+                ),
+                default=Value(timedelta(0)),
+                output_field=models.DurationField(),
+            ),
+        )
+
+
+class Tag(models.Model):
+    """강의 태그 (Lecture.tags 콤마 문자열을 정규화한 값)"""
+
+    name = models.CharField("태그", max_length=255, unique=True)
+
+    class Meta:
+        verbose_name = "강의 태그"
+        verbose_name_plural = "강의 태그"
+        ordering = ("name",)
+
+    def __str__(self):
+        return self.name
 
 
 class Lecture(models.Model):
+    STATUS_CLOSED = "마감"
+    STATUS_FULL = "모집마감"
+    STATUS_OPEN = "진행중"
+    # ?status= 에 영문 별칭도 허용
+    STATUS_ALIASES = {"closed": STATUS_CLOSED, "full": STATUS_FULL, "open": STATUS_OPEN}
+
     # 공통 필드
     LECTURE_TYPE_CHOICES = [
         ("academy", "학원 강의"),
@@ -11,7 +71,9 @@ class Lecture(models.Model):
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True)
     image = models.ImageField(upload_to="lectures/", null=True, blank=True)
-    tags = models.CharField(max_length=255, blank=True)
+    tags = models.CharField(max_length=255, blank=True)  # 입력용 "한식,제과"
+    # 필터/집계용 (저장 시 tags 에서 자동 동기화, 조인 테이블 FK 인덱스 사용)
+    tag_set = models.ManyToManyField(Tag, blank=True, related_name="lectures")
     created_at = models.DateTimeField(auto_now_add=True)
 
     # 학원 강의 전용 필드
@@ -29,5 +91,182 @@ class Lecture(models.Model):
         max_length=255, null=True, blank=True
     )  # 교육기관명
 
+    objects = LectureQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["end_date"], name="lecture_end_date_idx"),
+            models.Index(fields=["start_date"], name="lecture_start_date_idx"),
+        ]
+
     def __str__(self):
         return f"[{dict(self.LECTURE_TYPE_CHOICES).get(self.type, self.type)}] {self.title}"
+
+
+class HRDCourse(models.Model):
+    """
+    고용24(310L01) 과정/회차 로컬 사본.
+    - sync_hrd_courses 커맨드로 주기적으로 적재
+    - /api/lectures/hrd/ 는 이 테이블에서 읽음
+    """
+
+    trpr_id = models.CharField("과정 ID", max_length=50)
+    degree = models.CharField("회차", max_length=20)
+    torg_id = models.CharField("기관 ID", max_length=50, null=True, blank=True)
+    organ_name = models.CharField("검색 기관명", max_length=255, blank=True)
+    title = models.CharField("과정명", max_length=255)
+    train_target_cd = models.CharField(
+        "훈련대상 코드", max_length=20, null=True, blank=True
+    )
+    start_date = models.DateField("훈련 시작일")
+    end_date = models.DateField("훈련 종료일")
+    address = models.CharField("주소", max_length=255, null=True, blank=True)
+    contents = models.TextField("과정 요약", null=True, blank=True)
+    tel_no = models.CharField("전화번호", max_length=50, null=True, blank=True)
+    satisfaction = models.CharField("만족도", max_length=20, null=True, blank=True)
+    capacity = models.PositiveIntegerField("정원", default=0)
+    applied = models.PositiveIntegerField("신청 인원", default=0)
+    synced_at = models.DateTimeField("동기화 일시", auto_now=True)
+
+    class Meta:
+        verbose_name = "HRD 과정"
+        verbose_name_plural = "HRD 과정"
+        ordering = ("-start_date",)
+        constraints = [
+            models.UniqueConstraint(
+                fields=["trpr_id", "degree"], name="uniq_hrd_course_degree"
+            )
+        ]
+        indexes = [
+            models.Index(fields=["organ_name", "start_date"]),
+            models.Index(fields=["end_date"]),
+        ]
+
+    def __str__(self):
+        return f"[{self.trpr_id}/{self.degree}] {self.title}"
+
+    @property
+    def remaining(self):
+        return max(self.capacity - self.applied, 0)
+
+
+class UpstreamSnapshot(models.Model):
+    """
+    원격 API 마지막 정상 응답(정규화 결과).
+    - work24 장애/서킷 OPEN 시 폴백으로 사용 (재시작해도 유지)
+    """
+
+    key = models.CharField("키", max_length=255, unique=True)
+    payload = models.JSONField("데이터")
+    updated_at = models.DateTimeField("저장 일시", auto_now=True)
+
+    class Meta:
+        verbose_name = "원격 응답 스냅샷"
+        verbose_name_plural = "원격 응답 스냅샷"
+
+    def __str__(self):
+        return self.key
+
+
+class NullsLastIndex(models.Index):
+    """
+    F(...).desc(nulls_last=True) 식 색인.
+    SQLite 는 색인 정의에 NULLS LAST 를 못 쓰므로 같은 컬럼의 DESC 색인으로 만든다
+    (SQLite 는 NULL 을 가장 작은 값으로 보므로 DESC 면 원래 NULL 이 맨 뒤 → 같은 순서)
+    """
+
+    def create_sql(self, model, schema_editor, using="", **kwargs):
+        if schema_editor.connection.vendor == "sqlite":
+            fields = [
+                ("-" if e.descending else "") + e.expression.name for e in self.expressions
+            ]
+            plain = models.Index(fields=fields, name=self.name)
+            return plain.create_sql(model, schema_editor, using=using, **kwargs)
+        return super().create_sql(model, schema_editor, using=using, **kwargs)
+
+
+class LectureIndex(models.Model):
+    """
+    자체 강의(Lecture)와 HRD 과정(HRDCourse)을 한 모양으로 펼친 조회용 색인 테이블.
+    - Lecture 저장(시그널)/HRD 동기화 때 갱신, 원본이 지워지면 CASCADE 로 함께 삭제
+    - /api/lectures/index/ 의 필터·검색·키셋 페이지네이션이 이 테이블만 읽음
+    """
+
+    SOURCE_ACADEMY = "academy"
+    SOURCE_HRD = "hrd"
+    SOURCE_CHOICES = [
+        (SOURCE_ACADEMY, "학원 강의"),
+        (SOURCE_HRD, "HRD-Net 강의"),
+    ]
+
+    source = models.CharField("출처", max_length=10, choices=SOURCE_CHOICES)
+    source_key = models.CharField("원본 키", max_length=120)  # 강의 ID 또는 과정ID:회차
+    lecture = models.ForeignKey(
+        Lecture, on_delete=models.CASCADE, null=True, blank=True, related_name="+"
+    )
+    hrd_course = models.ForeignKey(
+        HRDCourse, on_delete=models.CASCADE, null=True, blank=True, related_name="+"
+    )
+    organ_name = models.CharField("기관명", max_length=255, blank=True)
+    title = models.CharField("제목", max_length=255)
+    start_date = models.DateField("시작일", null=True, blank=True)
+    end_date = models.DateField("종료일", null=True, blank=True)
+    day_of_week = models.CharField("요일", max_length=50, null=True, blank=True)
+    capacity = models.PositiveIntegerField("정원", null=True, blank=True)
+    applied = models.PositiveIntegerField("신청 인원", default=0)
+    remaining = models.PositiveIntegerField("잔여석", null=True, blank=True)
+    # 응답 표시용 ",a,b," (페이지 1쿼리 유지). 필터는 tag_set 조인 테이블 EXISTS 로만
+    tags = models.CharField("태그", max_length=255, blank=True)
+    tag_set = models.ManyToManyField(Tag, blank=True, related_name="+")
+    process_id = models.CharField("과정 ID", max_length=100, null=True, blank=True)
+    process_time = models.CharField("회차", max_length=20, null=True, blank=True)
+    torg_id = models.CharField("기관 ID", max_length=50, null=True, blank=True)
+    updated_at = models.DateTimeField("색인 일시", auto_now=True)
+
+    class Meta:
+        verbose_name = "강의 색인"
+        verbose_name_plural = "강의 색인"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "source_key"], name="uniq_lecture_index_source"
+            )
+        ]
+        indexes = [
+            # 키셋 페이지네이션 (시작일 내림차순·NULL 맨 뒤, id) — KeysetPagination 정렬과 같은 식
+            NullsLastIndex(
+                F("start_date").desc(nulls_last=True),
+                F("id").desc(),
+                name="lecture_idx_start_id",
+            ),
+            models.Index(fields=["source", "start_date"], name="lecture_idx_source"),
+            models.Index(fields=["end_date"], name="lecture_idx_end"),
+            models.Index(fields=["remaining"], name="lecture_idx_remaining"),
+        ]
+
+    def __str__(self):
+        return f"[{self.source}] {self.title}"
+
+    @property
+    def tag_list(self):
+        return [t for t in self.tags.split(",") if t]
+
+
+class SeatReservation(models.Model):
+    """
+    자체 강의 좌석 예약 (멱등 키당 1건).
+    같은 Idempotency-Key 로 다시 요청하면 좌석을 더 잡지 않고 저장된 결과를 돌려준다.
+    """
+
+    idempotency_key = models.CharField("멱등 키", max_length=64, unique=True)
+    lecture = models.ForeignKey(
+        Lecture, on_delete=models.CASCADE, related_name="reservations"
+    )
+    remaining = models.PositiveIntegerField("예약 직후 잔여석")
+    created_at = models.DateTimeField("예약 일시", auto_now_add=True)
+
+    class Meta:
+        verbose_name = "좌석 예약"
+        verbose_name_plural = "좌석 예약"
+
+    def __str__(self):
+        return f"{self.lecture_id}:{self.idempotency_key}"
@@ -0,0 +1,77 @@
+# apps/lectures/reservations.py
+"""
+자체 강의 좌석 예약.
+- 좌석은 조건부 UPDATE 한 번으로 잡음
+  UPDATE ... SET applied = applied + 1 WHERE id = %s AND applied < capacity RETURNING ...
+  → 읽고-고치고-쓰기가 없어 동시 신청에도 증가분이 사라지거나 정원을 넘지 않음
+- RETURNING 으로 갱신 직후 값을 받아 잔여석을 계산 (다시 읽지 않음)
+- 예약 행(멱등 키 UNIQUE)과 같은 트랜잭션 → 같은 키 동시 요청은 하나만 커밋되고 나머지는 재생
+"""
+from django.db import IntegrityError, connection, transaction
+
+from .models import Lecture, LectureIndex, SeatReservation
+
+
+class LectureFull(Exception):
+    pass
+
+
+class IdempotencyKeyReused(Exception):
+    """같은 키가 다른 강의 예약에 이미 사용됨"""
+
+
+def _reserve_sql():
+    qn = connection.ops.quote_name
+    table = qn(Lecture._meta.db_table)
+    applied, capacity = qn("applied"), qn("capacity")
+    return (
+        f"UPDATE {table} SET {applied} = {applied} + 1 "
+        f"WHERE {qn('id')} = %s AND {capacity} IS NOT NULL AND {applied} < {capacity} "
+        f"RETURNING {applied}, {capacity}"
+    )
+
+
+def increment_applied(lecture_id):
+    """좌석 1개 확보 → (applied, capacity), 없으면 None (정원 초과/없는 강의)"""
+    with connection.cursor() as cursor:
+        cursor.execute(_reserve_sql(), [lecture_id])
+        return cursor.fetchone()
+
+
+def _replay(key, lecture_id):
+    reservation = SeatReservation.objects.get(idempotency_key=key)
+    if reservation.lecture_id != lecture_id:
+        raise IdempotencyKeyReused(key)
+    return reservation, False
+
+
+def reserve_seat(lecture_id, key):
+    """
+    → (SeatReservation, created)
+    정원이 찼으면 LectureFull, 없는 강의면 Lecture.DoesNotExist
+    """
+    try:
+        return _replay(key, lecture_id)
+    except SeatReservation.DoesNotExist:
+        pass
+
+    try:
+        with transaction.atomic():
+            row = increment_applied(lecture_id)
+            if row is None:
+                if not Lecture.objects.filter(pk=lecture_id).exists():
+                    raise Lecture.DoesNotExist(lecture_id)
+                raise LectureFull(lecture_id)
+            applied, capacity = row
+            remaining = max(capacity - applied, 0)
+            reservation = SeatReservation.objects.create(
+                idempotency_key=key, lecture_id=lecture_id, remaining=remaining
+            )
+            # 시그널을 거치지 않으므로 색인도 같은 트랜잭션에서 반영
+            LectureIndex.objects.filter(
+                source=LectureIndex.SOURCE_ACADEMY, source_key=str(lecture_id)
+            ).update(applied=applied, remaining=remaining)
+    except IntegrityError:
+        # 같은 키로 동시에 들어온 요청이 먼저 커밋됨 → 좌석 증가는 롤백됐으므로 재생
+        return _replay(key, lecture_id)
+    return reservation, True
@@ -1,5 +1,7 @@
 from rest_framework import serializers
-from apps.lectures.models import Lecture
+from django.utils import timezone
+from apps.lectures.models import Lecture, LectureIndex
+from apps.lectures.hrd_dataset import STATUS_FULL, STATUS_ONGOING, STATUS_OPEN
 from datetime import date
 
 
@@ -26,20 +28,28 @@ class LectureDisplaySerializer(serializers.ModelSerializer):
             'days_left',
         )
 
+    # 목록/상세 뷰는 Lecture.objects.with_status() 로 DB 에서 계산한 값을 읽고,
+    # annotate 없이 넘어온 인스턴스만 파이썬으로 계산
     def get_remain(self, obj):
+        if hasattr(obj, "remain"):
+            return obj.remain
         if obj.capacity is not None and obj.applied is not None:
             return max(obj.capacity - obj.applied, 0)
         return None
 
     def get_status(self, obj):
+        if hasattr(obj, "status"):
+            return obj.status
         today = date.today()
         if obj.end_date and obj.end_date < today:
-            return "마감"
+            return Lecture.STATUS_CLOSED
         elif obj.capacity is not None and obj.applied is not None and obj.capacity <= obj.applied:
-            return "모집마감"
-        return "진행중"
+            return Lecture.STATUS_FULL
+        return Lecture.STATUS_OPEN
 
     def get_days_left(self, obj):
+        if hasattr(obj, "days_left"):
+            return obj.days_left.days
         today = date.today()
         if obj.end_date and obj.end_date >= today:
             return (obj.end_date - today).days
@@ -49,4 +59,75 @@ class LectureDisplaySerializer(serializers.ModelSerializer):
 class LectureCreateUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Lecture
-        fields = '__all__'
+        exclude = ('tag_set',)  # tags 문자열 저장 시 자동 동기화
+
+
+class HRDDetailKeySerializer(serializers.Serializer):
+    """HRD 상세 일괄 조회 요청 항목"""
+
+    trpr_id = serializers.CharField(max_length=50)
+    tracse_tme = serializers.CharField(max_length=20)
+    torg_id = serializers.CharField(
+        max_length=50, required=False, allow_blank=True, allow_null=True
+    )
+
+
+class HRDBatchDetailSerializer(serializers.Serializer):
+    """HRD 상세 일괄 조회 요청 본문 {"items": [...]} (목록/스칼라 본문은 400)"""
+
+    MAX_ITEMS = 50  # 목록 한 페이지 기준
+
+    items = HRDDetailKeySerializer(many=True, allow_empty=False, max_length=MAX_ITEMS)
+
+
+class LectureIndexSerializer(serializers.ModelSerializer):
+    """강의 색인 행 (자체 강의/HRD 공통 모양). 상태/D-day 는 오늘 기준으로 계산"""
+
+    id = serializers.IntegerField(source="lecture_id", read_only=True)
+    tags = serializers.ListField(source="tag_list", read_only=True)
+    status_label = serializers.SerializerMethodField()
+    d_day = serializers.SerializerMethodField()
+
+    class Meta:
+        model = LectureIndex
+        fields = (
+            "source",
+            "id",
+            "process_id",
+            "process_time",
+            "torg_id",
+            "title",
+            "organ_name",
+            "start_date",
+            "end_date",
+            "day_of_week",
+            "capacity",
+            "applied",
+            "remaining",
+            "tags",
+            "status_label",
+            "d_day",
+        )
+
+    def _today(self):
+        return self.context.setdefault("today", timezone.localdate())
+
+    def _ongoing(self, obj):
+        return bool(
+            obj.start_date
+            and obj.end_date
+            and obj.start_date <= self._today() <= obj.end_date
+        )
+
+    def get_status_label(self, obj):
+        if obj.remaining == 0:
+            return STATUS_FULL
+        return STATUS_ONGOING if self._ongoing(obj) else STATUS_OPEN
+
+    def get_d_day(self, obj):
+        if self._ongoing(obj):
+            return "진행중"
+        if not obj.start_date:
+            return None
+        days = (obj.start_date - self._today()).days
+        return f"D-{days}" if days > 0 else "D-DAY"
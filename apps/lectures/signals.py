@@ -0,0 +1,26 @@
+# apps/lectures/signals.py
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .lecture_index import index_lecture
+from .models import Lecture
+from .tags import FACET_CACHE_KEY, sync_lecture_tags
+
+
+@receiver(post_save, sender=Lecture, dispatch_uid="lectures.sync_lecture_tags")
+def update_lecture_tags(sender, instance, raw=False, **kwargs):
+    if not raw:
+        sync_lecture_tags(instance)
+
+
+@receiver(post_save, sender=Lecture, dispatch_uid="lectures.index_lecture")
+def update_lecture_index(sender, instance, raw=False, **kwargs):
+    # loaddata(raw) 는 건너뜀 → 필요하면 rebuild_lecture_index
+    if not raw:
+        index_lecture(instance)
+
+
+@receiver(post_delete, sender=Lecture, dispatch_uid="lectures.tag_facets")
+def invalidate_tag_facets(sender, **kwargs):
+    cache.delete(FACET_CACHE_KEY)
@@ -0,0 +1,66 @@
+# apps/lectures/tags.py
+"""
+강의 태그 정규화/필터/집계.
+- 입력은 기존대로 Lecture.tags("한식, 제과") → 저장 시그널이 Tag/조인 테이블로 동기화
+- 강의 색인(LectureIndex)도 같은 Tag 로 tag_set 조인 테이블을 가짐 (색인 갱신 때 채움)
+- ?tag= 는 모두 포함(AND), ?tags_any= 는 하나라도 포함(OR). 둘 다 EXISTS 서브쿼리라 행이 중복되지 않음
+- 태그별 강의 수(facet)는 캐시, 강의 저장/삭제 시 무효화
+"""
+from django.core.cache import cache
+from django.db.models import Count, Exists, OuterRef
+
+from .models import Tag
+
+FACET_CACHE_KEY = "lectures:tag_facets"
+FACET_TTL = 60 * 10
+
+
+def parse_tags(raw):
+    """'한식, 제과 ,한식' → ['한식', '제과'] (공백/중복 제거, 순서 유지)"""
+    tags = dict.fromkeys(t.strip() for t in (raw or "").split(","))
+    tags.pop("", None)
+    return list(tags)
+
+
+def query_tags(query_params, name):
+    """?tag=a&tag=b 또는 ?tag=a,b → ['a', 'b']"""
+    names = []
+    for value in query_params.getlist(name):
+        names += parse_tags(value)
+    return list(dict.fromkeys(names))
+
+
+def sync_lecture_tags(lecture):
+    """Lecture.tags 문자열 → tag_set"""
+    names = parse_tags(lecture.tags)
+    if names:
+        Tag.objects.bulk_create([Tag(name=n) for n in names], ignore_conflicts=True)
+    lecture.tag_set.set(Tag.objects.filter(name__in=names))
+    cache.delete(FACET_CACHE_KEY)
+
+
+def filter_by_tags(queryset, all_of=(), any_of=()):
+    """tag_set 이 있는 모델(Lecture, LectureIndex) queryset 에 태그 조건"""
+    field = queryset.model._meta.get_field("tag_set")
+    links = field.remote_field.through.objects.filter(
+        **{field.m2m_field_name(): OuterRef("pk")}
+    )
+    for name in all_of:
+        queryset = queryset.filter(Exists(links.filter(tag__name=name)))
+    if any_of:
+        queryset = queryset.filter(Exists(links.filter(tag__name__in=any_of)))
+    return queryset
+
+
+def tag_facets():
+    """[{"name": 태그, "count": 강의 수}, ...] (많은 순)"""
+    facets = cache.get(FACET_CACHE_KEY)
+    if facets is None:
+        facets = list(
+            Tag.objects.annotate(count=Count("lectures"))
+            .filter(count__gt=0)
+            .order_by("-count", "name")
+            .values("name", "count")
+        )
+        cache.set(FACET_CACHE_KEY, facets, FACET_TTL)
+    return facets
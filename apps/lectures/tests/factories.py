@@ -0,0 +1,65 @@
+# apps/lectures/tests/factories.py
+"""HRD 테스트 공용 데이터/베이스 클래스 (work24 응답 형태 + 목록 API 클라이언트)"""
+from datetime import date, timedelta
+from typing import cast
+from unittest import mock
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.response import Response as DRFResponse
+from rest_framework.test import APIClient, APITestCase
+
+ORGAN = "다모아요리학원"
+
+
+def scn_item(trpr_id: str, degree: int, start: date, end: date, **extra):
+    """310L01 scn_list 한 건 (xmltodict 결과 형태)"""
+    item = {
+        "trprId": trpr_id,
+        "trprDegr": str(degree),
+        "title": f"{trpr_id} 과정",
+        "traStartDate": start.isoformat(),
+        "traEndDate": end.isoformat(),
+        "yardMan": "20",
+        "regCourseMan": "5",
+        "trainstCstmrId": "500020000001",
+        "trainTargetCd": "C0061",
+    }
+    item.update(extra)
+    return item
+
+
+def detail_payload(today: date, trpr_id: str):
+    """fetch_course_detail 결과 (7일 뒤 시작, 15석 남음)"""
+    start = today + timedelta(days=7)
+    return {
+        "course_id": trpr_id,
+        "course_name": f"{trpr_id} 과정",
+        "start_date": start.isoformat(),
+        "end_date": (start + timedelta(days=30)).isoformat(),
+        "capacity": 20,
+        "applied": 5,
+        "remaining_slots": 15,
+    }
+
+
+class BaseHRDTest(APITestCase):
+    client: APIClient
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.list_url = "/api/lectures/hrd/"
+        self.today = timezone.localdate()
+
+    def req_get(self, url: str, **kwargs) -> DRFResponse:
+        return cast(DRFResponse, self.client.get(url, **kwargs))
+
+    def patch_pages(self, pages):
+        """fetch_course_page를 페이지별 고정 응답으로 대체"""
+
+        def fake(organ, start, end, page_num, page_size=100):
+            return pages[page_num - 1] if page_num <= len(pages) else []
+
+        return mock.patch("apps.lectures.hrd.fetch_course_page", side_effect=fake)
@@ -0,0 +1,132 @@
+# apps/lectures/tests/test_academy_lectures.py
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.lectures.models import Lecture
+
+
+class AcademyLectureStatusTests(APITestCase):
+
+    url = "/api/lectures/"
+
+    def setUp(self):
+        t = self.today = timezone.localdate()
+
+        def lecture(title, end_offset, capacity, applied):
+            return Lecture.objects.create(
+                type="academy",
+                title=title,
+                start_date=t - timedelta(days=5),
+                end_date=t + timedelta(days=end_offset),
+                capacity=capacity,
+                applied=applied,
+            )
+
+        self.many = lecture("여유", 20, 10, 2)
+        self.few = lecture("소수", 3, 10, 9)
+        self.full = lecture("만석", 10, 5, 7)
+        self.ended = lecture("종료", -1, 10, 0)
+        self.unlimited = lecture("정원 없음", 7, None, 4)
+
+    def titles(self, res):
+        return [row["title"] for row in res.json()["results"]]
+
+    def test_annotations_match_serializer_fields(self):
+        lectures = {
+            l.title: l for l in Lecture.objects.with_status(self.today)
+        }
+        self.assertEqual(lectures["만석"].remain, 0)
+        self.assertEqual(lectures["만석"].status, Lecture.STATUS_FULL)
+        self.assertEqual(lectures["종료"].status, Lecture.STATUS_CLOSED)
+        self.assertEqual(lectures["종료"].days_left, timedelta(0))
+        self.assertIsNone(lectures["정원 없음"].remain)
+        self.assertEqual(lectures["소수"].days_left.days, 3)
+
+        res = self.client.get(f"{self.url}{self.few.id}/")
+        row = res.json()
+        self.assertEqual(
+            (row["remain"], row["status"], row["days_left"]),
+            (1, Lecture.STATUS_OPEN, 3),
+        )
+
+    def test_status_filter_and_remain_ordering_in_one_query(self):
+        with self.assertNumQueries(2):  # COUNT + 페이지
+            res = self.client.get(self.url + "?status=open&ordering=remain")
+        # NULL(정원 없음)은 DB 정렬 규칙 위치: 양 끝 중 한 곳
+        titles = [t for t in self.titles(res) if t != "정원 없음"]
+        self.assertEqual(titles, ["소수", "여유"])
+        self.assertEqual(res.json()["total_count"], 3)
+
+        res = self.client.get(self.url + "?status=모집마감")
+        self.assertEqual(self.titles(res), ["만석"])
+
+        res = self.client.get(self.url + "?status=closed&ordering=-days_left")
+        self.assertEqual(self.titles(res), ["종료"])
+        self.assertEqual(res.json()["results"][0]["days_left"], 0)
+
+        res = self.client.get(self.url + "?ordering=days_left&status=open")
+        self.assertEqual(self.titles(res), ["소수", "정원 없음", "여유"])
+
+    def test_unknown_status_is_400(self):
+        self.assertEqual(self.client.get(self.url + "?status=soon").status_code, 400)
+
+
+class LectureTagTests(APITestCase):
+
+    url = "/api/lectures/"
+
+    def setUp(self):
+        cache.clear()
+        for title, tags in (
+            ("한식 기초", "한식, 기초"),
+            ("한식 심화", "한식,심화,한식"),
+            ("제과", "제과 ,기초"),
+            ("태그 없음", ""),
+        ):
+            Lecture.objects.create(type="academy", title=title, tags=tags)
+
+    def titles(self, res):
+        return sorted(row["title"] for row in res.json()["results"])
+
+    def test_save_syncs_tag_set(self):
+        lecture = Lecture.objects.get(title="한식 심화")
+        self.assertEqual(
+            sorted(lecture.tag_set.values_list("name", flat=True)), ["심화", "한식"]
+        )
+        lecture.tags = "양식"
+        lecture.save()
+        self.assertEqual(list(lecture.tag_set.values_list("name", flat=True)), ["양식"])
+
+    def test_tag_all_and_any_filters(self):
+        self.assertEqual(
+            self.titles(self.client.get(self.url + "?tag=한식")), ["한식 기초", "한식 심화"]
+        )
+        self.assertEqual(
+            self.titles(self.client.get(self.url + "?tag=한식&tag=기초")), ["한식 기초"]
+        )
+        res = self.client.get(self.url + "?tags_any=심화,제과")
+        self.assertEqual(self.titles(res), ["제과", "한식 심화"])
+        # 여러 태그가 맞아도 강의는 한 번만
+        res = self.client.get(self.url + "?tags_any=한식,기초")
+        self.assertEqual(res.json()["total_count"], 3)
+
+    def test_facets_are_cached_until_lectures_change(self):
+        res = self.client.get(self.url + "tags/")
+        self.assertEqual(
+            res.json(),
+            [
+                {"name": "기초", "count": 2},
+                {"name": "한식", "count": 2},
+                {"name": "심화", "count": 1},
+                {"name": "제과", "count": 1},
+            ],
+        )
+        with self.assertNumQueries(0):
+            self.client.get(self.url + "tags/")
+
+        Lecture.objects.get(title="제과").delete()
+        facets = {f["name"]: f["count"] for f in self.client.get(self.url + "tags/").json()}
+        self.assertEqual(facets, {"기초": 1, "한식": 2, "심화": 1})
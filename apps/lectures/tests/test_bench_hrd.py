@@ -0,0 +1,53 @@
+# apps/lectures/tests/test_bench_hrd.py
+import csv
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import LiveServerTestCase
+from django.utils import timezone
+
+from apps.lectures.hrd import sync_courses
+from apps.lectures.management.commands.bench_hrd import CSV_HEADER
+from apps.lectures.tests.factories import ORGAN, scn_item
+
+
+class BenchHRDCommandTests(LiveServerTestCase):
+
+    def setUp(self):
+        cache.clear()
+        t = timezone.localdate()
+        items = [scn_item("A", 1, t + timedelta(days=3), t + timedelta(days=30))]
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_page",
+            side_effect=lambda organ, s, e, page_num, page_size=100: (
+                items if page_num == 1 else []
+            ),
+        ):
+            sync_courses(ORGAN)
+
+    def test_list_run_writes_csv_and_summary(self):
+        out = StringIO()
+        with tempfile.TemporaryDirectory() as tmp:
+            call_command(
+                "bench_hrd",
+                base_url=self.live_server_url,
+                endpoints=["list"],
+                requests=6,
+                concurrency=3,
+                out_dir=tmp,
+                stdout=out,
+            )
+            (path,) = Path(tmp).glob("bench_hrd_list_*.csv")
+            with open(path, encoding="utf-8-sig", newline="") as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(tuple(rows[0]), CSV_HEADER)
+        self.assertEqual([r[0] for r in rows[1:]], [str(i) for i in range(1, 7)])
+        self.assertTrue(all(r[1] in ("HIT", "MISS") and r[2] for r in rows[1:]))
+        self.assertIn("p95", out.getvalue())
+        self.assertIn("오류 0", out.getvalue())
@@ -0,0 +1,39 @@
+# apps/lectures/tests/test_conditional_get.py
+from datetime import timedelta
+
+from apps.lectures.hrd import sync_courses
+from utils.testing import ConditionalGetAssertions
+
+from .factories import ORGAN, BaseHRDTest, scn_item
+
+
+class HRDConditionalGetTests(ConditionalGetAssertions, BaseHRDTest):
+
+    def test_hrd_list_etag_follows_dataset_and_query(self):
+        t = self.today
+        items = [scn_item("A", 1, t + timedelta(days=5), t + timedelta(days=30))]
+        with self.patch_pages([items]):
+            sync_courses(ORGAN)
+
+        first = self.req_get(self.list_url)
+        etag = first["ETag"]
+        # 쿼리가 다르면 다른 ETag
+        self.assertNotEqual(self.req_get(self.list_url + "?sort=ASC")["ETag"], etag)
+
+        # 캐시 HIT + 304 는 DB 를 건드리지 않음
+        with self.assertNumQueries(0):
+            res = self.revalidate(self.list_url, etag)
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res["X-Cache"], "HIT")
+
+        def resync():
+            items.append(
+                scn_item("B", 1, t + timedelta(days=9), t + timedelta(days=40))
+            )
+            with self.patch_pages([items]):
+                sync_courses(ORGAN)
+
+        resync()
+        res = self.revalidate(self.list_url, etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res["ETag"], etag)
@@ -0,0 +1,440 @@
+# apps/lectures/tests/test_hrd_api.py
+from datetime import timedelta
+from unittest import mock
+
+import requests
+from django.core.cache import cache
+
+from apps.lectures import hrd
+from apps.lectures.hrd import lookup_torg_id, sync_courses
+from apps.lectures.models import HRDCourse, Lecture, UpstreamSnapshot
+from utils.breaker import CircuitOpenError
+
+from .factories import ORGAN, BaseHRDTest, detail_payload, scn_item
+
+
+class HRDSyncTests(BaseHRDTest):
+
+    def test_sync_upserts_and_removes_missing_degrees(self):
+        t = self.today
+        items = [
+            scn_item("AIG1", 1, t + timedelta(days=10), t + timedelta(days=40)),
+            scn_item("AIG1", 2, t + timedelta(days=50), t + timedelta(days=80)),
+            scn_item("AIG2", 1, t, t, traStartDate=""),  # 날짜 없음 → 제외
+        ]
+        with self.patch_pages([items]):
+            self.assertEqual(sync_courses(ORGAN), (2, 0))
+        self.assertEqual(HRDCourse.objects.count(), 2)
+
+        # 2회차 인원 변경 + 1회차 삭제
+        updated = [
+            scn_item(
+                "AIG1",
+                2,
+                t + timedelta(days=50),
+                t + timedelta(days=80),
+                regCourseMan="20",
+            )
+        ]
+        with self.patch_pages([updated]):
+            self.assertEqual(sync_courses(ORGAN), (1, 1))
+        course = HRDCourse.objects.get()
+        self.assertEqual((course.degree, course.applied, course.remaining), ("2", 20, 0))
+
+    def test_list_reads_from_table_without_upstream(self):
+        t = self.today
+        with self.patch_pages(
+            [
+                [
+                    scn_item("A", 1, t + timedelta(days=3), t + timedelta(days=30)),
+                    scn_item("B", 1, t - timedelta(days=60), t - timedelta(days=1)),
+                ]
+            ]
+        ):
+            sync_courses(ORGAN)
+
+        with mock.patch("apps.lectures.hrd.fetch_course_page") as upstream:
+            res = self.req_get(self.list_url)
+            upstream.assert_not_called()
+
+        self.assertEqual(res.status_code, 200)
+        data = res.json()
+        self.assertEqual(data["total_count"], 1)  # 종료된 과정 제외
+        row = data["results"][0]
+        self.assertEqual(row["process_id"], "A")
+        self.assertEqual(row["remaining_slots"], 15)
+        self.assertEqual(row["status_label"], "모집중")
+        self.assertEqual(row["d_day"], "D-3")
+        self.assertEqual(row["torg_id"], "500020000001")
+
+    def test_list_never_syncs_inside_request(self):
+        with mock.patch("apps.lectures.hrd.fetch_course_page") as upstream:
+            # 동기화 대상 밖의 기관 → 404, 동기화 이력 없는 대상 기관 → 빈 목록
+            res = self.req_get(self.list_url + "?org=아무기관")
+            self.assertEqual(res.status_code, 404)
+            self.assertEqual(self.req_get("/api/lectures/all/?org=아무기관").status_code, 404)
+            res = self.req_get(self.list_url)
+            upstream.assert_not_called()
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["total_count"], 0)
+
+
+class HRDTorgLookupTests(BaseHRDTest):
+
+    def test_lookup_reads_index_filled_by_sync(self):
+        t = self.today
+        with self.patch_pages([[scn_item("AIG9", 3, t, t + timedelta(days=5))]]):
+            sync_courses(ORGAN)
+
+        with mock.patch("apps.lectures.hrd.fetch_trpr_page") as upstream:
+            self.assertEqual(lookup_torg_id("AIG9", "3"), "500020000001")
+            upstream.assert_not_called()
+
+    def test_lookup_scans_pages_concurrently_and_remembers(self):
+        t = self.today
+        # 201건(3페이지) 중 마지막 페이지에 목표 회차
+        pages = {
+            1: [scn_item("AIG7", n, t, t, trainstCstmrId="X") for n in range(1, 101)],
+            2: [scn_item("AIG7", n, t, t, trainstCstmrId="X") for n in range(101, 201)],
+            3: [scn_item("AIG7", 250, t, t, trainstCstmrId="TORG-250")],
+        }
+        requested = []
+
+        def fake(trpr_id, page_num, page_size=100):
+            requested.append(page_num)
+            return pages.get(page_num, []), 201
+
+        with mock.patch("apps.lectures.hrd.fetch_trpr_page", side_effect=fake):
+            self.assertEqual(lookup_torg_id("AIG7", "250"), "TORG-250")
+        self.assertEqual(sorted(requested), [1, 2, 3])  # 건수 기준 3페이지만
+
+        # 두 번째 조회는 캐시에서 바로, 동기화 대상이 아닌 회차는 HRDCourse 에 넣지 않음
+        with mock.patch("apps.lectures.hrd.fetch_trpr_page") as upstream:
+            self.assertEqual(lookup_torg_id("AIG7", "250"), "TORG-250")
+            upstream.assert_not_called()
+        self.assertFalse(HRDCourse.objects.filter(trpr_id="AIG7").exists())
+
+    def test_lookup_fills_missing_torg_on_synced_rows_only(self):
+        t = self.today
+        with self.patch_pages([[scn_item("AIG8", 1, t, t + timedelta(days=5))]]):
+            sync_courses(ORGAN)
+        HRDCourse.objects.update(torg_id=None)
+        pages = [scn_item("AIG8", n, t, t, trainstCstmrId="T8") for n in (1, 2)]
+
+        with mock.patch(
+            "apps.lectures.hrd.fetch_trpr_page", return_value=(pages, 2)
+        ):
+            self.assertEqual(lookup_torg_id("AIG8", "2"), "T8")
+        course = HRDCourse.objects.get()
+        self.assertEqual((course.degree, course.torg_id, course.organ_name), ("1", "T8", ORGAN))
+
+
+class HRDDatasetListTests(BaseHRDTest):
+
+    def setUp(self):
+        super().setUp()
+        t = self.today
+        items = [
+            scn_item("A", 1, t + timedelta(days=5), t + timedelta(days=30)),
+            scn_item("B", 1, t + timedelta(days=20), t + timedelta(days=50),
+                     regCourseMan="20"),
+            scn_item("C", 1, t - timedelta(days=3), t + timedelta(days=10)),
+        ]
+        with self.patch_pages([items]):
+            sync_courses(ORGAN)
+
+    def ids(self, res):
+        return [row["process_id"] for row in res.json()["results"]]
+
+    def test_one_cache_entry_serves_every_page_and_filter(self):
+        first = self.req_get(self.list_url + "?page_size=2")
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(self.ids(first), ["B", "A"])
+
+        with self.assertNumQueries(0):
+            res = self.req_get(self.list_url + "?page=2&page_size=2")
+            self.assertEqual(res["X-Cache"], "HIT")
+            self.assertEqual(self.ids(res), ["C"])
+
+            res = self.req_get(self.list_url + "?sort=ASC")
+            self.assertEqual(self.ids(res), ["C", "A", "B"])
+
+            res = self.req_get(self.list_url + "?ordering=-remaining")
+            self.assertEqual(self.ids(res), ["A", "C", "B"])
+
+            res = self.req_get(self.list_url + "?available=1&status=모집중")
+            self.assertEqual(self.ids(res), ["A"])
+
+            t = self.today
+            res = self.req_get(
+                self.list_url
+                + f"?start_from={t.isoformat()}&start_to={(t + timedelta(days=10)).isoformat()}"
+            )
+            self.assertEqual(self.ids(res), ["A"])
+
+    def test_bad_date_filter_is_rejected(self):
+        res = self.req_get(self.list_url + "?start_from=2025/01/01")
+        self.assertEqual(res.status_code, 400)
+
+    def test_day_dependent_fields_are_computed_per_request(self):
+        self.req_get(self.list_url)  # 데이터셋 캐시 생성
+        tomorrow = self.today + timedelta(days=1)
+        later = self.today + timedelta(days=11)  # C 종료, A 진행중
+
+        with self.assertNumQueries(0):
+            with mock.patch(
+                "apps.lectures.views_hrd.timezone.localdate", return_value=tomorrow
+            ):
+                res = self.req_get(self.list_url + "?ordering=start_date")
+            self.assertEqual(res["X-Cache"], "HIT")
+            row_a = res.json()["results"][1]
+            self.assertEqual((row_a["process_id"], row_a["d_day"]), ("A", "D-4"))
+
+            with mock.patch(
+                "apps.lectures.views_hrd.timezone.localdate", return_value=later
+            ):
+                res = self.req_get(self.list_url + "?ordering=start_date")
+            self.assertEqual(self.ids(res), ["A", "B"])
+            self.assertEqual(res.json()["results"][0]["status_label"], "진행중")
+
+
+class HRDBatchDetailTests(BaseHRDTest):
+
+    def setUp(self):
+        super().setUp()
+        self.batch_url = "/api/lectures/hrd/batch/"
+        # 워커 스레드의 DB 쓰기는 테스트 트랜잭션 밖에서 커밋되므로 스냅샷 저장은 생략
+        patcher = mock.patch("apps.lectures.hrd.save_snapshot")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def detail(self, trpr_id, degree, torg_id):
+        return detail_payload(self.today, trpr_id)
+
+    def test_batch_fetches_misses_once_and_serves_hits_from_cache(self):
+        items = [
+            {"trpr_id": "A", "tracse_tme": "1", "torg_id": "T1"},
+            {"trpr_id": "B", "tracse_tme": "2", "torg_id": "T1"},
+        ]
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_detail", side_effect=self.detail
+        ) as fetch:
+            res = self.client.post(self.batch_url, {"items": items}, format="json")
+            self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res["X-Cache-Misses"], "2")
+        results = res.json()["results"]
+        self.assertEqual(set(results), {"A:1", "B:2"})
+        self.assertEqual(results["A:1"]["d_day"], "D-7")
+
+        # 같은 목록 재요청 → 원격 호출 없이 전부 캐시
+        with mock.patch("apps.lectures.hrd.fetch_course_detail") as fetch:
+            res = self.client.post(self.batch_url, {"items": items}, format="json")
+            fetch.assert_not_called()
+        self.assertEqual((res["X-Cache-Hits"], res["X-Cache-Misses"]), ("2", "0"))
+
+        # 단건 상세도 같은 캐시 키를 공유
+        with mock.patch("apps.lectures.hrd.fetch_course_detail") as fetch:
+            res = self.req_get("/api/lectures/hrd/A/?tracse_tme=1&torg_id=T1")
+            fetch.assert_not_called()
+        self.assertEqual(res["X-Cache"], "HIT")
+        self.assertEqual(res.json()["status_label"], "모집중")
+
+    def test_failed_item_is_reported_without_failing_batch(self):
+        def flaky(trpr_id, degree, torg_id):
+            if trpr_id == "BAD":
+                raise RuntimeError("boom")
+            return self.detail(trpr_id, degree, torg_id)
+
+        items = [
+            {"trpr_id": "OK", "tracse_tme": "1", "torg_id": "T1"},
+            {"trpr_id": "BAD", "tracse_tme": "1", "torg_id": "T1"},
+        ]
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_detail", side_effect=flaky
+        ):
+            res = self.client.post(self.batch_url, {"items": items}, format="json")
+        results = res.json()["results"]
+        self.assertEqual(results["OK:1"]["course_id"], "OK")
+        self.assertIn("error", results["BAD:1"])
+        # 실패 건은 짧은 TTL 로 부정 캐시
+        self.assertEqual(cache.get("hrd:detail:BAD:1:T1")["status"], 500)
+
+    def test_batch_closes_worker_db_connections(self):
+        items = [
+            {"trpr_id": "A", "tracse_tme": "1", "torg_id": "T1"},
+            {"trpr_id": "B", "tracse_tme": "1", "torg_id": "T1"},
+        ]
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_detail", side_effect=self.detail
+        ), mock.patch("apps.lectures.views_hrd.connection") as conn:
+            res = self.client.post(self.batch_url, {"items": items}, format="json")
+        self.assertEqual(res.status_code, 200)
+        # CONN_MAX_AGE 와 무관하게 워커가 맡은 건마다 커넥션을 닫음
+        self.assertEqual(conn.close.call_count, 2)
+
+    def test_batch_requires_items(self):
+        res = self.client.post(self.batch_url, {"items": []}, format="json")
+        self.assertEqual(res.status_code, 400)
+
+    def test_batch_rejects_non_object_body(self):
+        item = {"trpr_id": "A", "tracse_tme": "1"}
+        for body in ([item], "A", 1, {}):
+            res = self.client.post(self.batch_url, body, format="json")
+            self.assertEqual(res.status_code, 400, body)
+
+
+class HRDDetailCacheTests(BaseHRDTest):
+
+    url = "/api/lectures/hrd/A/?tracse_tme=1&torg_id=T1"
+
+    def detail_ttls(self, cache_set):
+        return [
+            c.args[2] for c in cache_set.call_args_list
+            if c.args[0].startswith("hrd:detail:")
+        ]
+
+    def test_success_is_cached_for_detail_ttl(self):
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_detail",
+            return_value=detail_payload(self.today, "A"),
+        ) as fetch, mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+            first = self.req_get(self.url)
+            second = self.req_get(self.url)
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual((first["X-Cache"], second["X-Cache"]), ("MISS", "HIT"))
+        self.assertEqual(second.json()["remaining_slots"], 15)
+        self.assertEqual(self.detail_ttls(cache_set), [hrd.DETAIL_TTL])
+
+    def test_not_found_and_errors_are_negative_cached(self):
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_detail",
+            side_effect=hrd.HRDCourseNotFound("A"),
+        ) as fetch, mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+            self.assertEqual(self.req_get(self.url).status_code, 404)
+            res = self.req_get(self.url)
+        self.assertEqual((res.status_code, res["X-Cache"]), (404, "HIT"))
+        self.assertEqual(fetch.call_count, 1)
+        self.assertEqual(self.detail_ttls(cache_set), [hrd.DETAIL_NOT_FOUND_TTL])
+
+        cache.clear()
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_detail", side_effect=RuntimeError("503")
+        ), mock.patch.object(cache, "set", wraps=cache.set) as cache_set:
+            self.assertEqual(self.req_get(self.url).status_code, 500)
+        self.assertEqual(self.detail_ttls(cache_set), [hrd.DETAIL_ERROR_TTL])
+
+    def test_upstream_error_text_never_reaches_client_or_cache(self):
+        leak = requests.HTTPError(
+            "503 Server Error for url: https://www.work24.go.kr/x.do?authKey=SECRET"
+        )
+        with mock.patch("apps.lectures.hrd.fetch_course_detail", side_effect=leak):
+            res = self.req_get(self.url)
+        self.assertEqual(res.status_code, 500)
+        self.assertEqual(res.json()["error"], hrd.DETAIL_ERROR_MESSAGE)
+        self.assertNotIn("SECRET", str(cache.get("hrd:detail:A:1:T1")))
+
+        with mock.patch(
+            "apps.lectures.views_hrd.load_list_dataset",
+            side_effect=requests.ConnectionError("https://x.do?authKey=SECRET"),
+        ):
+            res = self.req_get(self.list_url)
+        self.assertEqual(res.status_code, 500)
+        self.assertNotIn("SECRET", res.content.decode())
+
+    def test_missing_degree_is_rejected_before_cache(self):
+        res = self.req_get("/api/lectures/hrd/A/")
+        self.assertEqual(res.status_code, 400)
+
+
+class HRDSnapshotFallbackTests(BaseHRDTest):
+
+    url = "/api/lectures/hrd/A/?tracse_tme=1&torg_id=T1"
+
+    def test_detail_serves_last_good_snapshot_when_circuit_open(self):
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_detail",
+            return_value=detail_payload(self.today, "A"),
+        ):
+            self.assertEqual(self.req_get(self.url)["X-Cache"], "MISS")
+        self.assertTrue(
+            UpstreamSnapshot.objects.filter(key="hrd:detail:A:1:T1").exists()
+        )
+
+        cache.clear()  # 재시작 등으로 캐시가 비었다고 가정
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_detail",
+            side_effect=CircuitOpenError("www.work24.go.kr"),
+        ):
+            res = self.req_get(self.url)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res["X-Cache"], "HIT-FALLBACK")
+        self.assertEqual(res.json()["remaining_slots"], 15)
+        self.assertEqual(res["X-Circuit"], "closed")
+
+
+class CombinedLectureListTests(BaseHRDTest):
+
+    url = "/api/lectures/all/"
+
+    def setUp(self):
+        super().setUp()
+        t = self.today
+        items = [
+            scn_item("H1", 1, t + timedelta(days=30), t + timedelta(days=60)),
+            scn_item("H2", 1, t + timedelta(days=10), t + timedelta(days=40),
+                     regCourseMan="20"),
+            scn_item("H3", 1, t - timedelta(days=40), t - timedelta(days=1)),  # 종료
+        ]
+        with self.patch_pages([items]):
+            sync_courses(ORGAN)
+        for title, offset in (("L1", 40), ("L2", 20), ("L3", 10), ("L4", None)):
+            Lecture.objects.create(
+                type="academy",
+                title=title,
+                start_date=t + timedelta(days=offset) if offset else None,
+                capacity=10,
+                applied=3,
+            )
+
+    def titles(self, res):
+        return [row["title"] for row in res.json()["results"]]
+
+    def test_merges_by_start_date_and_paginates(self):
+        res = self.req_get(self.url + "?page_size=3")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res.json()["total_count"], 6)
+        # 시작일 같으면 자체 강의 먼저, 시작일 없는 강의는 맨 뒤
+        self.assertEqual(self.titles(res), ["L1", "H1 과정", "L2"])
+
+        # 데이터셋 캐시 HIT → COUNT + 정렬 키 + 페이지 강의 조회만
+        with self.assertNumQueries(3):
+            res = self.req_get(self.url + "?page=2&page_size=3")
+        self.assertEqual(res["X-Cache"], "HIT")
+        self.assertEqual(self.titles(res), ["L3", "H2 과정", "L4"])
+
+        row = res.json()["results"][1]
+        self.assertEqual(
+            (row["remain"], row["status_label"], row["d_day"], row["id"]),
+            (0, "모집 마감", "D-10", None),
+        )
+        self.assertEqual(res.json()["results"][0]["remain"], 7)
+
+    def test_reads_synced_courses_without_upstream_call(self):
+        Lecture.objects.all().delete()
+        with mock.patch("apps.lectures.hrd.upstream.get") as get:
+            res = self.req_get(self.url)
+        get.assert_not_called()
+        self.assertEqual(self.titles(res), ["H1 과정", "H2 과정"])
+
+    def test_page_out_of_range_is_404(self):
+        self.assertEqual(self.req_get(self.url + "?page=9").status_code, 404)
+
+    def test_dataset_failure_hides_upstream_error_text(self):
+        with mock.patch(
+            "apps.lectures.views_combined.load_list_dataset",
+            side_effect=requests.ConnectionError("https://x.do?authKey=SECRET"),
+        ):
+            res = self.req_get(self.url)
+        self.assertEqual(res.status_code, 500)
+        self.assertNotIn("SECRET", res.content.decode())
@@ -0,0 +1,111 @@
+# apps/lectures/tests/test_hrd_async.py
+from datetime import timedelta
+from pathlib import Path
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.test import AsyncClient, TestCase
+from django.utils import timezone
+
+from apps.lectures.hrd import sync_courses
+from apps.lectures.models import Lecture
+from apps.lectures.tests.factories import ORGAN, scn_item
+
+FIXTURES = Path(__file__).resolve().parent.parent / "fixtures" / "work24"
+
+
+class HRDAsyncViewTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.client = AsyncClient()
+        self.today = timezone.localdate()
+
+    async def test_list_matches_sync_view(self):
+        t = self.today
+        items = [scn_item("A", 1, t + timedelta(days=3), t + timedelta(days=30))]
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_page",
+            side_effect=lambda organ, s, e, page_num, page_size=100: (
+                items if page_num == 1 else []
+            ),
+        ):
+            await sync_to_async(sync_courses)(ORGAN)
+
+        res = await self.client.get("/api/lectures/async/hrd/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(res["X-Cache"], "MISS")
+        self.assertEqual(res.json()["results"][0]["d_day"], "D-3")
+
+        sync_res = await self.client.get("/api/lectures/hrd/")
+        self.assertEqual(sync_res["X-Cache"], "HIT")  # 같은 데이터셋 캐시 공유
+        self.assertEqual(sync_res.json(), res.json())
+
+    async def test_detail_fetches_through_async_client_and_caches(self):
+        content = (FIXTURES / "310L03_detail.xml").read_bytes()
+        url = "/api/lectures/async/hrd/AIG2025100000/?tracse_tme=1&torg_id=T1"
+        with mock.patch(
+            "apps.lectures.hrd.upstream_async.get", return_value=content
+        ) as get:
+            first = await self.client.get(url)
+            second = await self.client.get(url)
+        self.assertEqual(get.await_count, 1)
+        self.assertEqual((first["X-Cache"], second["X-Cache"]), ("MISS", "HIT"))
+        self.assertEqual(first.json()["remaining_slots"], 6)
+
+    async def test_detail_looks_up_torg_id_with_async_client(self):
+        t = self.today
+        pages = {
+            1: [scn_item("AIG7", n, t, t, trainstCstmrId="X") for n in range(1, 101)],
+            2: [scn_item("AIG7", 250, t, t, trainstCstmrId="TORG-250")],
+        }
+
+        async def fake_page(trpr_id, page_num, page_size=100):
+            return pages.get(page_num, []), 101
+
+        content = (FIXTURES / "310L03_detail.xml").read_bytes()
+        url = "/api/lectures/async/hrd/AIG7/?tracse_tme=250"
+        with mock.patch(
+            "apps.lectures.hrd.afetch_trpr_page", side_effect=fake_page
+        ) as scan, mock.patch(
+            "apps.lectures.hrd.upstream_async.get", return_value=content
+        ) as get, mock.patch("apps.lectures.hrd.fetch_trpr_page") as sync_scan:
+            res = await self.client.get(url)
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(scan.await_count, 2)
+        sync_scan.assert_not_called()  # 동기 역조회(스레드)로 넘어가지 않음
+        self.assertEqual(get.await_args.kwargs["params"]["srchTorgId"], "TORG-250")
+
+    async def test_combined_merges_cached_dataset_with_lectures(self):
+        t = self.today
+        items = [scn_item("A", 1, t + timedelta(days=3), t + timedelta(days=30))]
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_page",
+            side_effect=lambda organ, s, e, page_num, page_size=100: (
+                items if page_num == 1 else []
+            ),
+        ):
+            await sync_to_async(sync_courses)(ORGAN)
+        await Lecture.objects.acreate(
+            type="academy", title="자체 강의", start_date=t + timedelta(days=5)
+        )
+
+        res = await self.client.get("/api/lectures/async/all/")
+        self.assertEqual(res.status_code, 200)
+        self.assertEqual(
+            [r["title"] for r in res.json()["results"]], ["자체 강의", "A 과정"]
+        )
+        sync_res = await self.client.get("/api/lectures/all/")
+        self.assertEqual(sync_res["X-Cache"], "HIT")
+        self.assertEqual(sync_res.json(), res.json())
+
+    async def test_list_failures_hide_upstream_error_text(self):
+        leak = ConnectionError("https://x.do?authKey=SECRET")
+        with mock.patch(
+            "apps.lectures.views_async.load_list_dataset", side_effect=leak
+        ):
+            for url in ("/api/lectures/async/hrd/", "/api/lectures/async/all/"):
+                res = await self.client.get(url)
+                self.assertEqual(res.status_code, 500)
+                self.assertNotIn("SECRET", res.content.decode())
@@ -0,0 +1,62 @@
+# apps/lectures/tests/test_hrd_cache.py
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from utils import cache as swr
+
+
+class StaleWhileRevalidateTests(SimpleTestCase):
+    """utils.cache.get_or_refresh 상태 전이 (HIT/STALE/MISS/HIT-FALLBACK)"""
+
+    KEY = "hrd:list:test"
+
+    def setUp(self):
+        cache.clear()
+        self.now = 1_000_000.0
+        patcher = mock.patch("utils.cache.time.time", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        # 백그라운드 갱신을 동기 실행으로 대체
+        inline = mock.patch(
+            "utils.cache._refresh_in_background", side_effect=swr._refresh
+        )
+        self.refresh = inline.start()
+        self.addCleanup(inline.stop)
+
+    def get(self, loader):
+        return swr.get_or_refresh(self.KEY, loader, fresh_ttl=10, stale_ttl=100)
+
+    def test_miss_then_hit(self):
+        self.assertEqual(self.get(lambda: "v1"), ("v1", swr.MISS))
+        self.assertEqual(self.get(lambda: "v2"), ("v1", swr.HIT))
+
+    def test_stale_serves_old_value_and_refreshes_once(self):
+        self.get(lambda: "v1")
+        self.now += 20
+        # 다른 워커가 락을 쥐고 있으면 갱신 없이 STALE
+        cache.add(f"{self.KEY}:lock", 1, 30)
+        self.assertEqual(self.get(lambda: "v2"), ("v1", swr.STALE))
+        self.refresh.assert_not_called()
+
+        cache.delete(f"{self.KEY}:lock")
+        self.assertEqual(self.get(lambda: "v2"), ("v1", swr.STALE))
+        self.assertEqual(self.refresh.call_count, 1)
+        self.assertEqual(self.get(lambda: "v3"), ("v2", swr.HIT))
+
+    def test_hard_expired_failure_falls_back_to_last_value(self):
+        self.get(lambda: "v1")
+        self.now += 200
+
+        def boom():
+            raise RuntimeError("upstream down")
+
+        self.assertEqual(self.get(boom), ("v1", swr.FALLBACK))
+
+    def test_failure_without_entry_raises(self):
+        def boom():
+            raise RuntimeError("upstream down")
+
+        with self.assertRaises(RuntimeError):
+            self.get(boom)
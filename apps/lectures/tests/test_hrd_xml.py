@@ -0,0 +1,32 @@
+# apps/lectures/tests/test_hrd_xml.py
+from pathlib import Path
+
+import xmltodict
+from django.test import SimpleTestCase
+
+from apps.lectures.hrd_xml import LIST_FIELDS, first_scn, parse_scn_list
+
+FIXTURES = Path(__file__).resolve().parents[1] / "fixtures" / "work24"
+
+
+class StreamingParserTests(SimpleTestCase):
+
+    def test_list_rows_match_xmltodict_for_used_fields(self):
+        content = (FIXTURES / "310L01_100rows.xml").read_bytes()
+        rows, total = parse_scn_list(content)
+        expected = xmltodict.parse(content)["HRDNet"]["srchList"]["scn_list"]
+
+        self.assertEqual(total, 100)
+        self.assertEqual(len(rows), len(expected))
+        for row, exp in zip(rows, expected):
+            self.assertEqual(row, {k: exp[k] for k in LIST_FIELDS if k in exp})
+
+    def test_single_record_and_empty_response(self):
+        detail = first_scn((FIXTURES / "310L03_detail.xml").read_bytes())
+        self.assertEqual(detail["totFxnum"], "20")
+        self.assertEqual(detail["trStaDt"], "2025-11-03")
+        self.assertNotIn("addr1", detail)  # 쓰지 않는 필드는 버림
+
+        empty = b"<HRDNet><scn_cnt>0</scn_cnt><srchList/></HRDNet>"
+        self.assertEqual(parse_scn_list(empty), ([], 0))
+        self.assertEqual(first_scn(empty), {})
@@ -0,0 +1,153 @@
+# apps/lectures/tests/test_lecture_index.py
+from datetime import timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+
+from apps.lectures.hrd import sync_courses
+from apps.lectures.models import Lecture, LectureIndex
+
+from .factories import ORGAN, BaseHRDTest, scn_item
+
+
+class LectureIndexTests(BaseHRDTest):
+
+    url = "/api/lectures/index/"
+
+    def setUp(self):
+        super().setUp()
+        self.items = [
+            scn_item("H1", 1, self.day(30), self.day(60)),
+            scn_item("H2", 1, self.day(10), self.day(40), regCourseMan="20"),
+        ]
+        self.sync()
+
+    def day(self, offset):
+        return self.today + timedelta(days=offset)
+
+    def sync(self):
+        with self.patch_pages([self.items]):
+            sync_courses(ORGAN)
+
+    def lecture(self, title, offset, **extra):
+        return Lecture.objects.create(
+            type="academy",
+            title=title,
+            start_date=self.day(offset) if offset is not None else None,
+            end_date=self.day(offset + 30) if offset is not None else None,
+            capacity=10,
+            applied=3,
+            **extra,
+        )
+
+    def titles(self, res):
+        return [row["title"] for row in res.json()["results"]]
+
+    def test_lecture_save_and_delete_keep_index_current(self):
+        lecture = self.lecture("L1", 5, tags="한식, 제과 ,한식")
+        entry = LectureIndex.objects.get(source="academy", source_key=str(lecture.pk))
+        self.assertEqual((entry.remaining, entry.tags), (7, ",한식,제과,"))
+        self.assertCountEqual(entry.tag_set.values_list("name", flat=True), ["한식", "제과"])
+
+        lecture.applied = 10
+        lecture.tags = "제과, 디저트"
+        lecture.save()
+        entry.refresh_from_db()
+        self.assertEqual(entry.remaining, 0)
+        self.assertCountEqual(entry.tag_set.values_list("name", flat=True), ["제과", "디저트"])
+
+        lecture.delete()
+        self.assertFalse(LectureIndex.objects.filter(source="academy").exists())
+
+    def test_hrd_sync_upserts_and_drops_removed_degrees(self):
+        hrd = LectureIndex.objects.filter(source="hrd")
+        self.assertEqual(
+            sorted(hrd.values_list("source_key", "remaining")),
+            [("H1:1", 15), ("H2:1", 0)],
+        )
+
+        self.items = [scn_item("H1", 1, self.day(30), self.day(60), regCourseMan="12")]
+        self.sync()
+        self.assertEqual(
+            list(hrd.values_list("source_key", "remaining")), [("H1:1", 8)]
+        )
+
+    def test_keyset_pages_follow_start_date_with_nulls_last(self):
+        for title, offset in (("L1", 40), ("L2", 30), ("L3", None), ("L4", 5)):
+            self.lecture(title, offset)
+
+        seen = []
+        url = self.url + "?page_size=2"
+        while url:
+            with self.assertNumQueries(1):  # COUNT/OFFSET 없이 페이지 1쿼리
+                res = self.req_get(url)
+            seen += self.titles(res)
+            url = res.json()["next"]
+        # 같은 시작일이면 나중에 색인된 행 먼저
+        self.assertEqual(seen, ["L1", "L2", "H1 과정", "H2 과정", "L4", "L3"])
+
+        self.assertEqual(self.req_get(self.url + "?cursor=bad").status_code, 404)
+
+    def test_filters_are_column_queries(self):
+        self.lecture("한식 기초", 3, tags="한식,기초")
+        self.lecture("종료 강의", -60, tags="한식")
+        self.lecture("제과", 20, tags="제과")
+
+        self.assertEqual(self.titles(self.req_get(self.url + "?tag=한식")), ["한식 기초"])
+        # 부분 문자열은 일치하지 않음 (조인 테이블 정확히 일치)
+        self.assertEqual(self.titles(self.req_get(self.url + "?tag=한")), [])
+        self.assertEqual(
+            self.titles(self.req_get(self.url + "?tag=한식&tag=기초")), ["한식 기초"]
+        )
+        self.assertEqual(
+            self.titles(self.req_get(self.url + "?tags_any=제과,기초")), ["제과", "한식 기초"]
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            self.req_get(self.url + "?tag=한식&tags_any=제과,기초")
+        sql = ctx.captured_queries[0]["sql"]
+        self.assertIn("EXISTS", sql)
+        self.assertNotIn("LIKE", sql)
+        self.assertEqual(
+            self.titles(self.req_get(self.url + "?tag=한식&include_closed=1")),
+            ["한식 기초", "종료 강의"],
+        )
+        self.assertEqual(
+            self.titles(self.req_get(self.url + "?source=hrd&available=1")), ["H1 과정"]
+        )
+        self.assertEqual(self.titles(self.req_get(self.url + "?q=기초")), ["한식 기초"])
+        self.assertEqual(
+            self.titles(self.req_get(self.url + "?status=모집 마감")), ["H2 과정"]
+        )
+        self.assertEqual(
+            self.titles(self.req_get(self.url + "?status=모집중&source=academy")),
+            ["제과", "한식 기초"],
+        )
+
+        row = self.req_get(self.url + "?source=hrd").json()["results"][0]
+        self.assertEqual(
+            (row["id"], row["process_id"], row["process_time"], row["d_day"]),
+            (None, "H1", "1", "D-30"),
+        )
+        self.assertEqual(self.req_get(self.url + "?start_from=bad").status_code, 400)
+
+    def test_rebuild_command_restores_index(self):
+        self.lecture("L1", 5, tags="한식")
+        LectureIndex.objects.all().delete()
+        out = StringIO()
+        call_command("rebuild_lecture_index", stdout=out)
+        self.assertIn("자체 강의 1건, HRD 2건", out.getvalue())
+        self.assertEqual(LectureIndex.objects.count(), 3)
+        self.assertEqual(self.titles(self.req_get(self.url + "?tag=한식")), ["L1"])
+
+
+    def test_keyset_order_reads_start_index(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("작은 표에서 색인 사용 여부는 SQLite 계획기로만 확인")
+        qs = LectureIndex.objects.order_by(F("start_date").desc(nulls_last=True), "-pk")
+        plan = qs.explain()
+        # 정렬 식이 색인과 같아야 별도 정렬(TEMP B-TREE) 없이 색인 순서로 읽음
+        self.assertIn("USING INDEX lecture_idx_start_id", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
@@ -0,0 +1,77 @@
+# apps/lectures/tests/test_reservations.py
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TransactionTestCase
+from rest_framework.test import APITestCase
+
+from apps.lectures.models import Lecture, LectureIndex, SeatReservation
+
+
+class SeatReservationTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()  # 스로틀 카운터
+        self.lecture = Lecture.objects.create(
+            type="academy", title="한식 기초", capacity=2, applied=0
+        )
+        self.url = f"/api/lectures/{self.lecture.id}/reserve/"
+
+    def reserve(self, key, url=None):
+        return self.client.post(url or self.url, HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_reserve_returns_remaining_from_single_update(self):
+        # 키 조회 + [SAVEPOINT, 조건부 UPDATE ... RETURNING, 예약 INSERT, 색인 UPDATE, RELEASE]
+        with self.assertNumQueries(6):
+            res = self.reserve("k1")
+        self.assertEqual(res.status_code, 201)
+        self.assertEqual(res.json()["remaining"], 1)
+
+        self.lecture.refresh_from_db()
+        self.assertEqual(self.lecture.applied, 1)
+        entry = LectureIndex.objects.get(source_key=str(self.lecture.id))
+        self.assertEqual((entry.applied, entry.remaining), (1, 1))
+
+    def test_same_key_replays_without_taking_another_seat(self):
+        first = self.reserve("k1")
+        again = self.reserve("k1")
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual(again["Idempotent-Replayed"], "true")
+        self.assertEqual(again.json(), first.json())
+        self.lecture.refresh_from_db()
+        self.assertEqual(self.lecture.applied, 1)
+
+    def test_full_lecture_is_409_and_never_overbooks(self):
+        self.assertEqual(self.reserve("k1").status_code, 201)
+        self.assertEqual(self.reserve("k2").json()["remaining"], 0)
+        res = self.reserve("k3")
+        self.assertEqual(res.status_code, 409)
+        self.lecture.refresh_from_db()
+        self.assertEqual(self.lecture.applied, 2)
+        self.assertFalse(SeatReservation.objects.filter(idempotency_key="k3").exists())
+
+    def test_rejects_missing_key_unknown_lecture_and_reused_key(self):
+        self.assertEqual(self.client.post(self.url).status_code, 400)
+        self.assertEqual(
+            self.reserve("k1", "/api/lectures/999999/reserve/").status_code, 404
+        )
+        other = Lecture.objects.create(type="academy", title="제과", capacity=5)
+        self.reserve("k1")
+        res = self.reserve("k1", f"/api/lectures/{other.id}/reserve/")
+        self.assertEqual(res.status_code, 422)
+
+
+class BenchReservationsCommandTests(TransactionTestCase):
+    # 벤치마크는 워커 스레드 커넥션으로 예약하므로 커밋된 데이터가 필요
+
+    def test_conditional_update_has_no_lost_increments(self):
+        out = StringIO()
+        call_command(
+            "bench_reservations", threads=1, requests=5, capacity=3, stdout=out
+        )
+        output = out.getvalue()
+        self.assertIn("예약 3 / 마감 2 / 오류 0", output)
+        self.assertIn("applied 0 → 3 (정원 3), 유실 0건", output)
+        # 임시 강의는 정리
+        self.assertFalse(Lecture.objects.exists())
@@ -0,0 +1,61 @@
+# apps/lectures/tests/test_server_timing.py
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import AsyncClient, TestCase, override_settings
+from django.utils import timezone
+
+from apps.lectures.hrd import sync_courses
+from apps.lectures.tests.factories import ORGAN, scn_item
+from utils import timing
+
+
+def span_names(header):
+    return [part.split(";")[0] for part in header.split(", ")]
+
+
+class ServerTimingTests(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        t = timezone.localdate()
+        items = [scn_item("A", 1, t + timedelta(days=3), t + timedelta(days=30))]
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_page",
+            side_effect=lambda organ, s, e, page_num, page_size=100: (
+                items if page_num == 1 else []
+            ),
+        ):
+            sync_courses(ORGAN)
+
+    def test_header_hidden_unless_sampled(self):
+        res = self.client.get("/api/lectures/hrd/")
+        self.assertNotIn("Server-Timing", res)
+        self.assertGreater(float(res["X-Elapsed-ms"]), 0)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=1.0)
+    def test_sampled_request_reports_named_spans(self):
+        with self.assertLogs("utils.timing", "INFO") as logs:
+            res = self.client.get("/api/lectures/hrd/")
+        names = span_names(res["Server-Timing"])
+        for name in ("cache", "db", "serialize", "render", "total"):
+            self.assertIn(name, names)
+        self.assertEqual(logs.records[0].getMessage(), "request_timing")
+        self.assertIn("db", logs.records[0].spans)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=1.0)
+    async def test_async_views_are_timed(self):
+        res = await AsyncClient().get("/api/lectures/async/hrd/")
+        self.assertIn("cache", span_names(res["Server-Timing"]))
+
+    def test_span_outside_request_is_noop(self):
+        with timing.span("upstream"):
+            pass
+        timing.record("upstream", 5.0)  # 예외 없이 무시
+
+    def test_header_value_format(self):
+        self.assertEqual(
+            timing.header_value({"db": (12.34, 3), "total": (20.0, 1)}),
+            'db;dur=12.3;desc="3", total;dur=20.0',
+        )
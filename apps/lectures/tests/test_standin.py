@@ -0,0 +1,77 @@
+# apps/lectures/tests/test_standin.py
+import threading
+from pathlib import Path
+
+import requests
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from apps.lectures.hrd_xml import parse_scn_list
+from utils import upstream
+from utils.standin import (
+    QNET_SCHEDULE_PATH,
+    WORK24_DETAIL_PATH,
+    WORK24_LIST_PATH,
+    Fixtures,
+    StandinConfig,
+    build_server,
+)
+
+WORK24 = Path(__file__).resolve().parent.parent / "fixtures" / "work24"
+QNET = Path(settings.BASE_DIR) / "apps" / "certificates" / "fixtures" / "qnet"
+
+
+class StandinServerTests(SimpleTestCase):
+
+    def start(self, **config):
+        fixtures = Fixtures(
+            WORK24 / "310L01_100rows.xml",
+            WORK24 / "310L03_detail.xml",
+            QNET / "getQualExamSchdList.json",
+        )
+        server = build_server("127.0.0.1", 0, fixtures, StandinConfig(**config))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return "http://127.0.0.1:%d" % server.server_address[1]
+
+    def test_list_pages_over_expanded_rows(self):
+        base = self.start(total_rows=250)
+        last = upstream.get(
+            base + WORK24_LIST_PATH, params={"pageNum": 3, "pageSize": 100}
+        )
+        rows, total = parse_scn_list(last.content)
+        self.assertEqual((len(rows), total), (50, 250))
+        # 두 바퀴째 레코드는 회차가 달라 (과정ID, 회차)가 겹치지 않음
+        first, _ = parse_scn_list(
+            upstream.get(base + WORK24_LIST_PATH, params={"pageNum": 1}).content
+        )
+        self.assertEqual(rows[0]["trprId"], first[0]["trprId"])
+        self.assertNotEqual(rows[0]["trprDegr"], first[0]["trprDegr"])
+
+        by_course, total = parse_scn_list(
+            upstream.get(
+                base + WORK24_LIST_PATH,
+                params={"srchTrprId": first[0]["trprId"], "pageSize": 100},
+            ).content
+        )
+        self.assertTrue(all(r["trprId"] == first[0]["trprId"] for r in by_course))
+        self.assertEqual(total, len(by_course))
+
+    def test_detail_and_qnet_replay_requested_keys(self):
+        base = self.start()
+        detail = upstream.get(
+            base + WORK24_DETAIL_PATH,
+            params={"srchTrprId": "AIGTEST", "srchTrprDegr": "7"},
+        )
+        self.assertIn(b"<trprId>AIGTEST</trprId>", detail.content)
+
+        qnet = upstream.get(base + QNET_SCHEDULE_PATH, params={"implYy": "2031"})
+        items = qnet.json()["body"]["items"]
+        self.assertTrue(items and all(i["implYy"] == "2031" for i in items))
+
+    def test_error_rate_injects_503(self):
+        base = self.start(error_rate=1.0)
+        with self.assertRaises(requests.HTTPError) as ctx:
+            upstream.get(base + WORK24_LIST_PATH, retries=0)
+        self.assertEqual(ctx.exception.response.status_code, 503)
@@ -0,0 +1,177 @@
+# apps/lectures/tests/test_upstream.py
+from unittest import mock
+
+import requests
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from utils import breaker, upstream
+
+
+def fake_response(status_code: int):
+    resp = requests.Response()
+    resp.status_code = status_code
+    resp._content = b"<HRDNet/>"
+    return resp
+
+
+class UpstreamClientTests(SimpleTestCase):
+    URL = "https://www.work24.go.kr/cm/openApi/call/hr/callOpenApiSvcInfo310L01.do"
+
+    def setUp(self):
+        cache.clear()
+        sleep = mock.patch("utils.upstream.time.sleep")
+        sleep.start()
+        self.addCleanup(sleep.stop)
+        self.calls = []
+        upstream.add_timing_hook(self.hook)
+        self.addCleanup(upstream.remove_timing_hook, self.hook)
+
+    def hook(self, **info):
+        self.calls.append(info)
+
+    def test_session_is_reused(self):
+        self.assertIs(upstream.get_session(), upstream.get_session())
+
+    def test_retries_connection_error_then_succeeds(self):
+        with mock.patch.object(
+            upstream.get_session(),
+            "get",
+            side_effect=[requests.ConnectionError("reset"), fake_response(200)],
+        ) as get:
+            resp = upstream.get(self.URL, params={"pageNum": 1})
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(get.call_args.kwargs["timeout"], upstream.timeout_for(self.URL))
+        self.assertEqual([c["attempt"] for c in self.calls], [0, 1])
+        self.assertEqual(self.calls[0]["error"], "ConnectionError")
+
+    def test_client_error_is_not_retried(self):
+        with mock.patch.object(
+            upstream.get_session(), "get", return_value=fake_response(404)
+        ) as get:
+            with self.assertRaises(requests.HTTPError):
+                upstream.get(self.URL)
+        self.assertEqual(get.call_count, 1)
+
+    def test_read_timeout_is_not_retried(self):
+        with mock.patch.object(
+            upstream.get_session(), "get", side_effect=requests.ReadTimeout("slow")
+        ) as get:
+            with self.assertRaises(requests.ReadTimeout):
+                upstream.get(self.URL)
+        self.assertEqual(get.call_count, 1)
+
+        # 연결 타임아웃은 원격이 요청을 받기 전이므로 재시도
+        with mock.patch.object(
+            upstream.get_session(),
+            "get",
+            side_effect=[requests.ConnectTimeout("syn"), fake_response(200)],
+        ) as get:
+            upstream.get(self.URL)
+        self.assertEqual(get.call_count, 2)
+
+    @override_settings(UPSTREAM_TIMEOUTS={"www.work24.go.kr": (1, 2)})
+    def test_timeouts_come_from_settings(self):
+        self.assertEqual(upstream.timeout_for(self.URL), (1, 2))
+        self.assertEqual(
+            upstream.timeout_for("https://example.com/x"), upstream.DEFAULT_TIMEOUT
+        )
+
+    def test_gives_up_after_max_retries(self):
+        with mock.patch.object(
+            upstream.get_session(), "get", return_value=fake_response(503)
+        ) as get:
+            with self.assertRaises(requests.HTTPError):
+                upstream.get(self.URL)
+        self.assertEqual(get.call_count, upstream.MAX_RETRIES + 1)
+
+
+@override_settings(
+    UPSTREAM_BREAKERS={"www.work24.go.kr": {"failure_threshold": 2, "cooldown": 30}}
+)
+class UpstreamBreakerTests(SimpleTestCase):
+    URL = UpstreamClientTests.URL
+
+    def setUp(self):
+        cache.clear()
+        sleep = mock.patch("utils.upstream.time.sleep")
+        sleep.start()
+        self.addCleanup(sleep.stop)
+        self.now = 1_000_000.0
+        clock = mock.patch("utils.breaker.time.time", side_effect=lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def state(self):
+        return upstream.circuit_states()["www.work24.go.kr"]
+
+    def fail_once(self):
+        with mock.patch.object(
+            upstream.get_session(), "get", side_effect=requests.Timeout("slow")
+        ):
+            with self.assertRaises(requests.Timeout):
+                upstream.get(self.URL, retries=0)
+
+    def test_opens_after_threshold_and_fails_fast(self):
+        self.fail_once()
+        self.assertEqual(self.state(), breaker.CLOSED)
+        self.fail_once()
+        self.assertEqual(self.state(), breaker.OPEN)
+
+        with mock.patch.object(upstream.get_session(), "get") as get:
+            with self.assertRaises(breaker.CircuitOpenError):
+                upstream.get(self.URL)
+            get.assert_not_called()
+
+    def test_half_open_probe_closes_circuit(self):
+        self.fail_once()
+        self.fail_once()
+        self.now += 31
+        self.assertEqual(self.state(), breaker.HALF_OPEN)
+
+        with mock.patch.object(
+            upstream.get_session(), "get", return_value=fake_response(200)
+        ):
+            upstream.get(self.URL)
+        self.assertEqual(self.state(), breaker.CLOSED)
+
+    def test_failed_probe_reopens_and_only_one_probe_passes(self):
+        self.fail_once()
+        self.fail_once()
+        self.now += 31
+        cb = upstream.breaker_for(self.URL)
+        self.assertTrue(cb.allow())
+        self.assertFalse(cb.allow())  # 다른 워커는 probe 결과 대기 없이 실패
+
+        cb.record_failure()
+        self.assertEqual(self.state(), breaker.OPEN)
+
+    def test_client_errors_do_not_count(self):
+        for _ in range(3):
+            with mock.patch.object(
+                upstream.get_session(), "get", return_value=fake_response(404)
+            ):
+                with self.assertRaises(requests.HTTPError):
+                    upstream.get(self.URL)
+        self.assertEqual(self.state(), breaker.CLOSED)
+
+    def test_client_error_does_not_reset_failures(self):
+        self.fail_once()
+        with mock.patch.object(
+            upstream.get_session(), "get", return_value=fake_response(404)
+        ):
+            with self.assertRaises(requests.HTTPError):
+                upstream.get(self.URL)
+        # 4xx 가 실패 카운터를 지우지 않으므로 다음 실패로 열림
+        self.fail_once()
+        self.assertEqual(self.state(), breaker.OPEN)
+
+    def test_in_flight_failures_do_not_extend_cooldown(self):
+        self.fail_once()
+        self.fail_once()
+        self.now += 20
+        # 열리기 전에 출발했던 호출이 뒤늦게 실패해도 open_until 은 그대로
+        upstream.breaker_for(self.URL).record_failure()
+        self.now += 11
+        self.assertEqual(self.state(), breaker.HALF_OPEN)
@@ -0,0 +1,84 @@
+# apps/lectures/tests/test_warmup.py
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TransactionTestCase
+from django.utils import timezone
+
+from apps.lectures.apps import _is_server_process
+from apps.lectures.hrd import sync_courses
+from apps.lectures.tests.factories import ORGAN, detail_payload, scn_item
+
+
+class WarmCachesTests(TransactionTestCase):
+    # 예열은 워커 스레드에서 DB 를 읽으므로 실제 커밋된 데이터가 필요
+
+    def setUp(self):
+        cache.clear()
+        self.today = t = timezone.localdate()
+        items = [
+            scn_item("A", 1, t + timedelta(days=3), t + timedelta(days=30)),
+            scn_item("B", 1, t + timedelta(days=5), t + timedelta(days=30)),
+            scn_item("C", 1, t + timedelta(days=9), t + timedelta(days=30)),
+        ]
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_page",
+            side_effect=lambda organ, s, e, page_num, page_size=100: (
+                items if page_num == 1 else []
+            ),
+        ):
+            sync_courses(ORGAN)
+
+    def test_command_warms_list_and_top_details(self):
+        out = StringIO()
+        with mock.patch(
+            "apps.lectures.hrd.fetch_course_detail",
+            side_effect=lambda trpr_id, degree, torg: detail_payload(self.today, trpr_id),
+        ) as fetch:
+            call_command("warm_caches", orgs=[ORGAN], top=2, stdout=out)
+
+        # 기본 정렬(-start_date) 상위 2개만 상세 예열
+        self.assertEqual(
+            sorted(c.args[0] for c in fetch.call_args_list), ["B", "C"]
+        )
+        self.assertIn("목록 1건, 상세 2건", out.getvalue())
+
+        with mock.patch("apps.lectures.hrd.fetch_course_detail") as fetch:
+            res = self.client.get("/api/lectures/hrd/")
+            self.assertEqual(res["X-Cache"], "HIT")
+            torg = res.json()["results"][0]["torg_id"]
+            res = self.client.get(f"/api/lectures/hrd/C/?tracse_tme=1&torg_id={torg}")
+            self.assertEqual(res["X-Cache"], "HIT")
+            fetch.assert_not_called()
+
+
+class ServerProcessDetectionTests(SimpleTestCase):
+    """WARM_CACHES_ON_STARTUP 예열은 서버 프로세스에서만"""
+
+    def test_servers(self):
+        for argv in (
+            ["/venv/bin/gunicorn", "config.wsgi"],
+            ["/venv/bin/uvicorn", "config.asgi:application"],
+            ["/venv/lib/python3.11/site-packages/gunicorn/__main__.py", "config.wsgi"],
+            ["daphne", "config.asgi:application"],
+        ):
+            self.assertTrue(_is_server_process(argv, {}), argv)
+
+    def test_runserver_only_in_serving_process(self):
+        argv = ["manage.py", "runserver"]
+        self.assertFalse(_is_server_process(argv, {}))  # 리로더 부모
+        self.assertTrue(_is_server_process(argv, {"RUN_MAIN": "true"}))
+        self.assertTrue(_is_server_process([*argv, "--noreload"], {}))
+
+    def test_other_processes(self):
+        for argv in (
+            ["manage.py", "migrate"],
+            ["/venv/bin/celery", "-A", "config", "worker"],
+            ["/venv/bin/pytest"],
+            ["scripts/import_lectures.py"],
+            [],
+        ):
+            self.assertFalse(_is_server_process(argv, {}), argv)
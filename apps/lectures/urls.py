@@ -4,12 +4,17 @@ from .views import (
     AcademyLectureDetailView,
     AcademyLectureCreateView,
     AcademyLectureUpdateView,
+    LectureSeatReservationView,
+    LectureTagFacetView,
 )
 from .views_hrd import (
     HRDLectureListView,
     HRDLectureDetailView,
+    HRDLectureBatchDetailView,
 )
 from .views_combined import CombinedLectureListView
+from .views_index import LectureIndexListView
+from . import views_async
 
 urlpatterns = [
     # 내부 강의
@@ -17,9 +22,17 @@ urlpatterns = [
     path("<int:id>/", AcademyLectureDetailView.as_view()),
     path("create/", AcademyLectureCreateView.as_view()),
     path("<int:id>/update/", AcademyLectureUpdateView.as_view()),
+    path("<int:id>/reserve/", LectureSeatReservationView.as_view()),
+    path("tags/", LectureTagFacetView.as_view()),
     # 고용24 강의
     path("hrd/", HRDLectureListView.as_view()),
+    path("hrd/batch/", HRDLectureBatchDetailView.as_view()),
     path("hrd/<str:trpr_id>/", HRDLectureDetailView.as_view()),
     # 전체리스트
     path("all/", CombinedLectureListView.as_view()),
+    path("index/", LectureIndexListView.as_view()),
+    # 비동기(ASGI) 버전
+    path("async/hrd/", views_async.hrd_lecture_list),
+    path("async/hrd/<str:trpr_id>/", views_async.hrd_lecture_detail),
+    path("async/all/", views_async.combined_lecture_list),
 ]
@@ -1,6 +1,11 @@
+from django.utils import timezone
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from .models import Lecture
+from .reservations import IdempotencyKeyReused, LectureFull, reserve_seat
+from .tags import filter_by_tags, query_tags, tag_facets
 from .serializers import LectureDisplaySerializer, LectureCreateUpdateSerializer
 from utils.pagination import CustomPageNumberPagination
 from utils.permissions import IsAdminOrReadOnly
@@ -9,17 +14,48 @@ from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
 
 # ✅ 강의 목록 조회 (페이지네이션 포함)
 class AcademyLectureListView(generics.ListAPIView):
-    queryset = Lecture.objects.all().order_by("-created_at")
+    """
+    ?status=open|full|closed (또는 진행중|모집마감|마감)
+    ?ordering=remain|-remain|days_left|start_date|end_date|-created_at
+    ?tag=한식&tag=제과 (모두 포함) / ?tags_any=한식,제과 (하나라도 포함)
+    remain/status/days_left 는 DB annotate 값이라 필터·정렬도 쿼리에서 처리
+    """
+
     serializer_class = LectureDisplaySerializer
     pagination_class = CustomPageNumberPagination
+    ordering_fields = ["remain", "days_left", "start_date", "end_date", "created_at"]
+    ordering = ["-created_at"]
+
+    def get_queryset(self):
+        qs = Lecture.objects.with_status(timezone.localdate())
+        status_param = self.request.query_params.get("status")
+        if status_param:
+            value = Lecture.STATUS_ALIASES.get(status_param, status_param)
+            if value not in Lecture.STATUS_ALIASES.values():
+                raise ValidationError(
+                    {"error": f"status 는 {', '.join(Lecture.STATUS_ALIASES)} 중 하나입니다."}
+                )
+            qs = qs.filter(status=value)
+        params = self.request.query_params
+        return filter_by_tags(
+            qs, all_of=query_tags(params, "tag"), any_of=query_tags(params, "tags_any")
+        )
+
+
+# ✅ 태그별 강의 수 (필터 UI 용, 캐시)
+class LectureTagFacetView(APIView):
+    def get(self, request):
+        return Response(tag_facets())
 
 
 # ✅ 강의 상세 조회 / 수정 / 삭제
 class AcademyLectureDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Lecture.objects.all()
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = "id"
 
+    def get_queryset(self):
+        return Lecture.objects.with_status(timezone.localdate())
+
     def get_serializer_class(self):
         if self.request.method in ["PUT", "PATCH"]:
             return LectureCreateUpdateSerializer
@@ -48,3 +84,52 @@ class AcademyLectureUpdateView(generics.UpdateAPIView):
     permission_classes = [IsAdminOrReadOnly]
     lookup_field = "id"
     parser_classes = [MultiPartParser, FormParser, JSONParser]  # ✅ 추가
+
+
+# ✅ 좌석 예약 (동시 신청 안전, Idempotency-Key 헤더 필수)
+class LectureSeatReservationView(APIView):
+    """
+    POST /api/lectures/{id}/reserve/   (헤더 Idempotency-Key: 클라이언트가 만든 고유값)
+    - 201: 예약 완료 {"reservation_id", "lecture_id", "remaining"}
+    - 200: 같은 키 재요청 → 처음 결과 그대로 (Idempotent-Replayed: true)
+    - 409: 잔여석 없음 / 422: 다른 강의에 이미 쓴 키
+    """
+
+    throttle_scope = "reservations"
+
+    def post(self, request, id):
+        key = request.headers.get("Idempotency-Key", "").strip()
+        if not key or len(key) > 64:
+            return Response(
+                {"error": "Idempotency-Key 헤더(64자 이하)가 필요합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            reservation, created = reserve_seat(id, key)
+        except Lecture.DoesNotExist:
+            return Response(
+                {"error": "강의를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except LectureFull:
+            return Response(
+                {"error": "잔여석이 없습니다.", "remaining": 0},
+                status=status.HTTP_409_CONFLICT,
+            )
+        except IdempotencyKeyReused:
+            return Response(
+                {"error": "이미 다른 강의 예약에 사용된 Idempotency-Key 입니다."},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+
+        response = Response(
+            {
+                "reservation_id": reservation.id,
+                "lecture_id": reservation.lecture_id,
+                "remaining": reservation.remaining,
+            },
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+        if not created:
+            response["Idempotent-Replayed"] = "true"
+        return response
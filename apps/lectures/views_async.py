@@ -0,0 +1,133 @@
+# apps/lectures/views_async.py
+"""
+HRD 연동 API 의 비동기(ASGI) 버전.
+- 상세: 310L03 과 기관ID 역조회(310L01)를 aiohttp 공용 세션(utils.upstream_async)으로
+  이벤트 루프에서 대기 → 워커 수를 늘리지 않고도 많은 work24 호출을 동시에 물고 있을 수 있다
+- 목록/전체 목록: 원격 호출 없이 캐시 데이터셋 + DB 만 읽으므로
+  동기 구현(load_list_dataset/paginate_combined)을 sync_to_async 로 감싸 그대로 사용
+  (DB 와 work24 를 동시에 호출하는 부분은 없음)
+- 파라미터/캐시/스냅샷/응답 형식은 동기 뷰(views_hrd, views_combined)와 동일
+- config.asgi:application 으로 띄운 서버에서 사용 (WSGI 에서도 동작은 하지만 이점 없음)
+"""
+import logging
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.http import JsonResponse
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+
+from utils import timing
+from utils.conditional import not_modified, set_cache_headers
+
+from .hrd import (
+    aresolve_course_detail,
+    circuit_state,
+    default_organizations,
+    detail_cache_key,
+    is_known_organization,
+    with_day_status,
+)
+from .views_combined import paginate_combined
+from .views_hrd import (
+    LIST_ERROR_MESSAGE,
+    UNKNOWN_ORG_ERROR,
+    HRDLectureListView,
+    list_etag,
+    load_list_dataset,
+    paginate_dataset,
+    parse_list_query,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _json(data, status=200):
+    # DRF(UNICODE_JSON) 와 같은 인코딩
+    return JsonResponse(
+        data, status=status, safe=False, json_dumps_params={"ensure_ascii": False}
+    )
+
+
+async def _with_headers(response, cache_state):
+    response["X-Cache"] = cache_state
+    response["X-Circuit"] = await sync_to_async(circuit_state, thread_sensitive=False)()
+    return response
+
+
+async def hrd_lecture_list(request):
+    """HRDLectureListView 비동기 버전"""
+    drf_request = Request(request)
+    today = timezone.localdate()
+    try:
+        organ, options = parse_list_query(drf_request.query_params)
+    except ValueError:
+        return _json(
+            {"error": "start_from/start_to 는 YYYY-MM-DD 형식이어야 합니다."}, 400
+        )
+    if not is_known_organization(organ):
+        return _json({"error": UNKNOWN_ORG_ERROR}, 404)
+
+    try:
+        dataset, cache_state = await sync_to_async(load_list_dataset)(organ, today)
+    except Exception:
+        # 예외 문구에는 authKey 가 든 원격 URL 이 섞일 수 있어 로그에만
+        logger.exception("hrd_list_fail", extra={"organ": organ})
+        return _json({"error": LIST_ERROR_MESSAGE}, 500)
+
+    etag = list_etag(dataset, today, request)
+    response = not_modified(request, etag)
+    if response is None:
+        try:
+            data = paginate_dataset(dataset, today, options, drf_request).data
+        except NotFound as e:
+            return _json({"detail": str(e.detail)}, 404)
+        response = set_cache_headers(
+            _json(data), etag, HRDLectureListView.ETAG_S_MAXAGE
+        )
+    return await _with_headers(response, cache_state)
+
+
+async def hrd_lecture_detail(request, trpr_id: str):
+    """HRDLectureDetailView 비동기 버전"""
+    tracse = request.GET.get("tracse_tme")
+    torg = request.GET.get("torg_id") or None
+    if not tracse:
+        return _json({"error": "`tracse_tme`(회차)가 필요합니다."}, 400)
+
+    with timing.span("cache"):
+        entry = await cache.aget(detail_cache_key(trpr_id, tracse, torg))
+    cache_state = "HIT"
+    if entry is None:
+        entry = await aresolve_course_detail(trpr_id, tracse, torg)
+        cache_state = "MISS"
+    if entry.get("fallback"):
+        cache_state = "HIT-FALLBACK"
+
+    if "detail" in entry:
+        response = _json(with_day_status(entry["detail"], timezone.localdate()))
+    else:
+        response = _json({"error": entry["error"]}, entry["status"])
+    return await _with_headers(response, cache_state)
+
+
+async def combined_lecture_list(request):
+    """CombinedLectureListView 비동기 버전 (캐시 데이터셋 + DB 페이지 조회)"""
+    drf_request = Request(request)
+    today = timezone.localdate()
+    organ = request.GET.get("org") or default_organizations()[0]
+    if not is_known_organization(organ):
+        return _json({"error": UNKNOWN_ORG_ERROR}, 404)
+
+    try:
+        dataset, cache_state = await sync_to_async(load_list_dataset)(organ, today)
+    except Exception:
+        logger.exception("hrd_list_fail", extra={"organ": organ})
+        return _json({"error": LIST_ERROR_MESSAGE}, 500)
+
+    try:
+        response = await sync_to_async(paginate_combined)(dataset, today, drf_request)
+    except NotFound as e:
+        return _json({"detail": str(e.detail)}, 404)
+    return await _with_headers(_json(response.data), cache_state)
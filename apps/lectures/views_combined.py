@@ -1,110 +1,138 @@
-import os
-import requests
-import xmltodict
-from datetime import datetime
+import heapq
+import logging
+from itertools import islice
+from operator import itemgetter
+
+from django.db.models import F
+from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
+from .hrd import circuit_state, default_organizations, is_known_organization
+from .hrd_dataset import ROW_FIELDS
 from .models import Lecture
 from .serializers import LectureDisplaySerializer
+from .views_hrd import LIST_ERROR_MESSAGE, UNKNOWN_ORG_ERROR, load_list_dataset
+from utils import timing
 from utils.pagination import CustomPageNumberPagination
 
-HRD_API_KEY = os.getenv("HRD_API_KEY")
+logger = logging.getLogger(__name__)
+
+START_COL = ROW_FIELDS.index("start_date")
 
 
 class CombinedLectureListView(APIView):
-    """자체 강의 + HRD 강의 전체 목록 조회"""
+    """자체 강의 + HRD 강의 전체 목록 조회 (시작일 내림차순)
+    - HRD 는 목록 API 와 같은 캐시 데이터셋(HRDCourse 동기화 테이블) 사용 → 원격 호출 없음
+    - 자체 강의는 start_date 정렬 쿼리, 두 목록을 지연 병합해 요청 페이지 행만 생성
+    - ?org= 기관명 (기본: HRD_ORGANIZATIONS 첫 번째, 목록 밖이면 404)
+    """
 
     def get(self, request):
-        today = datetime.today().date()
-
-        # 1. 내부 강의 (DB)
-        academy_queryset = Lecture.objects.all().order_by("-created_at")
-        academy_serialized = LectureDisplaySerializer(academy_queryset, many=True).data
-
-        # 2. 외부 HRD 강의
-        hrd_lectures = []
-        API_URL = (
-            "https://www.work24.go.kr/cm/openApi/call/hr/callOpenApiSvcInfo310L01.do"
-        )
-        params = {
-            "authKey": HRD_API_KEY,
-            "returnType": "XML",
-            "outType": "1",
-            "pageNum": 1,
-            "pageSize": 100,
-            "srchTraStDt": "20250101",
-            "srchTraEndDt": "20251231",
-            "srchTraOrganNm": "다모아요리학원",
-            "sort": "DESC",
-            "sortCol": 2,
-        }
+        today = timezone.localdate()
+        organ = request.query_params.get("org") or default_organizations()[0]
+        if not is_known_organization(organ):
+            return Response(
+                {"error": UNKNOWN_ORG_ERROR}, status=status.HTTP_404_NOT_FOUND
+            )
 
         try:
-            resp = requests.get(API_URL, params=params)
-            resp.raise_for_status()
-            data = xmltodict.parse(resp.text)
-            items = data.get("HRDNet", {}).get("srchList", {}).get("scn_list", [])
-            if isinstance(items, dict):
-                items = [items]
-
-            for item in items:
-                start_str = item.get("traStartDate")
-                end_str = item.get("traEndDate")
-                if not start_str or not end_str:
-                    continue
-
-                start = datetime.strptime(start_str, "%Y-%m-%d").date()
-                end = datetime.strptime(end_str, "%Y-%m-%d").date()
-                if end < today:
-                    continue
-
-                capacity = int(item.get("yardMan") or 0)
-                applied = int(item.get("regCourseMan") or 0)
-                remaining = max(capacity - applied, 0)
-
-                is_full = applied >= capacity
-                is_ongoing = start <= today <= end
-                status_label = (
-                    "모집 마감" if is_full else ("진행중" if is_ongoing else "모집중")
-                )
-                d_day = (
-                    "진행중"
-                    if is_ongoing
-                    else (f"D-{(start - today).days}" if start > today else "D-DAY")
-                )
-
-                hrd_lectures.append(
-                    {
-                        "title": item.get("title"),
-                        "start_date": start_str,
-                        "end_date": end_str,
-                        "capacity": capacity,
-                        "applied": applied,
-                        "remain": remaining,
-                        "status_label": status_label,
-                        "d_day": d_day,
-                        "day_of_week": None,  # 자체 강의와 구분 위해 None
-                        "id": None,  # 자체 강의만 ID 있음
-                    }
-                )
-
-        except Exception as e:
+            dataset, cache_state = load_list_dataset(organ, today)
+        except Exception:
+            # 예외 문구에는 authKey 가 든 원격 URL 이 섞일 수 있어 로그에만
+            logger.exception("hrd_list_fail", extra={"organ": organ})
             return Response(
-                {"error": f"HRD 강의 불러오기 실패: {e}"},
+                {"error": LIST_ERROR_MESSAGE},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        # 3. 병합 + 정렬 + 페이지네이션
-        academy_serialized = list(
-            LectureDisplaySerializer(academy_queryset, many=True).data
+        response = paginate_combined(dataset, today, request)
+        response["X-Cache"] = cache_state
+        response["X-Circuit"] = circuit_state()
+        return response
+
+
+def academy_queryset(today):
+    # 시작일 없는 강의는 맨 뒤, 같은 날이면 최근 등록 순
+    return Lecture.objects.with_status(today).order_by(
+        F("start_date").desc(nulls_last=True), "-created_at", "-pk"
+    )
+
+
+def hrd_display_row(dataset, index, days):
+    """데이터셋 행 → 전체 목록 HRD 행 (자체 강의와 구분되도록 id/day_of_week 는 None)"""
+    row = dataset.row(index, days)
+    return {
+        "title": row["title"],
+        "start_date": row["start_date"],
+        "end_date": row["end_date"],
+        "capacity": row["capacity"],
+        "applied": row["applied"],
+        "remain": row["remaining_slots"],
+        "status_label": row["status_label"],
+        "d_day": row["d_day"],
+        "day_of_week": None,
+        "id": None,
+    }
+
+
+class MergedLectureStream:
+    """
+    자체 강의(DB 정렬 쿼리)와 HRD(데이터셋 정렬 인덱스)를 시작일 내림차순으로 합친 지연 시퀀스.
+    Paginator 는 len() 과 [bottom:top] 만 사용하므로
+    - len(): 자체 강의 COUNT + 진행/예정 HRD 과정 수
+    - [bottom:top]: 양쪽 앞에서부터 (시작일, 참조)만 heapq.merge 로 top 건까지 병합하고
+      bottom~top 구간의 강의만 DB 에서 읽어 직렬화
+    시작일이 같으면 자체 강의가 먼저 (기존 정렬과 동일)
+    """
+
+    def __init__(self, queryset, dataset, today):
+        self.queryset = queryset
+        self.dataset = dataset
+        self.hrd_indices, self.days = dataset.select(today)
+        self._count = None
+
+    def __len__(self):
+        if self._count is None:
+            self._count = self.queryset.count() + len(self.hrd_indices)
+        return self._count
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice):
+            return self[item : item + 1][0]
+        bottom, top, _ = item.indices(len(self))
+        if bottom >= top:
+            return []
+
+        # 자체 강의는 앞쪽 top 건의 키만 조회 (LIMIT)
+        academy_keys = (
+            (start.isoformat() if start else "", ("academy", pk))
+            for start, pk in self.queryset.values_list("start_date", "pk")[:top]
         )
-        merged = academy_serialized + hrd_lectures
-        merged_sorted = sorted(
-            merged, key=lambda x: x.get("start_date") or "", reverse=True
+        hrd_keys = (
+            (self.dataset.rows[i][START_COL], ("hrd", i)) for i in self.hrd_indices
         )
-
-        paginator = CustomPageNumberPagination()
-        page = paginator.paginate_queryset(merged_sorted, request)
-        return paginator.get_paginated_response(page)
+        merged = heapq.merge(academy_keys, hrd_keys, key=itemgetter(0), reverse=True)
+        refs = [ref for _, ref in islice(merged, bottom, top)]
+        return self._materialize(refs)
+
+    def _materialize(self, refs):
+        pks = [key for kind, key in refs if kind == "academy"]
+        lectures = self.queryset.in_bulk(pks) if pks else {}
+        with timing.span("serialize"):
+            academy = iter(
+                LectureDisplaySerializer([lectures[pk] for pk in pks], many=True).data
+            )
+            return [
+                next(academy) if kind == "academy"
+                else hrd_display_row(self.dataset, key, self.days)
+                for kind, key in refs
+            ]
+
+
+def paginate_combined(dataset, today, request):
+    paginator = CustomPageNumberPagination()
+    stream = MergedLectureStream(academy_queryset(today), dataset, today)
+    page = paginator.paginate_queryset(stream, request)
+    return paginator.get_paginated_response(page)
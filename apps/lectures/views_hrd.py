@@ -1,320 +1,238 @@
-import os, requests, xmltodict, time
-from datetime import date, datetime
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import cast
 from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from utils import timing
+from utils.cache import get_or_refresh
+from utils.conditional import make_etag, not_modified, request_key, set_cache_headers
 from utils.pagination import CustomPageNumberPagination
-
-HRD_API_KEY = os.getenv("HRD_API_KEY")
-HRD_TORG_ID = os.getenv("HRD_TORG_ID")
+from .hrd import (
+    circuit_state,
+    dataset_cache_key,
+    default_organizations,
+    detail_cache_key,
+    is_known_organization,
+    resolve_course_detail,
+    search_window,
+    with_day_status,
+)
+from .hrd_dataset import DEFAULT_ORDERING, build_dataset
+from .serializers import HRDBatchDetailSerializer
+
+logger = logging.getLogger(__name__)
 
 
 class HRDLectureListView(APIView):
-    """고용24 연동 강의 목록 조회 (다모아요리학원 전용)"""
+    """고용24 연동 강의 목록 조회 (다모아요리학원 전용)
+    - 원격 호출 없이 HRDCourse(동기화 테이블)에서 조회
+      (동기화는 sync_hrd_courses / 예열만, HRD_ORGANIZATIONS 밖의 ?org= 는 404)
+    - 필터: ?status=모집중|진행중|모집 마감, ?available=1(잔여석 있음),
+      ?start_from=/start_to=YYYY-MM-DD
+    - 정렬: ?ordering=start_date|end_date|remaining (앞에 '-' 내림차순), 기존 ?sort=ASC|DESC
+    """
 
-    CACHE_TTL = 600  # 10분
+    # 캐시에는 날짜 무관 데이터만 있으므로 길게 유지 (동기화 시 즉시 무효화)
+    CACHE_TTL = 60 * 60 * 3  # 3시간 (소프트 만료)
+    STALE_TTL = 60 * 60 * 24  # 1일 (하드 만료, 이후엔 동기 갱신)
+    ETAG_S_MAXAGE = 300  # CDN 보관 시간 (이후 ETag 로 재검증)
 
     def get(self, request):
-        API_URL = (
-            "https://www.work24.go.kr/cm/openApi/call/hr/callOpenApiSvcInfo310L01.do"
-        )
-        # 기간(올해 ~ +2년)
-        today = date.today()
-        start_year = today.year
-        end_year = today.year + 2  # 필요에 따라 +1, +3로 조정
-        srchTraStDt = f"{start_year}0101"
-        srchTraEndDt = f"{end_year}1231"
-
-        # 쿼리 기본값
-        organ = request.query_params.get("org", "다모아요리학원")
-        page_num = int(request.query_params.get("page_num", 1))
-        page_size = int(request.query_params.get("page_size", 100))
-        sort = request.query_params.get("sort", "DESC")
-        sort_col = int(request.query_params.get("sortCol", 2))
-
-        params = {
-            "authKey": HRD_API_KEY,
-            "returnType": "XML",
-            "outType": "2",
-            "pageNum": page_num,
-            "pageSize": page_size,
-            "srchTraStDt": srchTraStDt,
-            "srchTraEndDt": srchTraEndDt,
-            "srchTraOrganNm": organ,
-            "sort": sort,
-            "sortCol": sort_col,
-        }
-
-        # 동적 캐시키 (연/기관/페이지 등 포함 → 연도 바뀌면 자동 갱신)
-        cache_key = (
-            f"hrd:list:{organ}:{srchTraStDt}-{srchTraEndDt}:"
-            f"p{page_num}s{page_size}:sort{sort}-col{sort_col}"
-        )
-
-        t0 = time.perf_counter()
-        cached = cache.get(cache_key)
-        if cached:
-            # 캐시 우선 제공(필요 시 신선도 중시로 전략 바꾸면 이 블록을 제거)
-            resp = Response(cached, status=status.HTTP_200_OK)
-            resp["X-Cache"] = "HIT"
-            resp["X-Elapsed-ms"] = f"{(time.perf_counter()-t0)*1000:.1f}"
-            return resp
-
-        # 원격 호출 (실패 시 캐시 폴백)
+        # 기간(올해 ~ +2년), 오늘은 Asia/Seoul 기준
+        today = timezone.localdate()
         try:
-            r = requests.get(API_URL, params=params, timeout=3)
-            r.raise_for_status()
-            data = xmltodict.parse(r.text)
-            items = data.get("HRDNet", {}).get("srchList", {}).get("scn_list", [])
-            if isinstance(items, dict):
-                items = [items]
-        except Exception as e:
-            if cached:
-                resp = Response(cached, status=status.HTTP_200_OK)
-                resp["X-Cache"] = "HIT-FALLBACK"
-                resp["X-Elapsed-ms"] = f"{(time.perf_counter()-t0)*1000:.1f}"
-                return resp
+            organ, options = parse_list_query(request.query_params)
+        except ValueError:
             return Response(
-                {"error": f"목록 조회 실패: {e}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-
-        lectures = []
-        for item in items:
-            # 날짜 파싱/필터
-            try:
-                start_str = item.get("traStartDate")
-                end_str = item.get("traEndDate")
-                if not start_str or not end_str:
-                    continue
-                start = datetime.strptime(start_str, "%Y-%m-%d").date()
-                end = datetime.strptime(end_str, "%Y-%m-%d").date()
-            except Exception:
-                continue
-            if end < today:
-                # 종료된 과정은 제외
-                continue
-
-            # 인원/상태
-            capacity = int(item.get("yardMan") or 0)
-            applied = int(item.get("regCourseMan") or 0)
-            remaining = max(capacity - applied, 0)
-            is_full = applied >= capacity
-            is_ongoing = start <= today <= end
-            status_label = (
-                "모집 마감" if is_full else ("진행중" if is_ongoing else "모집중")
+                {"error": "start_from/start_to 는 YYYY-MM-DD 형식이어야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
             )
-            d_day = (
-                "진행중"
-                if is_ongoing
-                else (f"D-{(start - today).days}" if start > today else "D-DAY")
+        if not is_known_organization(organ):
+            return Response(
+                {"error": UNKNOWN_ORG_ERROR}, status=status.HTTP_404_NOT_FOUND
             )
 
-            # 기관ID 다양한 키에서 안전 추출
-            torg_id = (
-                item.get("trainstCstmrId")
-                or item.get("trainstCstmrID")
-                or item.get("torgId")
-                or item.get("TorgId")
-                or item.get("torgID")
-                or item.get("insttOrgNo")
-                or item.get("trainstId")
-                or HRD_TORG_ID
+        try:
+            # 소프트 만료 후엔 이전 값을 즉시 응답하고 워커 하나만 갱신
+            dataset, cache_state = load_list_dataset(organ, today)
+        except Exception:
+            logger.exception("hrd_list_fail", extra={"organ": organ})
+            return Response(
+                {"error": LIST_ERROR_MESSAGE},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-            lectures.append(
-                {
-                    "title": item.get("title"),
-                    "process_id": item.get("trprId"),
-                    "process_time": item.get("trprDegr"),
-                    "torg_id": torg_id,
-                    "crse_tracse_se": item.get("trainTargetCd"),
-                    "start_date": start_str,
-                    "end_date": end_str,
-                    "location": item.get("address"),
-                    "summary": item.get("contents"),
-                    "tel": item.get("telNo"),
-                    "satisfaction": item.get("stdgScor"),
-                    "capacity": capacity,
-                    "applied": applied,
-                    "remaining_slots": remaining,
-                    "status_label": status_label,
-                    "d_day": d_day,
-                    "is_closed": is_full or end < today,
-                }
-            )
+        # 같은 데이터셋 + 같은 날 + 같은 쿼리면 본문도 같음 → 직렬화 전에 304
+        etag = list_etag(dataset, today, request)
+        response = not_modified(request, etag)
+        if response is None:
+            response = paginate_dataset(dataset, today, options, request)
+            set_cache_headers(response, etag, self.ETAG_S_MAXAGE)
+        response["X-Cache"] = cache_state
+        response["X-Circuit"] = circuit_state()
+        return response
 
-        paginator = CustomPageNumberPagination()
-        page = paginator.paginate_queryset(lectures, request)
-        response = paginator.get_paginated_response(page)
 
-        # ✅ 최신 성공 응답을 '동적 키'로 저장 (중요!)
-        cache.set(cache_key, response.data, self.CACHE_TTL)
+UNKNOWN_ORG_ERROR = "지원하지 않는 기관입니다."
+# 예외 문구(원격 URL·authKey 포함 가능)는 로그에만 남기고 응답은 고정 문구
+LIST_ERROR_MESSAGE = "목록을 불러오지 못했습니다. 잠시 후 다시 시도해 주세요."
 
-        response["X-Cache"] = "MISS" if not cached else "REFRESH"
-        response["X-Elapsed-ms"] = f"{(time.perf_counter()-t0)*1000:.1f}"
-        return response
+
+def _iso_date(value):
+    if not value:
+        return None
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
+def parse_list_query(query_params):
+    """목록 쿼리 → (기관명, HRDDataset.select 옵션). 날짜 형식이 틀리면 ValueError"""
+    organ = query_params.get("org") or default_organizations()[0]
+    sort = query_params.get("sort", "DESC")
+    options = {
+        "ordering": query_params.get("ordering")
+        or ("start_date" if sort.upper() == "ASC" else DEFAULT_ORDERING),
+        "status_label": query_params.get("status") or None,
+        "available": query_params.get("available") in ("1", "true", "True"),
+        "start_from": _iso_date(query_params.get("start_from")),
+        "start_to": _iso_date(query_params.get("start_to")),
+    }
+    return organ, options
+
+
+def load_list_dataset(organ, today):
+    """기관/기간당 캐시 1건 (페이지/정렬/필터는 메모리에서 처리) → (dataset, X-Cache)"""
+    window_start, window_end = search_window(today)
+    return get_or_refresh(
+        dataset_cache_key(organ, window_start, window_end),
+        lambda: build_dataset(organ, window_start, window_end),
+        HRDLectureListView.CACHE_TTL,
+        HRDLectureListView.STALE_TTL,
+    )
+
+
+def list_etag(dataset, today, request):
+    """데이터셋 내용 해시 + 오늘 날짜(D-day/상태) + 요청 쿼리"""
+    return make_etag(dataset.etag, today.isoformat(), request_key(request))
+
+
+def paginate_dataset(dataset, today, options, request):
+    """필터/정렬 후 요청 페이지만 행으로 만들어 페이지네이션 응답 생성"""
+    indices, days = dataset.select(today, **options)
+    paginator = CustomPageNumberPagination()
+    page = paginator.paginate_queryset(indices, request)
+    with timing.span("serialize"):
+        rows = [dataset.row(i, days) for i in page]
+    return paginator.get_paginated_response(rows)
 
 
 class HRDLectureDetailView(APIView):
     """고용24 연동 강의 상세 조회
     - torg_id 없으면 310L01로 '기관ID' 역조회 후 310L03 호출
+    - 성공은 DETAIL_TTL, 없는 과정/원격 오류는 짧은 TTL 로 부정 캐시
+    - 원격 장애/서킷 OPEN 이면 마지막 정상 스냅샷 응답 (X-Cache: HIT-FALLBACK)
     """
 
-    CACHE_TTL = 1800
-
-    def _lookup_torg_id(self, trpr_id: str, tracse: str) -> str | None:
-        """310L01 목록에서 trprId + trprDegr 로 기관ID(trainstCstmrId) 찾기 (여러 페이지 탐색)"""
-        API_URL = (
-            "https://www.work24.go.kr/cm/openApi/call/hr/callOpenApiSvcInfo310L01.do"
-        )
-
-        # 날짜 필터 없이 trprId만으로 검색: 과거/미래 포함 전부에서 찾게
-        for page in range(1, 11):  # 최대 10페이지(필요시 늘리세요)
-            params = {
-                "authKey": HRD_API_KEY,
-                "returnType": "XML",
-                "outType": "2",
-                "pageNum": page,
-                "pageSize": 100,
-                "srchTrprId": trpr_id,
-            }
-            try:
-                resp = requests.get(API_URL, params=params, timeout=10)
-                resp.raise_for_status()
-                data = xmltodict.parse(resp.text)
-            except Exception:
-                # 네트워크/파싱 에러시 다음 페이지 시도
-                continue
-
-            items = data.get("HRDNet", {}).get("srchList", {}).get("scn_list", [])
-            if not items:
-                # 더 이상 결과 없음
-                return None
-            if isinstance(items, dict):
-                items = [items]
-
-            for it in items:
-                if str(it.get("trprDegr")) == str(tracse):
-                    # 가능한 모든 키에서 기관ID 시도
-                    cand = (
-                        it.get("trainstCstmrId")
-                        or it.get("trainstCstmrID")
-                        or it.get("torgId")
-                        or it.get("TorgId")
-                        or it.get("torgID")
-                        or it.get("insttOrgNo")
-                        or it.get("trainstId")
-                    )
-                    if cand:
-                        return str(cand)
-
-        return None
-
     def get(self, request, trpr_id: str):
         tracse = request.query_params.get("tracse_tme")
-        torg = request.query_params.get("torg_id")
-
-        cache_key = f"hrd:detail:{trpr_id}:{tracse}:{torg}"
-        t0 = time.perf_counter()
-        hit = cache.get(cache_key)
-        if hit:
-            resp = Response(hit, status=200)
-            resp["X-Cache"] = "HIT"
-            resp["X-Elapsed-ms"] = f"{(time.perf_counter()-t0)*1000:.1f}"
-            return resp
-
+        torg = request.query_params.get("torg_id") or None
         if not tracse:
             return Response(
                 {"error": "`tracse_tme`(회차)가 필요합니다."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # 쿼리에 torg_id가 없으면 고정값으로 대입
-        if not torg:
-            torg = HRD_TORG_ID
-
-        if not torg:
-            # (혹시 폴백도 비어있으면 에러)
-            return Response({"error": "기관ID(torg_id)가 필요합니다."}, status=400)
-
-        # === 310L03 상세 호출 ===
-        API_URL = (
-            "https://www.work24.go.kr/cm/openApi/call/hr/callOpenApiSvcInfo310L03.do"
-        )
-        params = {
-            "authKey": HRD_API_KEY,
-            "returnType": "XML",
-            "outType": "2",
-            "srchTrprId": trpr_id,
-            "srchTrprDegr": tracse,
-            "srchTorgId": torg,
-        }
-        try:
-            resp = requests.get(API_URL, params=params, timeout=10)
-            resp.raise_for_status()
-            data = xmltodict.parse(resp.text)
-        except Exception as e:
-            return Response(
-                {"error": f"상세 조회 실패: {e}"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        with timing.span("cache"):
+            entry = cache.get(detail_cache_key(trpr_id, tracse, torg))
+        cache_state = "HIT"
+        if entry is None:
+            entry = resolve_course_detail(trpr_id, tracse, torg)
+            cache_state = "MISS"
+        if entry.get("fallback"):
+            cache_state = "HIT-FALLBACK"
+
+        if "detail" in entry:
+            resp = Response(
+                with_day_status(entry["detail"], timezone.localdate()),
+                status=status.HTTP_200_OK,
             )
+        else:
+            resp = Response({"error": entry["error"]}, status=entry["status"])
+        resp["X-Cache"] = cache_state
+        resp["X-Circuit"] = circuit_state()
+        return resp
+
+
+class HRDLectureBatchDetailView(APIView):
+    """고용24 강의 상세 일괄 조회 (목록 카드 N개 → 요청 1번)
+    POST /api/lectures/hrd/batch/
+    {"items": [{"trpr_id": "...", "tracse_tme": "3", "torg_id": "..."}, ...]}
+    - 캐시에 있는 건 바로 응답, 없는 건 워커 풀로 동시에 310L03 호출
+    - 응답: {"results": {"<trpr_id>:<tracse_tme>": 상세 | {"error": ...}}}
+    """
 
-        scn_list = data.get("HRDNet", {}).get("scn_list")
-        detail = scn_list[0] if isinstance(scn_list, list) else (scn_list or {})
+    MAX_WORKERS = 6  # work24 동시 호출 상한
 
-        # 필드 파싱/상태 계산
-        start_raw = detail.get("trStaDt")
-        end_raw = detail.get("trEndDt")
-        try:
-            start = (
-                datetime.strptime(start_raw, "%Y-%m-%d").date() if start_raw else None
+    def post(self, request):
+        serializer = HRDBatchDetailSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = cast(dict, serializer.validated_data)["items"]
+
+        keys = {
+            f"{it['trpr_id']}:{it['tracse_tme']}": (
+                it["trpr_id"],
+                it["tracse_tme"],
+                it.get("torg_id") or None,
             )
-            end = datetime.strptime(end_raw, "%Y-%m-%d").date() if end_raw else None
-        except Exception:
-            start = end = None
-
-        capacity = int(detail.get("totFxnum") or 0)
-        applied = int(detail.get("totTrpCnt") or 0)
-        remaining = max(capacity - applied, 0)
-
-        today = datetime.today().date()
-        is_full = applied >= capacity
-        is_ongoing = bool(start and end and start <= today <= end)
-        is_expired = bool(end and end < today)
-
-        if is_expired:
-            status_label, d_day = "종료", "종료"
-        elif is_ongoing:
-            status_label, d_day = "진행중", "진행중"
-        elif is_full:
-            status_label = "모집 마감"
-            d_day = f"D-{(start - today).days}" if start else "D-DAY"
-        else:
-            status_label = "모집중" if start else "정보 없음"
-            d_day = f"D-{(start - today).days}" if start else "미정"
-
-        result = {
-            "course_id": trpr_id,
-            "course_name": detail.get("trprNm"),
-            "start_date": start_raw or "미정",
-            "end_date": end_raw or "미정",
-            "capacity": capacity,
-            "applied": applied,
-            "remaining_slots": remaining,
-            "graduates": detail.get("finiCnt"),
-            "fee": detail.get("totTrco"),
-            "empl_rate_6m": detail.get("eiEmplRate6"),
-            "non_insured_rate": detail.get("hrdEmplRate6"),
-            "status_label": status_label,
-            "d_day": d_day,
-            "is_closed": is_expired or is_full,
-            "registration_url": (
-                "https://www.work24.go.kr/hr/a/a/3100/selectTracseDetl.do"
-                f"?tracseId={trpr_id}&tracseTme={tracse}"
-                f"&crseTracseSe={detail.get('trainTargetCd')}"
-                f"&trainstCstmrId={torg}"
-            ),
+            for it in items
         }
-        return Response(result, status=status.HTTP_200_OK)
+        cache_keys = {name: detail_cache_key(*args) for name, args in keys.items()}
+        with timing.span("cache"):
+            cached = cache.get_many(list(cache_keys.values()))
+
+        entries = {}
+        misses = []
+        for name in keys:
+            entry = cached.get(cache_keys[name])
+            if entry is None:
+                misses.append(name)
+            else:
+                entries[name] = entry
+
+        if misses:
+            with ThreadPoolExecutor(
+                max_workers=min(self.MAX_WORKERS, len(misses))
+            ) as pool:
+                futures = {
+                    pool.submit(self._resolve, *keys[name]): name for name in misses
+                }
+                for fut in as_completed(futures):
+                    entries[futures[fut]] = fut.result()
+
+        today = timezone.localdate()
+        results = {
+            name: (
+                with_day_status(entry["detail"], today)
+                if "detail" in entry
+                else {"error": entry["error"]}
+            )
+            for name, entry in entries.items()
+        }
+        resp = Response({"results": results}, status=status.HTTP_200_OK)
+        resp["X-Cache-Hits"] = str(len(keys) - len(misses))
+        resp["X-Cache-Misses"] = str(len(misses))
+        resp["X-Circuit"] = circuit_state()
+        return resp
+
+    @staticmethod
+    def _resolve(trpr_id, tracse, torg):
+        try:
+            return resolve_course_detail(trpr_id, tracse, torg)
+        finally:
+            # 워커 스레드에서 연 DB 커넥션은 바로 닫음
+            # (close_old_connections 는 CONN_MAX_AGE 동안 열어 두므로 풀 스레드마다 커넥션이 남음)
+            connection.close()
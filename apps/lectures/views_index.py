@@ -0,0 +1,84 @@
+from datetime import datetime
+
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+
+from .hrd_dataset import STATUS_FULL, STATUS_ONGOING, STATUS_OPEN
+from .tags import filter_by_tags, query_tags
+from .models import LectureIndex
+from .serializers import LectureIndexSerializer
+from utils.pagination import KeysetPagination
+
+
+class LectureIndexListView(generics.ListAPIView):
+    """자체 강의 + HRD 강의 통합 목록 (강의 색인 테이블 조회)
+    - 시작일 내림차순 키셋 페이지네이션 (?cursor=, 응답의 next 사용)
+    - 필터: ?source=academy|hrd, ?org=, ?tag=(모두 포함), ?tags_any=, ?q=(제목 검색),
+      ?status=모집중|진행중|모집 마감, ?available=1, ?start_from=, ?start_to=(YYYY-MM-DD)
+    - 종료된 강의는 제외 (?include_closed=1 이면 포함)
+    """
+
+    serializer_class = LectureIndexSerializer
+    pagination_class = KeysetPagination
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["today"] = self.today
+        return context
+
+    def get_queryset(self):
+        self.today = today = timezone.localdate()
+        params = self.request.query_params
+        qs = LectureIndex.objects.all()
+
+        if params.get("include_closed") not in ("1", "true", "True"):
+            qs = qs.filter(Q(end_date__gte=today) | Q(end_date__isnull=True))
+        if params.get("source"):
+            qs = qs.filter(source=params["source"])
+        if params.get("org"):
+            qs = qs.filter(organ_name=params["org"])
+        qs = filter_by_tags(
+            qs, all_of=query_tags(params, "tag"), any_of=query_tags(params, "tags_any")
+        )
+        if params.get("q"):
+            qs = qs.filter(title__icontains=params["q"])
+        if params.get("available") in ("1", "true", "True"):
+            qs = qs.filter(remaining__gt=0)
+
+        start_from = _iso_date(params.get("start_from"))
+        start_to = _iso_date(params.get("start_to"))
+        if start_from:
+            qs = qs.filter(start_date__gte=start_from)
+        if start_to:
+            qs = qs.filter(start_date__lte=start_to)
+
+        status_label = params.get("status")
+        if status_label:
+            qs = qs.filter(status_q(status_label, today))
+        return qs
+
+
+def _iso_date(value):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValidationError(
+            {"error": "start_from/start_to 는 YYYY-MM-DD 형식이어야 합니다."}
+        )
+
+
+def status_q(status_label, today):
+    """상태 라벨 → 색인 컬럼 조건 (직렬화 시 계산하는 status_label 과 같은 규칙)"""
+    not_full = Q(remaining__gt=0) | Q(remaining__isnull=True)
+    ongoing = Q(start_date__lte=today, end_date__gte=today)
+    if status_label == STATUS_FULL:
+        return Q(remaining=0)
+    if status_label == STATUS_ONGOING:
+        return not_full & ongoing
+    if status_label == STATUS_OPEN:
+        return not_full & ~ongoing
+    raise ValidationError({"error": f"알 수 없는 status 입니다: {status_label}"})
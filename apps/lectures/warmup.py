@@ -0,0 +1,125 @@
+# apps/lectures/warmup.py
+"""
+배포 직후 캐시 예열.
+- 기관별 HRD 목록 데이터셋 → 기본 정렬 상위 N개 과정 상세
+  (전체 목록 /all/ 도 같은 데이터셋을 쓰므로 따로 예열하지 않음)
+- 모두 워커 풀에서 동시에 (상세는 해당 기관 목록이 채워지는 대로 바로 시작)
+"""
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from utils.cache import prime
+
+from .hrd import (
+    dataset_cache_key,
+    default_organizations,
+    resolve_course_detail,
+    search_window,
+    sync_courses,
+)
+from .hrd_dataset import build_dataset
+from .models import HRDCourse
+from .views_hrd import HRDLectureListView
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOP_N = 20
+DEFAULT_WORKERS = 6
+LOCK_KEY = "warmup:lock"
+LOCK_TTL = 60 * 5  # 공유 캐시(Redis)면 워커 하나만 예열
+STARTUP_DELAY = 2.0  # 워커 부팅 직후 요청 처리와 겹치지 않도록 잠깐 대기
+
+
+def _task(fn, *args):
+    try:
+        return fn(*args)
+    finally:
+        # 풀 스레드가 연 DB 커넥션은 CONN_MAX_AGE 와 무관하게 닫음
+        connection.close()
+
+
+def _warm_list(organ, today):
+    # 동기화 이력이 없는 기관(첫 배포 등)은 여기서 한 번 동기화 (요청 경로는 동기화하지 않음)
+    if not HRDCourse.objects.filter(organ_name=organ).exists():
+        sync_courses(organ)
+    window_start, window_end = search_window(today)
+    dataset = prime(
+        dataset_cache_key(organ, window_start, window_end),
+        lambda: build_dataset(organ, window_start, window_end),
+        HRDLectureListView.CACHE_TTL,
+        HRDLectureListView.STALE_TTL,
+    )
+    return organ, dataset
+
+
+def _top_courses(dataset, today, top_n):
+    """목록 기본 정렬 기준 상위 N개 → (trpr_id, 회차, torg_id)"""
+    indices, days = dataset.select(today)
+    result = []
+    for i in indices[:top_n]:
+        row = dataset.row(i, days)
+        result.append((row["process_id"], row["process_time"], row["torg_id"]))
+    return result
+
+
+def warm_caches(orgs=None, top_n=DEFAULT_TOP_N, workers=DEFAULT_WORKERS):
+    """예열 실행 → {"lists": n, "details": n, "errors": [...]}"""
+    today = timezone.localdate()
+    summary = {"lists": 0, "details": 0, "errors": []}
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        pending = {
+            pool.submit(_task, _warm_list, organ, today): ("list", organ)
+            for organ in (orgs or default_organizations())
+        }
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                kind, name = pending.pop(fut)
+                try:
+                    result = fut.result()
+                except Exception as e:
+                    logger.warning(
+                        "warmup_fail", extra={"kind": kind, "target": name, "error": str(e)}
+                    )
+                    summary["errors"].append(f"{kind} {name or ''}: {e}".strip())
+                    continue
+
+                if kind == "list":
+                    summary["lists"] += 1
+                    for course in _top_courses(result[1], today, top_n):
+                        fut = pool.submit(_task, resolve_course_detail, *course)
+                        pending[fut] = ("detail", ":".join(course[:2]))
+                else:
+                    # 상세는 실패도 부정 캐시 항목으로 저장되므로 에러만 집계
+                    if "detail" in result:
+                        summary["details"] += 1
+                    else:
+                        summary["errors"].append(f"detail {name}: {result['error']}")
+
+    logger.info("warmup_done", extra=summary)
+    return summary
+
+
+def warm_in_background(delay=STARTUP_DELAY):
+    """서버 시작 훅: 공유 캐시면 락을 잡은 프로세스 하나만 예열"""
+
+    def run():
+        time.sleep(delay)
+        if not cache.add(LOCK_KEY, 1, LOCK_TTL):
+            return
+        try:
+            warm_caches()
+        except Exception:
+            logger.exception("warmup_fail")
+        finally:
+            connection.close()
+
+    threading.Thread(target=run, name="warm-caches", daemon=True).start()
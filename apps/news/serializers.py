@@ -1,8 +1,9 @@
 from rest_framework import serializers
+from apps.search.serializers import SearchResultMixin
 from .models import News
 
 
-class NewsSerializer(serializers.ModelSerializer):
+class NewsSerializer(SearchResultMixin, serializers.ModelSerializer):
     class Meta:
         model = News
         fields = (
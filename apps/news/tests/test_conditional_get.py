@@ -0,0 +1,20 @@
+# apps/news/tests/test_conditional_get.py
+from django.core.cache import cache
+from django.db.models import F
+from rest_framework.test import APITestCase
+
+from apps.news.models import News
+from utils.testing import ConditionalGetAssertions
+
+
+class NewsConditionalGetTests(ConditionalGetAssertions, APITestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_etag_changes_on_views(self):
+        news = News.objects.create(title="공지", content="본문")
+        self.assert_304_until_changed(
+            "/api/news/",
+            lambda: News.objects.filter(pk=news.pk).update(views=F("views") + 1),
+        )
@@ -0,0 +1,105 @@
+# apps/news/tests/test_view_counts.py
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APITestCase
+
+from apps.news.models import News
+from utils.models import ViewCountFlush
+from utils.view_counts import FLUSHED_KEY, flush
+
+
+@override_settings(VIEW_COUNT_FLUSH_INTERVAL=0)
+class NewsViewCountTests(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.news = News.objects.create(title="공지", content="본문")
+        self.url = f"/api/news/{self.news.pk}/"
+
+    def views(self):
+        res = self.client.get(self.url)
+        self.assertEqual(res.status_code, 200)
+        return res.json()["views"]
+
+    def test_detail_reads_show_pending_without_writing(self):
+        # 상세 SELECT 1번뿐 (UPDATE/refresh_from_db 없음)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.views(), 1)
+        self.assertEqual(self.views(), 2)
+
+        self.news.refresh_from_db()
+        self.assertEqual(self.news.views, 0)
+
+    def test_periodic_flush_waits_one_epoch(self):
+        self.views()
+        # 방금 닫은 세대는 한 주기 유예 → 아직 반영 안 됨, 응답은 계속 누적값
+        self.assertEqual(flush(), {})
+        self.assertEqual(self.views(), 2)
+
+        self.assertEqual(flush(), {("news.News", "views"): 1})
+        self.news.refresh_from_db()
+        self.assertEqual(self.news.views, 1)
+        self.assertEqual(self.views(), 3)
+
+    @override_settings(VIEW_COUNT_FLUSH_INTERVAL=30)
+    def test_request_triggers_flush_once_per_interval(self):
+        for expected in (1, 2, 3):
+            self.assertEqual(self.views(), expected)
+        # 첫 요청이 flush(세대 0 닫기)를 했으므로 남은 건 명령으로 전부 반영
+        out = StringIO()
+        call_command("flush_view_counts", "--drain", stdout=out)
+        self.assertIn("news.News.views 1건", out.getvalue())
+        self.news.refresh_from_db()
+        self.assertEqual(self.news.views, 3)
+
+    def test_flush_marker_commits_with_update(self):
+        for _ in range(3):
+            self.views()
+        real_set = cache.set
+
+        def set_fails_for_marker(key, *args, **kwargs):
+            if key == FLUSHED_KEY:
+                raise ConnectionError("cache down")
+            return real_set(key, *args, **kwargs)
+
+        # UPDATE 커밋 직후 캐시 갱신이 실패해도 반영 세대는 DB 에 같이 남음
+        with mock.patch.object(cache, "set", side_effect=set_fails_for_marker):
+            with self.assertRaises(ConnectionError):
+                flush(drain=True)
+        self.assertEqual(ViewCountFlush.objects.get().epoch, 0)
+
+        # 다시 flush 해도 같은 세대를 두 번 더하지 않음
+        self.assertEqual(flush(drain=True), {})
+        self.news.refresh_from_db()
+        self.assertEqual(self.news.views, 3)
+        self.assertEqual(self.views(), 4)
+
+    def test_cache_reset_restarts_epochs(self):
+        self.views()
+        flush(drain=True)
+        self.views()
+        flush(drain=True)
+        # 캐시가 비워지면 세대 번호가 0 부터 다시 → 새 캐시 ID 기록에서 시작, 새 증가분 반영
+        cache.clear()
+        self.views()
+        self.assertEqual(flush(drain=True), {("news.News", "views"): 1})
+        self.news.refresh_from_db()
+        self.assertEqual(self.news.views, 3)
+        self.assertEqual(ViewCountFlush.objects.count(), 2)
+
+    def test_other_cache_marker_does_not_skip_epochs(self):
+        # 다른 프로세스(locmem)가 자기 세대 9 까지 반영한 기록이 있어도
+        ViewCountFlush.objects.create(cache_id="other-worker", epoch=9)
+        cache.set("views:epoch", 8, None)
+        cache.set(FLUSHED_KEY, 7, None)
+        for _ in range(5):
+            self.views()
+        # 이 캐시의 세대 8 은 이 캐시 기록 기준으로 반영
+        self.assertEqual(flush(drain=True), {("news.News", "views"): 1})
+        self.news.refresh_from_db()
+        self.assertEqual(self.news.views, 5)
+        self.assertEqual(self.views(), 6)
@@ -1,26 +1,31 @@
-from django.db.models import F
 from rest_framework import generics, filters
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.response import Response
+from apps.search.filters import FullTextSearchFilter
+from utils.conditional import ConditionalListMixin
 from utils.permissions import IsAdminOrReadOnly
 from utils.pagination import CustomPageNumberPagination
+from utils.view_counts import record_view
 from .models import News
 from .serializers import NewsSerializer
 
 
-class NewsListCreateView(generics.ListCreateAPIView):
+class NewsListCreateView(ConditionalListMixin, generics.ListCreateAPIView):
     queryset = News.objects.all()
     serializer_class = NewsSerializer
     permission_classes = [IsAdminOrReadOnly]
     pagination_class = CustomPageNumberPagination
     parser_classes = [MultiPartParser, FormParser]
 
-    # 검색·정렬 지원
-    filter_backends = [filters.SearchFilter, filters.OrderingFilter]
-    search_fields = ["title", "content"]
+    # 검색·정렬 지원 (?search= 는 검색 문서 색인, 관련도 순)
+    filter_backends = [filters.OrderingFilter, FullTextSearchFilter]
+    search_source = "news"
     ordering_fields = ["created_at", "views"]
     ordering = ["-created_at"]
 
+    # 조회수는 updated_at 을 바꾸지 않으므로 합계도 지문에 포함
+    etag_sum_fields = ("views",)
+
 
 class NewsRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
     queryset = News.objects.all()
@@ -31,9 +36,8 @@ class NewsRetrieveUpdateDestroyView(generics.RetrieveUpdateDestroyAPIView):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        # 조회수 +1 (atomic)
-        News.objects.filter(pk=instance.pk).update(views=F("views") + 1)
-        instance.refresh_from_db(fields=["views"])
+        # 조회수 +1 (캐시에 누적 → 주기적으로 일괄 반영, 응답은 DB 값 + 미반영분)
+        record_view(instance, "views")
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
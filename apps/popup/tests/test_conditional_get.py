@@ -0,0 +1,17 @@
+# apps/popup/tests/test_conditional_get.py
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from apps.popup.models import PopupBanner
+from utils.testing import ConditionalGetAssertions
+
+
+class PopupConditionalGetTests(ConditionalGetAssertions, APITestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_list_etag_changes_on_delete(self):
+        PopupBanner.objects.create(title="배너1", image="popup/a.jpg")
+        banner = PopupBanner.objects.create(title="배너2", image="popup/b.jpg")
+        self.assert_304_until_changed("/api/popup/", banner.delete)
@@ -1,14 +1,15 @@
 from rest_framework import generics, filters
 from rest_framework.parsers import MultiPartParser, FormParser
+from utils.conditional import ConditionalListMixin
 from utils.permissions import IsAdminOrReadOnly
 from utils.pagination import CustomPageNumberPagination
 from .models import PopupBanner
 from .serializers import PopupBannerSerializer
 
 
-class PopupBannerListCreateView(generics.ListCreateAPIView):
+class PopupBannerListCreateView(ConditionalListMixin, generics.ListCreateAPIView):
     """
-    GET  /api/popup/      → 배너 리스트 (Anyone)
+    GET  /api/popup/      → 배너 리스트 (Anyone, ETag/304 지원)
     POST /api/popup/      → 생성 (관리자)
     """
 
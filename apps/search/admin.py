@@ -0,0 +1,11 @@
+from django.contrib import admin
+
+from .models import SearchDocument
+
+
+@admin.register(SearchDocument)
+class SearchDocumentAdmin(admin.ModelAdmin):
+    list_display = ("source", "object_id", "title", "updated_at")
+    search_fields = ("title",)
+    list_filter = ("source",)
+    readonly_fields = ("updated_at",)
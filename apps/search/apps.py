@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class SearchConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "apps.search"
+
+    def ready(self):
+        from .signals import connect_signals
+
+        # 게시글 저장/삭제 → 검색 문서 갱신
+        connect_signals()
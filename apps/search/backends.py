@@ -0,0 +1,165 @@
+# apps/search/backends.py
+"""
+DB 별 전문 검색 백엔드.
+- postgresql: 제목(A)/본문(B) 가중 tsvector 식 GIN 색인 + ts_rank
+- sqlite: FTS5 외부 콘텐츠 테이블(검색 문서 테이블 트리거로 동기화) + bm25 (로컬/테스트)
+- 그 외: 토큰 컬럼 LIKE (순위 없음)
+install()/uninstall() 은 마이그레이션(과 rebuild_search_index)이 호출하고,
+filter() 는 게시글 queryset 에 일치 조건과 search_rank(클수록 관련)를 붙인다.
+"""
+from django.db import connections
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+
+DOC_TABLE = "search_searchdocument"
+FTS_TABLE = "search_searchdocument_fts"
+
+# 색인과 질의가 같은 식을 써야 GIN 색인을 탄다
+PG_VECTOR = (
+    "(setweight(to_tsvector('simple', title_tokens), 'A') || "
+    "setweight(to_tsvector('simple', body_tokens), 'B'))"
+)
+PG_INDEX = "search_doc_vector_gin"
+
+# bm25 열 가중치 (제목, 본문) — ts_rank 기본 가중치 A 1.0 / B 0.4 와 같은 비율
+FTS_WEIGHTS = "2.5, 1.0"
+
+
+def _outer_pk(queryset):
+    """상관 서브쿼리에서 참조할 게시글 테이블 pk 컬럼"""
+    qn = connections[queryset.db].ops.quote_name
+    meta = queryset.model._meta
+    return f"{qn(meta.db_table)}.{qn(meta.pk.column)}"
+
+
+class BaseBackend:
+    def install(self, connection):
+        pass
+
+    def uninstall(self, connection):
+        pass
+
+    @staticmethod
+    def execute(connection, *statements):
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+    def filter(self, queryset, source, tokens):
+        raise NotImplementedError
+
+
+class PostgresBackend(BaseBackend):
+    def install(self, connection):
+        self.execute(
+            connection,
+            f"CREATE INDEX IF NOT EXISTS {PG_INDEX} ON {DOC_TABLE} USING gin ({PG_VECTOR})",
+        )
+
+    def uninstall(self, connection):
+        self.execute(connection, f"DROP INDEX IF EXISTS {PG_INDEX}")
+
+    @staticmethod
+    def tsquery(tokens):
+        # 토큰은 글자/숫자만 → 따옴표로 감싸 연산자로 해석되지 않게
+        return " & ".join(f"'{t}':*" if prefix else f"'{t}'" for t, prefix in tokens)
+
+    def filter(self, queryset, source, tokens):
+        tsquery = self.tsquery(tokens)
+        matched = RawSQL(
+            f"SELECT object_id FROM {DOC_TABLE} "
+            f"WHERE source = %s AND {PG_VECTOR} @@ to_tsquery('simple', %s)",
+            (source, tsquery),
+        )
+        rank = RawSQL(
+            f"(SELECT ts_rank({PG_VECTOR}, to_tsquery('simple', %s)) FROM {DOC_TABLE} "
+            f"WHERE source = %s AND object_id = {_outer_pk(queryset)})",
+            (tsquery, source),
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matched).annotate(search_rank=rank)
+
+
+class SQLiteBackend(BaseBackend):
+    TRIGGERS = {
+        "search_doc_ai": f"""
+            CREATE TRIGGER IF NOT EXISTS search_doc_ai AFTER INSERT ON {DOC_TABLE} BEGIN
+                INSERT INTO {FTS_TABLE}(rowid, title_tokens, body_tokens)
+                VALUES (new.id, new.title_tokens, new.body_tokens);
+            END""",
+        "search_doc_ad": f"""
+            CREATE TRIGGER IF NOT EXISTS search_doc_ad AFTER DELETE ON {DOC_TABLE} BEGIN
+                INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title_tokens, body_tokens)
+                VALUES ('delete', old.id, old.title_tokens, old.body_tokens);
+            END""",
+        "search_doc_au": f"""
+            CREATE TRIGGER IF NOT EXISTS search_doc_au AFTER UPDATE ON {DOC_TABLE} BEGIN
+                INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title_tokens, body_tokens)
+                VALUES ('delete', old.id, old.title_tokens, old.body_tokens);
+                INSERT INTO {FTS_TABLE}(rowid, title_tokens, body_tokens)
+                VALUES (new.id, new.title_tokens, new.body_tokens);
+            END""",
+    }
+
+    def install(self, connection):
+        self.execute(
+            connection,
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+            f"title_tokens, body_tokens, content='{DOC_TABLE}', content_rowid='id', "
+            "tokenize='unicode61')",
+            *self.TRIGGERS.values(),
+            # 테이블 재생성(ALTER) 등으로 어긋났어도 검색 문서 테이블 기준으로 다시 채움
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+        )
+
+    def uninstall(self, connection):
+        self.execute(
+            connection,
+            *(f"DROP TRIGGER IF EXISTS {name}" for name in self.TRIGGERS),
+            f"DROP TABLE IF EXISTS {FTS_TABLE}",
+        )
+
+    @staticmethod
+    def match_expression(tokens):
+        # 토큰은 글자/숫자만 → 큰따옴표 구문으로 FTS5 연산자 해석 방지, 공백은 AND
+        return " ".join(f'"{t}"*' if prefix else f'"{t}"' for t, prefix in tokens)
+
+    def filter(self, queryset, source, tokens):
+        expression = self.match_expression(tokens)
+        matched = RawSQL(
+            f"SELECT d.object_id FROM {FTS_TABLE} JOIN {DOC_TABLE} d ON d.id = {FTS_TABLE}.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s AND d.source = %s",
+            (expression, source),
+        )
+        rank = RawSQL(
+            f"(SELECT -bm25({FTS_TABLE}, {FTS_WEIGHTS}) FROM {FTS_TABLE} "
+            f"WHERE {FTS_TABLE} MATCH %s AND {FTS_TABLE}.rowid = ("
+            f"SELECT id FROM {DOC_TABLE} WHERE source = %s AND object_id = {_outer_pk(queryset)}))",
+            (expression, source),
+            output_field=FloatField(),
+        )
+        return queryset.filter(pk__in=matched).annotate(search_rank=rank)
+
+
+class LikeBackend(BaseBackend):
+    def filter(self, queryset, source, tokens):
+        from .models import SearchDocument
+
+        docs = SearchDocument.objects.filter(source=source)
+        for token, _ in tokens:
+            docs = docs.filter(
+                Q(title_tokens__contains=token) | Q(body_tokens__contains=token)
+            )
+        return queryset.filter(pk__in=docs.values("object_id")).annotate(
+            search_rank=Value(0.0, output_field=FloatField())
+        )
+
+
+BACKENDS = {
+    "postgresql": PostgresBackend,
+    "sqlite": SQLiteBackend,
+}
+
+
+def get_backend(connection):
+    return BACKENDS.get(connection.vendor, LikeBackend)()
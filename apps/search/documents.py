@@ -0,0 +1,75 @@
+# apps/search/documents.py
+"""
+게시글 → 검색 문서(SearchDocument) 갱신.
+- SOURCES: 출처 → (모델 라벨, 본문 필드). 제목은 모두 title
+  시험정보는 저장 시 정화된 content_html 을, 공지·소식은 content 를 평문으로 바꿔 색인
+- 원본 저장/삭제 시그널이 index_object / remove_object 호출
+- 전체 재구성: python manage.py rebuild_search_index
+"""
+from django.apps import apps
+
+from .models import SearchDocument
+from .text import document_tokens, strip_html
+
+SOURCES = {
+    SearchDocument.SOURCE_EXAM_POST: ("exam_board.ExamPost", "content_html"),
+    SearchDocument.SOURCE_NEWS: ("news.News", "content"),
+}
+DOCUMENT_FIELDS = ("title", "body", "title_tokens", "body_tokens")
+
+TITLE_LENGTH = SearchDocument._meta.get_field("title").max_length
+
+
+def build_document(source, obj, model=SearchDocument):
+    """게시글 → 저장 전 검색 문서 (마이그레이션에서는 과거 모델을 model 로 넘김)"""
+    _, body_field = SOURCES[source]
+    title = strip_html(obj.title)
+    body = strip_html(getattr(obj, body_field))
+    return model(
+        source=source,
+        object_id=obj.pk,
+        title=title[:TITLE_LENGTH],
+        body=body,
+        title_tokens=document_tokens(title),
+        body_tokens=document_tokens(body),
+    )
+
+
+def upsert(documents, model=SearchDocument):
+    if not documents:
+        return 0
+    model.objects.bulk_create(
+        documents,
+        batch_size=500,
+        update_conflicts=True,
+        unique_fields=["source", "object_id"],
+        update_fields=[*DOCUMENT_FIELDS, "updated_at"],
+    )
+    return len(documents)
+
+
+def source_for(model):
+    """모델 클래스 → 출처 이름 (검색 대상이 아니면 None)"""
+    label = model._meta.label
+    return next((s for s, (l, _) in SOURCES.items() if l == label), None)
+
+
+def index_object(source, obj):
+    return upsert([build_document(source, obj)])
+
+
+def remove_object(source, pk):
+    SearchDocument.objects.filter(source=source, object_id=pk).delete()
+
+
+def rebuild(sources=None):
+    """검색 문서 재구성 → {출처: 건수}"""
+    counts = {}
+    for source in sources or SOURCES:
+        label, body_field = SOURCES[source]
+        queryset = apps.get_model(label).objects.only("title", body_field)
+        SearchDocument.objects.filter(source=source).delete()
+        counts[source] = upsert(
+            [build_document(source, obj) for obj in queryset.iterator(chunk_size=500)]
+        )
+    return counts
@@ -0,0 +1,55 @@
+# apps/search/filters.py
+from django.db.models import OuterRef, Subquery
+from django.db import connections
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+from .backends import get_backend
+from .models import SearchDocument
+from .text import query_tokens
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    SearchFilter 대신 검색 문서 색인으로 ?search= 처리.
+    view.search_source (documents.SOURCES 키) 필요.
+    - 일치하는 글만 남기고 search_rank(관련도), search_body(스니펫용 평문)를 annotate
+    - ?ordering= 이 없으면 관련도 순 → 기존 정렬 순 (OrderingFilter 뒤에 둔다)
+    """
+
+    search_param = api_settings.SEARCH_PARAM
+    search_title = "검색"
+    search_description = "제목/본문 전문 검색 (한글은 부분 일치, 관련도 순)"
+
+    def get_search_query(self, request):
+        return request.query_params.get(self.search_param, "")
+
+    def filter_queryset(self, request, queryset, view):
+        tokens = query_tokens(self.get_search_query(request))
+        if not tokens:
+            return queryset
+
+        source = view.search_source
+        queryset = get_backend(connections[queryset.db]).filter(queryset, source, tokens)
+        queryset = queryset.annotate(
+            search_body=Subquery(
+                SearchDocument.objects.filter(
+                    source=source, object_id=OuterRef("pk")
+                ).values("body")[:1]
+            )
+        )
+        if request.query_params.get(api_settings.ORDERING_PARAM):
+            return queryset
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        return queryset.order_by("-search_rank", *ordering)
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.search_param,
+                "required": False,
+                "in": "query",
+                "description": self.search_description,
+                "schema": {"type": "string"},
+            },
+        ]
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from apps.search.backends import get_backend
+from apps.search.documents import SOURCES, rebuild
+
+
+class Command(BaseCommand):
+    """
+    검색 문서(SearchDocument) 재구성
+    python manage.py rebuild_search_index [--source exam_post]
+    평소에는 게시글 저장/삭제 시그널로 갱신되므로,
+    loaddata 나 queryset.update() 등 시그널을 거치지 않은 변경 뒤에만 실행하면 된다.
+    DB 전문 색인(FTS5 테이블/트리거, GIN 색인)도 함께 다시 확인한다.
+    """
+
+    help = "시험정보/공지·소식 게시글로 검색 문서와 전문 색인을 다시 만듭니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--source",
+            action="append",
+            dest="sources",
+            choices=sorted(SOURCES),
+            help="재구성할 출처 (여러 번 지정 가능, 기본: 전부)",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            counts = rebuild(options["sources"])
+            get_backend(connection).install(connection)
+        summary = ", ".join(f"{source} {n}건" for source, n in counts.items())
+        self.stdout.write(self.style.SUCCESS(f"검색 색인 재구성 완료: {summary}"))
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:08
+
+from django.db import migrations, models
+
+from apps.search.backends import get_backend
+from apps.search.documents import SOURCES, build_document, upsert
+
+
+def install_fulltext(apps, schema_editor):
+    """DB 별 전문 색인 (sqlite: FTS5 테이블 + 트리거, postgresql: GIN 식 색인)"""
+    get_backend(schema_editor.connection).install(schema_editor.connection)
+
+
+def uninstall_fulltext(apps, schema_editor):
+    get_backend(schema_editor.connection).uninstall(schema_editor.connection)
+
+
+def backfill_documents(apps, schema_editor):
+    """기존 게시글로 검색 문서 채우기 (이후에는 시그널이 갱신)"""
+    SearchDocument = apps.get_model("search", "SearchDocument")
+    for source, (label, body_field) in SOURCES.items():
+        model = apps.get_model(label)
+        upsert(
+            [
+                build_document(source, obj, model=SearchDocument)
+                for obj in model.objects.only("title", body_field).iterator()
+            ],
+            model=SearchDocument,
+        )
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("exam_board", "0003_exampost_excerpt"),
+        ("news", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('exam_post', '시험정보 게시글'), ('news', '공지·소식')], max_length=20, verbose_name='출처')),
+                ('object_id', models.PositiveBigIntegerField(verbose_name='원본 ID')),
+                ('title', models.CharField(max_length=255, verbose_name='제목')),
+                ('body', models.TextField(blank=True, verbose_name='본문(평문)')),
+                ('title_tokens', models.TextField(blank=True, verbose_name='제목 토큰')),
+                ('body_tokens', models.TextField(blank=True, verbose_name='본문 토큰')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='색인 일시')),
+            ],
+            options={
+                'verbose_name': '검색 문서',
+                'verbose_name_plural': '검색 문서',
+                'constraints': [models.UniqueConstraint(fields=('source', 'object_id'), name='uniq_search_document_source')],
+            },
+        ),
+        migrations.RunPython(install_fulltext, uninstall_fulltext),
+        migrations.RunPython(backfill_documents, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,39 @@
+from django.db import models
+
+
+class SearchDocument(models.Model):
+    """
+    게시글(시험정보/공지·소식)별 검색 문서.
+    - title/body: HTML 을 걷어낸 평문 (스니펫용)
+    - title_tokens/body_tokens: 한글 바이그램 토큰 (text.document_tokens)
+    - 전문 색인은 DB 별로 마이그레이션이 만든다 (backends 참고)
+      postgresql: 토큰 tsvector GIN 식 색인 / sqlite: FTS5 테이블 + 트리거
+    - 원본 저장/삭제 시그널로 갱신 (documents.index_object / remove_object)
+    """
+
+    SOURCE_EXAM_POST = "exam_post"
+    SOURCE_NEWS = "news"
+    SOURCE_CHOICES = [
+        (SOURCE_EXAM_POST, "시험정보 게시글"),
+        (SOURCE_NEWS, "공지·소식"),
+    ]
+
+    source = models.CharField("출처", max_length=20, choices=SOURCE_CHOICES)
+    object_id = models.PositiveBigIntegerField("원본 ID")
+    title = models.CharField("제목", max_length=255)
+    body = models.TextField("본문(평문)", blank=True)
+    title_tokens = models.TextField("제목 토큰", blank=True)
+    body_tokens = models.TextField("본문 토큰", blank=True)
+    updated_at = models.DateTimeField("색인 일시", auto_now=True)
+
+    class Meta:
+        verbose_name = "검색 문서"
+        verbose_name_plural = "검색 문서"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["source", "object_id"], name="uniq_search_document_source"
+            )
+        ]
+
+    def __str__(self):
+        return f"[{self.source}] {self.title}"
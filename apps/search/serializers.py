@@ -0,0 +1,17 @@
+from .text import make_snippet
+
+
+class SearchResultMixin:
+    """
+    FullTextSearchFilter 결과 행이면 search_rank / search_snippet(<mark> 강조 HTML) 추가.
+    검색이 아닐 때 응답 모양은 그대로.
+    """
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        if hasattr(instance, "search_rank"):
+            request = self.context.get("request")
+            query = request.query_params.get("search", "") if request else ""
+            data["search_rank"] = round(instance.search_rank or 0.0, 6)
+            data["search_snippet"] = make_snippet(instance.search_body, query)
+        return data
@@ -0,0 +1,30 @@
+# apps/search/signals.py
+from django.db.models.signals import post_delete, post_save
+
+from .documents import SOURCES, index_object, remove_object, source_for
+
+
+def update_search_document(sender, instance, raw=False, update_fields=None, **kwargs):
+    # loaddata(raw) 는 건너뜀 → 필요하면 rebuild_search_index
+    if raw:
+        return
+    source = source_for(sender)
+    _, body_field = SOURCES[source]
+    # 조회수 등 제목/본문과 무관한 컬럼만 저장한 경우 생략
+    if update_fields is not None and not {"title", body_field} & set(update_fields):
+        return
+    index_object(source, instance)
+
+
+def delete_search_document(sender, instance, **kwargs):
+    remove_object(source_for(sender), instance.pk)
+
+
+def connect_signals():
+    for source, (label, _) in SOURCES.items():
+        post_save.connect(
+            update_search_document, sender=label, dispatch_uid=f"search.index.{source}"
+        )
+        post_delete.connect(
+            delete_search_document, sender=label, dispatch_uid=f"search.remove.{source}"
+        )
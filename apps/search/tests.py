@@ -0,0 +1,136 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import SimpleTestCase
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from apps.exam_board.models import ExamPost
+from apps.news.models import News
+
+from .backends import FTS_TABLE
+from .models import SearchDocument
+from .text import document_tokens, make_snippet, query_tokens, strip_html
+
+User = get_user_model()
+
+
+class TextTests(SimpleTestCase):
+    def test_hangul_bigrams_and_words(self):
+        self.assertEqual(
+            document_tokens("정보처리기사 SQLD 시험"), "정보 보처 처리 리기 기사 sqld 시험"
+        )
+        # 한글/영문이 붙어 있으면 나눠서, 한 글자 단어는 그대로
+        self.assertEqual(document_tokens("SQLD자격증 및"), "sqld 자격 격증 및")
+
+    def test_query_tokens_prefix_rules(self):
+        self.assertEqual(
+            query_tokens("처리기사 pyth 시"),
+            [("처리", False), ("리기", False), ("기사", False), ("pyth", True), ("시", True)],
+        )
+        self.assertEqual(query_tokens("!!! ---"), [])
+
+    def test_strip_html_drops_tags_and_entities(self):
+        self.assertEqual(
+            strip_html('<p class="notice">A&amp;B</p><br>다음'), "A&B 다음"
+        )
+
+    def test_snippet_highlights_and_escapes(self):
+        text = "앞 " * 100 + "<b> 정보처리기사 실기 일정"
+        snippet = make_snippet(text, "정보처리기사")
+        self.assertTrue(snippet.startswith("…"))
+        self.assertIn("&lt;b&gt; <mark>정보처리기사</mark>", snippet)
+        # 못 찾으면 앞부분
+        self.assertTrue(make_snippet("첫 문장입니다", "없음").startswith("첫 문장"))
+
+
+class SearchApiTests(APITestCase):
+    exam_url = "/api/exam-board/exam-posts/"
+    news_url = "/api/news/"
+
+    def setUp(self):
+        self.admin = User.objects.create_user(
+            email="admin@example.com", password="pass1234", is_staff=True, name="관리자"
+        )
+
+    def post(self, title, content, status=ExamPost.Status.PUBLISHED):
+        return ExamPost.objects.create(
+            title=title,
+            content=content,
+            author=self.admin,
+            status=status,
+            published_at=timezone.now(),
+        )
+
+    def results(self, url):
+        res = self.client.get(url)
+        self.assertEqual(res.status_code, 200)
+        return res.json()["results"]
+
+    def test_korean_partial_match_ranks_title_first(self):
+        body_hit = self.post("일정 안내", "<p>2026 정보처리기사 실기 접수</p>")
+        title_hit = self.post("정보처리기사 합격 후기", "<p>공부 방법 공유</p>")
+        self.post("무관한 글", "<p>컴퓨터활용능력</p>")
+
+        rows = self.results(self.exam_url + "?search=처리기사")
+        self.assertEqual([r["id"] for r in rows], [title_hit.pk, body_hit.pk])
+        self.assertGreater(rows[0]["search_rank"], rows[1]["search_rank"])
+        self.assertIn("<mark>처리기사</mark>", rows[1]["search_snippet"])
+
+    def test_markup_is_not_searchable(self):
+        self.post("공지", '<p class="highlight" style="color:red">본문</p>')
+        self.assertEqual(self.results(self.exam_url + "?search=highlight"), [])
+        self.assertEqual(len(self.results(self.exam_url + "?search=본문")), 1)
+
+    def test_unpublished_and_deleted_posts_are_excluded(self):
+        self.post("시험 일정", "내용", status=ExamPost.Status.DRAFT)
+        gone = self.post("시험 결과", "내용")
+        gone.delete()
+        self.assertEqual(self.results(self.exam_url + "?search=시험"), [])
+        self.assertFalse(SearchDocument.objects.filter(object_id=gone.pk).exists())
+
+    def test_update_reindexes_and_view_count_does_not(self):
+        post = self.post("처음 제목", "내용")
+        post.title = "바뀐 제목"
+        post.save()
+        self.assertEqual(len(self.results(self.exam_url + "?search=바뀐")), 1)
+        self.assertEqual(self.results(self.exam_url + "?search=처음"), [])
+
+        doc = SearchDocument.objects.get(source="exam_post", object_id=post.pk)
+        post.view_count = 10
+        post.save(update_fields=["view_count"])
+        self.assertEqual(
+            SearchDocument.objects.get(pk=doc.pk).updated_at, doc.updated_at
+        )
+
+    def test_plain_list_is_unchanged(self):
+        self.post("제목", "내용")
+        row = self.results(self.exam_url)[0]
+        self.assertNotIn("search_rank", row)
+        self.assertNotIn("search_snippet", row)
+
+    def test_news_search(self):
+        News.objects.create(title="센터 휴무 안내", content="<p>추석 연휴 휴무</p>")
+        News.objects.create(title="신규 강좌", content="<p>바리스타 과정 개설</p>")
+        rows = self.results(self.news_url + "?search=휴무")
+        self.assertEqual([r["title"] for r in rows], ["센터 휴무 안내"])
+        self.assertIn("<mark>휴무</mark>", rows[0]["search_snippet"])
+
+    def test_rebuild_command_restores_documents(self):
+        self.post("제과기능사 실기", "내용")
+        News.objects.create(title="제과 특강", content="안내")
+        SearchDocument.objects.all().delete()
+        self.assertEqual(self.results(self.exam_url + "?search=제과"), [])
+
+        out = StringIO()
+        call_command("rebuild_search_index", stdout=out)
+        self.assertIn("exam_post 1건", out.getvalue())
+        self.assertEqual(len(self.results(self.exam_url + "?search=제과")), 1)
+        self.assertEqual(len(self.results(self.news_url + "?search=제과")), 1)
+
+        if connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute(f"SELECT count(*) FROM {FTS_TABLE}")
+                self.assertEqual(cursor.fetchone()[0], 2)
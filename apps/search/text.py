@@ -0,0 +1,101 @@
+# apps/search/text.py
+"""
+검색 문서/검색어 토큰화와 스니펫.
+- 문서는 HTML 태그/엔티티를 걷어낸 평문으로 저장 (태그·속성 문자열은 검색되지 않음)
+- 한글은 붙여 쓰는 복합어가 많아 음절 바이그램으로 색인
+  '정보처리기사' → 정보 보처 처리 리기 기사 ('처리기사' 로도 찾을 수 있음), 한 글자 단어는 그대로
+- 영문/숫자는 소문자 단어 단위
+- 검색어도 같은 규칙으로 쪼개 모든 토큰을 AND 로 찾는다
+  (한 글자 한글·영문/숫자 단어는 접두어 일치 → 입력 중인 단어도 검색됨)
+"""
+import html
+import re
+import unicodedata
+from functools import lru_cache
+
+_TAG_RE = re.compile(r"<[^>]*>")
+_SPACE_RE = re.compile(r"\s+")
+_WORD_RE = re.compile(r"[^\W_]+")
+_HANGUL_RE = re.compile(r"([가-힣]+)")
+
+# 긴 검색어로 질의가 과도하게 커지지 않도록
+MAX_QUERY_TOKENS = 32
+SNIPPET_LENGTH = 120
+
+
+def strip_html(value):
+    """HTML → 태그/엔티티/연속 공백을 걷어낸 평문"""
+    text = html.unescape(_TAG_RE.sub(" ", value or ""))
+    return _SPACE_RE.sub(" ", text).strip()
+
+
+def _parts(text):
+    """정규화한 단어를 한글/그 외 조각으로 나눔 → (한글 여부, 조각)"""
+    normalized = unicodedata.normalize("NFKC", text or "").lower()
+    for word in _WORD_RE.findall(normalized):
+        # split 의 캡처 그룹 → 홀수 번째가 한글 조각
+        for i, part in enumerate(_HANGUL_RE.split(word)):
+            if part:
+                yield i % 2 == 1, part
+
+
+def _bigrams(run):
+    if len(run) == 1:
+        return [run]
+    return [run[i : i + 2] for i in range(len(run) - 1)]
+
+
+def document_tokens(text):
+    """평문 → 공백으로 구분한 색인 토큰 문자열"""
+    tokens = []
+    for hangul, part in _parts(text):
+        tokens.extend(_bigrams(part) if hangul else [part])
+    return " ".join(tokens)
+
+
+def query_tokens(query):
+    """검색어 → [(토큰, 접두어 일치 여부)] (중복 제거, 최대 MAX_QUERY_TOKENS 개)"""
+    tokens = {}
+    for hangul, part in _parts(query):
+        if hangul and len(part) > 1:
+            for token in _bigrams(part):
+                tokens.setdefault(token, False)
+        else:
+            tokens.setdefault(part, True)
+    return list(tokens.items())[:MAX_QUERY_TOKENS]
+
+
+@lru_cache(maxsize=256)
+def _highlight_pattern(query):
+    terms = sorted({part for _, part in _parts(query)}, key=len, reverse=True)
+    if not terms:
+        return None
+    return re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+
+
+def make_snippet(text, query, length=SNIPPET_LENGTH):
+    """
+    평문에서 검색어가 처음 나오는 부근을 length 자로 잘라 <mark> 로 강조한 HTML.
+    (본문은 이스케이프, 못 찾으면 앞부분)
+    """
+    text = text or ""
+    pattern = _highlight_pattern(query or "")
+    match = pattern.search(text) if pattern else None
+
+    start = max(match.start() - length // 3, 0) if match else 0
+    end = min(start + length, len(text))
+    window = text[start:end]
+
+    out, pos = [], 0
+    for m in pattern.finditer(window) if pattern else ():
+        out.append(html.escape(window[pos : m.start()]))
+        out.append(f"<mark>{html.escape(m.group())}</mark>")
+        pos = m.end()
+    out.append(html.escape(window[pos:]))
+
+    snippet = "".join(out)
+    if start > 0:
+        snippet = "…" + snippet
+    if end < len(text):
+        snippet += "…"
+    return snippet
@@ -1,6 +1,7 @@
 import os
 from os import getenv
 from pathlib import Path
+from urllib.parse import urlsplit
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -52,6 +53,45 @@ HRD_API_KEY = os.getenv("HRD_API_KEY")
 PUBLIC_API_KEY = os.getenv("PUBLIC_API_KEY")
 QNET_API_KEY = os.getenv("QNET_API_KEY")
 
+# 공공데이터 API 주소 (부하 테스트 시 upstream_standin 서버 주소로 교체)
+WORK24_BASE_URL = os.getenv("WORK24_BASE_URL", "https://www.work24.go.kr").rstrip("/")
+DATA_GO_KR_BASE_URL = os.getenv(
+    "DATA_GO_KR_BASE_URL", "https://apis.data.go.kr"
+).rstrip("/")
+WORK24_HOST = urlsplit(WORK24_BASE_URL).hostname
+DATA_GO_KR_HOST = urlsplit(DATA_GO_KR_BASE_URL).hostname
+
+# 공공데이터 호출 타임아웃 (호스트별 (connect, read) 초, 미지정 호스트는 utils.upstream 기본값)
+UPSTREAM_TIMEOUTS = {
+    DATA_GO_KR_HOST: (3.05, float(os.getenv("DATA_GO_KR_READ_TIMEOUT", 5))),
+    WORK24_HOST: (3.05, float(os.getenv("WORK24_READ_TIMEOUT", 10))),
+}
+
+# 워커 시작 시 HRD/전체 목록 캐시 예열 (manage.py warm_caches 와 동일)
+WARM_CACHES_ON_STARTUP = os.getenv("WARM_CACHES_ON_STARTUP", "False") == "True"
+
+# Server-Timing: 관리자/DEBUG 는 항상, 그 외는 샘플링 비율만큼 헤더+로그
+SERVER_TIMING_SAMPLE_RATE = float(os.getenv("SERVER_TIMING_SAMPLE_RATE", 0))
+SERVER_TIMING_SLOW_MS = float(os.getenv("SERVER_TIMING_SLOW_MS", 1000))  # 이상이면 항상 로그
+
+# 조회수 버퍼: 캐시에 누적한 증가분을 이 주기(초)마다 일괄 반영 (0 이면 flush_view_counts 커맨드로만)
+VIEW_COUNT_FLUSH_INTERVAL = int(os.getenv("VIEW_COUNT_FLUSH_INTERVAL", 30))
+
+# 서킷 브레이커: 연속 실패 failure_threshold 회 → cooldown 초 동안 즉시 실패
+UPSTREAM_BREAKERS = {
+    WORK24_HOST: {
+        "failure_threshold": int(os.getenv("WORK24_BREAKER_THRESHOLD", 5)),
+        "cooldown": int(os.getenv("WORK24_BREAKER_COOLDOWN", 30)),
+    },
+}
+
+# HRD 동기화 대상 기관명(콤마 구분)
+HRD_ORGANIZATIONS = [
+    o.strip()
+    for o in os.getenv("HRD_ORGANIZATIONS", "다모아요리학원").split(",")
+    if o.strip()
+]
+
 # ─────────────────────────────────────────────────────────
 # Database (Neon 사용 시 DATABASE_URL 추천하기도..?)
 import dj_database_url
@@ -78,6 +118,25 @@ DATABASES = {
     )
 }
 
+# ─────────────────────────────────────────────────────────
+# Cache: 워커 간 공유가 필요하면 REDIS_URL 주입(redis 패키지 필요),
+# 없으면 프로세스 로컬 메모리 캐시
+REDIS_URL = os.getenv("REDIS_URL")
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+            "KEY_PREFIX": "damoa",
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 # ─────────────────────────────────────────────────────────
 # Email (Naver: 발신주소는 EMAIL_HOST_USER와 일치해야함)
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
@@ -120,6 +179,8 @@ INSTALLED_APPS = [
     "apps.gallery",
     "apps.popup",
     "apps.exam_board",
+    "apps.search",
+    "utils",  # 앱 공용 관리 명령 (flush_view_counts 등)
 ]
 
 REST_FRAMEWORK = {
@@ -133,6 +194,7 @@ REST_FRAMEWORK = {
     ],
     "DEFAULT_THROTTLE_RATES": {
         "inquiries": "5/min",  # 수강문의: IP 기준 분당 5회
+        "reservations": "20/min",  # 좌석 예약: IP 기준 분당 20회
         "anon": "60/min",  # 전체 익명 요청 기본치
     },
     "DEFAULT_PAGINATION_CLASS": "utils.pagination.CustomPageNumberPagination",
@@ -153,6 +215,7 @@ SIMPLE_JWT = {
 }
 
 MIDDLEWARE = [
+    "utils.timing.ServerTimingMiddleware",  # 맨 앞: 다른 미들웨어 시간까지 포함
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
@@ -182,6 +245,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
 
 LANGUAGE_CODE = "ko-kr"
 TIME_ZONE = "Asia/Seoul"
@@ -11,9 +11,11 @@ from drf_spectacular.views import (
 from django.views.static import serve as static_serve
 import os
 
+from utils import upstream
+
 
 def healthz(_):
-    return JsonResponse({"ok": True})
+    return JsonResponse({"ok": True, "circuits": upstream.circuit_states()})
 
 
 urlpatterns = [
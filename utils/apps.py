@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class UtilsConfig(AppConfig):
+    """공용 모듈(utils)의 관리 명령/상태 테이블을 등록하기 위한 앱"""
+
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "utils"
+    verbose_name = "공용"
@@ -0,0 +1,103 @@
+# utils/breaker.py
+"""
+워커 간 공유 서킷 브레이커 (상태는 Django 캐시에 저장).
+- CLOSED: 정상 호출. 연속 실패가 failure_threshold 에 도달하면 OPEN
+- OPEN: cooldown 동안 원격 호출 없이 바로 실패(fail fast)
+- HALF_OPEN: cooldown 이 지나면 probe 하나만 통과시켜 성공 시 CLOSED, 실패 시 다시 OPEN
+"""
+import logging
+import time
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+FAILURE_WINDOW = 60 * 5  # 실패 카운터 유지 시간(초)
+PROBE_TIMEOUT = 15  # half-open probe 하나가 점유하는 최대 시간(초)
+
+
+class CircuitOpenError(Exception):
+    """브레이커가 열려 있어 원격 호출을 건너뜀"""
+
+    def __init__(self, name):
+        super().__init__(f"circuit open: {name}")
+        self.name = name
+
+
+class CircuitBreaker:
+    def __init__(self, name, failure_threshold=5, cooldown=30):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+
+    @property
+    def _failures_key(self):
+        return f"circuit:{self.name}:failures"
+
+    @property
+    def _open_key(self):
+        return f"circuit:{self.name}:open_until"
+
+    @property
+    def _probe_key(self):
+        return f"circuit:{self.name}:probe"
+
+    def state(self):
+        open_until = cache.get(self._open_key)
+        if open_until is None:
+            return CLOSED
+        return OPEN if time.time() < open_until else HALF_OPEN
+
+    def allow(self):
+        """호출 가능 여부 (half-open 이면 probe 하나만 True)"""
+        state = self.state()
+        if state == CLOSED:
+            return True
+        if state == OPEN:
+            return False
+        return cache.add(self._probe_key, 1, PROBE_TIMEOUT)
+
+    def record_success(self):
+        if cache.get(self._open_key) is not None:
+            logger.warning(
+                "circuit_state", extra={"circuit": self.name, "state": CLOSED}
+            )
+        cache.delete_many([self._failures_key, self._open_key, self._probe_key])
+
+    def release_probe(self):
+        """성공/실패로 세지 않는 결과(4xx 등) → half-open probe 자리만 비움"""
+        cache.delete(self._probe_key)
+
+    def record_failure(self):
+        state = self.state()
+        if state == OPEN:
+            # 열리기 전에 출발한 호출의 실패 → cooldown 을 늘리지 않음
+            return
+        if state == HALF_OPEN:
+            # half-open probe 실패 → 다시 cooldown
+            self._open()
+            return
+        cache.add(self._failures_key, 0, FAILURE_WINDOW)
+        try:
+            failures = cache.incr(self._failures_key)
+        except ValueError:
+            # add 와 incr 사이에 만료된 경우
+            cache.set(self._failures_key, 1, FAILURE_WINDOW)
+            failures = 1
+        if failures >= self.failure_threshold:
+            self._open()
+
+    def _open(self):
+        # open_until 은 cooldown 이후에도 남겨 두어야 half-open 으로 판단 가능
+        cache.set(
+            self._open_key, time.time() + self.cooldown, self.cooldown + FAILURE_WINDOW
+        )
+        cache.delete_many([self._failures_key, self._probe_key])
+        logger.warning(
+            "circuit_state",
+            extra={"circuit": self.name, "state": OPEN, "cooldown": self.cooldown},
+        )
@@ -0,0 +1,129 @@
+# utils/cache.py
+"""
+stale-while-revalidate 캐시.
+
+캐시 항목에 두 개의 만료 시각을 함께 저장한다.
+- fresh_until(소프트): 이전이면 그대로 HIT
+- stale_until(하드): 소프트~하드 사이면 기존 값을 즉시 STALE로 응답하고,
+  공유 캐시 락을 잡은 워커 하나만 백그라운드에서 갱신(single-flight)
+- 하드 만료 이후에는 동기 갱신. 갱신이 실패하면 보관 중인 마지막 값을
+  HIT-FALLBACK으로 응답(원격 장애 시 500 대신 이전 데이터)
+"""
+import logging
+import threading
+import time
+
+from django.core.cache import cache
+from django.db import connection
+
+from utils import timing
+
+logger = logging.getLogger(__name__)
+
+HIT = "HIT"
+MISS = "MISS"
+STALE = "STALE"
+FALLBACK = "HIT-FALLBACK"
+
+LOCK_TTL = 30  # 갱신 락 최대 보유 시간(초)
+RETAIN_TTL = 60 * 60 * 24  # 하드 만료 후에도 폴백용으로 보관하는 시간
+MISS_WAIT = 3.0  # 다른 워커가 채우는 중일 때 기다리는 최대 시간
+MISS_POLL = 0.05
+
+
+def _lock_key(key):
+    return f"{key}:lock"
+
+
+def _store(key, value, fresh_ttl, stale_ttl):
+    now = time.time()
+    entry = {
+        "value": value,
+        "fresh_until": now + fresh_ttl,
+        "stale_until": now + stale_ttl,
+    }
+    cache.set(key, entry, stale_ttl + RETAIN_TTL)
+    return entry
+
+
+def _refresh(key, loader, fresh_ttl, stale_ttl):
+    try:
+        _store(key, loader(), fresh_ttl, stale_ttl)
+    except Exception:
+        logger.exception("swr_refresh_fail", extra={"cache_key": key})
+    finally:
+        cache.delete(_lock_key(key))
+
+
+def _refresh_in_background(key, loader, fresh_ttl, stale_ttl):
+    def run():
+        try:
+            _refresh(key, loader, fresh_ttl, stale_ttl)
+        finally:
+            # 이 스레드가 연 DB 커넥션은 CONN_MAX_AGE 와 무관하게 닫음
+            connection.close()
+
+    threading.Thread(target=run, name=f"swr-refresh:{key}", daemon=True).start()
+
+
+def _wait_for_fill(key, timeout):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        time.sleep(MISS_POLL)
+        entry = cache.get(key)
+        if entry and entry["stale_until"] > time.time():
+            return entry
+        if cache.get(_lock_key(key)) is None:
+            break
+    return None
+
+
+def get_or_refresh(key, loader, fresh_ttl, stale_ttl):
+    """
+    key의 값을 (value, state)로 반환. state: HIT / STALE / MISS / HIT-FALLBACK
+    loader는 인자 없는 callable. 실패 시 예외를 그대로 올리며,
+    보관 중인 값이 있으면 대신 HIT-FALLBACK으로 응답한다.
+    """
+    now = time.time()
+    with timing.span("cache"):
+        entry = cache.get(key)
+
+    if entry and now < entry["fresh_until"]:
+        return entry["value"], HIT
+
+    if entry and now < entry["stale_until"]:
+        # 락을 잡은 워커 하나만 갱신, 나머지는 기존 값 그대로
+        if cache.add(_lock_key(key), 1, LOCK_TTL):
+            _refresh_in_background(key, loader, fresh_ttl, stale_ttl)
+        return entry["value"], STALE
+
+    # 하드 만료/미존재 → 동기 갱신 (single-flight)
+    locked = cache.add(_lock_key(key), 1, LOCK_TTL)
+    if not locked:
+        if entry:
+            # 다른 워커가 갱신 중이면 만료된 값이라도 바로 응답
+            return entry["value"], STALE
+        filled = _wait_for_fill(key, MISS_WAIT)
+        if filled:
+            return filled["value"], HIT
+
+    try:
+        value = loader()
+    except Exception:
+        if entry:
+            logger.warning("swr_fallback", extra={"cache_key": key})
+            return entry["value"], FALLBACK
+        raise
+    finally:
+        if locked:
+            cache.delete(_lock_key(key))
+
+    _store(key, value, fresh_ttl, stale_ttl)
+    return value, MISS
+
+
+def prime(key, loader, fresh_ttl, stale_ttl):
+    """만료 여부와 관계없이 loader 결과로 즉시 채움 (배포 직후 예열용)"""
+    value = loader()
+    _store(key, value, fresh_ttl, stale_ttl)
+    return value
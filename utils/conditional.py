@@ -0,0 +1,87 @@
+# utils/conditional.py
+"""
+공개 목록 API 의 ETag / 조건부 GET.
+- ETag 는 응답 본문을 만들지 않고 계산 (DB 목록: 집계 1쿼리 지문, HRD: 데이터셋 해시)
+- If-None-Match 가 맞으면 직렬화 전에 304
+- Cache-Control/Vary 를 붙여 앞단 CDN 도 재검증 후 재사용할 수 있게 함
+"""
+import hashlib
+
+from django.db.models import Count, Max, Sum
+from django.http import HttpResponseNotModified
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags, quote_etag
+
+VARY_HEADERS = ("Accept", "Accept-Encoding")
+
+
+def make_etag(*parts):
+    """지문 조각들 → 강한 ETag (따옴표 포함)"""
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode("utf-8"))
+    return quote_etag(digest.hexdigest()[:32])
+
+
+def request_key(request):
+    """같은 데이터라도 쿼리(페이지/필터)·호스트(절대 URL)별로 응답이 다름"""
+    return f"{request.get_host()}{request.get_full_path()}"
+
+
+def queryset_fingerprint(queryset, fields=("updated_at",), sum_fields=()):
+    """
+    count / max(pk) / max(각 fields) / sum(sum_fields) 를 집계 1쿼리로 계산.
+    조회수처럼 updated_at 을 건드리지 않는 컬럼은 sum_fields 로 넣는다.
+    """
+    aggregates = {"n": Count("pk"), "max_pk": Max("pk")}
+    for f in fields:
+        aggregates[f"max_{f}"] = Max(f)
+    for f in sum_fields:
+        aggregates[f"sum_{f}"] = Sum(f)
+    values = queryset.order_by().aggregate(**aggregates)
+    return tuple(values[k] for k in sorted(values))
+
+
+def not_modified(request, etag):
+    """If-None-Match 가 etag 와 맞으면 304 응답, 아니면 None"""
+    if request.method not in ("GET", "HEAD"):
+        return None
+    header = request.META.get("HTTP_IF_NONE_MATCH")
+    if not header:
+        return None
+    etags = parse_etags(header)
+    # If-None-Match 는 약한 비교 (W/ 접두어 무시)
+    if "*" in etags or etag.removeprefix("W/") in {e.removeprefix("W/") for e in etags}:
+        response = HttpResponseNotModified()
+        set_cache_headers(response, etag)
+        return response
+    return None
+
+
+def set_cache_headers(response, etag, s_maxage=60):
+    response["ETag"] = etag
+    # 브라우저는 매번 재검증, CDN 은 s_maxage 동안 보관 후 재검증
+    patch_cache_control(response, public=True, max_age=0, s_maxage=s_maxage)
+    patch_vary_headers(response, VARY_HEADERS)
+    return response
+
+
+class ConditionalListMixin:
+    """
+    ListAPIView 용: 필터 적용된 queryset 지문으로 ETag 계산 → 일치하면 304.
+    etag_fields/etag_sum_fields 로 지문 컬럼 지정.
+    """
+
+    etag_fields = ("updated_at",)
+    etag_sum_fields = ()
+    etag_s_maxage = 60
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        etag = make_etag(
+            request_key(request),
+            queryset_fingerprint(queryset, self.etag_fields, self.etag_sum_fields),
+        )
+        response = not_modified(request, etag)
+        if response is not None:
+            return response
+        response = super().list(request, *args, **kwargs)
+        return set_cache_headers(response, etag, self.etag_s_maxage)
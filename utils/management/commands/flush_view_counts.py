@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from utils.view_counts import flush
+
+
+class Command(BaseCommand):
+    """
+    캐시에 누적된 조회수(시험정보/공지·소식/갤러리)를 DB 에 반영
+    python manage.py flush_view_counts           # 한 주기 전에 닫힌 세대까지
+    python manage.py flush_view_counts --drain   # 유예 없이 전부 (배포/캐시 교체 전)
+    평소에는 VIEW_COUNT_FLUSH_INTERVAL 마다 요청이 직접 반영하므로 cron 은 선택 사항.
+    """
+
+    help = "캐시에 쌓인 조회수 증가분을 모델별 일괄 UPDATE 로 반영합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--drain", action="store_true", help="방금 닫은 세대까지 모두 반영"
+        )
+
+    def handle(self, *args, **options):
+        result = flush(drain=options["drain"])
+        summary = ", ".join(f"{label}.{field} {n}건" for (label, field), n in result.items())
+        self.stdout.write(self.style.SUCCESS(f"조회수 반영 완료: {summary or '없음'}"))
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:24
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ViewCountFlush',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('epoch', models.IntegerField(default=-1, verbose_name='반영한 세대')),
+                ('flushed_at', models.DateTimeField(auto_now=True, verbose_name='반영 일시')),
+            ],
+            options={
+                'verbose_name': '조회수 반영 세대',
+                'verbose_name_plural': '조회수 반영 세대',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+def drop_shared_marker(apps, schema_editor):
+    """캐시 구분 없이 1행으로 쓰던 기록 → 캐시 ID 별 기록이 처음 flush 때 새로 생김"""
+    apps.get_model("utils", "ViewCountFlush").objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('utils', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_shared_marker, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name='viewcountflush',
+            name='cache_id',
+            field=models.CharField(default='', max_length=32, unique=True, verbose_name='캐시 ID'),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import models
+
+
+class ViewCountFlush(models.Model):
+    """
+    조회수 버퍼(utils.view_counts)를 DB 에 반영한 마지막 세대 (캐시 ID 별 1행).
+    증가분 UPDATE 와 같은 트랜잭션에서 갱신 → 반영과 표시가 함께 커밋되거나 함께 롤백
+    """
+
+    cache_id = models.CharField("캐시 ID", max_length=32, unique=True)
+    epoch = models.IntegerField("반영한 세대", default=-1)
+    flushed_at = models.DateTimeField("반영 일시", auto_now=True)
+
+    class Meta:
+        verbose_name = "조회수 반영 세대"
+        verbose_name_plural = "조회수 반영 세대"
+
+    def __str__(self):
+        return f"{self.cache_id}:{self.epoch}"
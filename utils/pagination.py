@@ -1,5 +1,12 @@
-from rest_framework.pagination import PageNumberPagination
+import binascii
+import json
+from base64 import b64decode, urlsafe_b64encode
+
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class CustomPageNumberPagination(PageNumberPagination):
@@ -16,3 +23,83 @@ class CustomPageNumberPagination(PageNumberPagination):
                 "results": data,
             }
         )
+
+
+class KeysetPagination(BasePagination):
+    """
+    (ordering_field 내림차순, id 내림차순) 키셋 페이지네이션.
+    - OFFSET/COUNT 없이 인덱스 범위만 읽음 → 몇 페이지를 넘겨도 비용이 같음
+    - ?cursor= 는 직전 페이지 마지막 행의 (정렬 값, id) 를 인코딩한 값 (응답의 next)
+    - ordering_field 가 NULL 인 행은 맨 뒤
+    """
+
+    page_size = 8
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    ordering_field = "start_date"
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, ""))
+        except ValueError:
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        size = self.get_page_size(request)
+        field = self.ordering_field
+
+        queryset = queryset.order_by(F(field).desc(nulls_last=True), "-pk")
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            value, pk = cursor
+            if value is None:
+                queryset = queryset.filter(**{f"{field}__isnull": True}, pk__lt=pk)
+            else:
+                queryset = queryset.filter(
+                    Q(**{f"{field}__lt": value})
+                    | Q(**{field: value}, pk__lt=pk)
+                    | Q(**{f"{field}__isnull": True})
+                )
+
+        # 한 건 더 읽어서 다음 페이지 유무 판단
+        rows = list(queryset[: size + 1])
+        self.next_cursor = None
+        if len(rows) > size:
+            rows = rows[:size]
+            last = rows[-1]
+            self.next_cursor = self.encode_cursor(getattr(last, field), last.pk)
+        return rows
+
+    def decode_cursor(self, request):
+        raw = request.query_params.get(self.cursor_query_param)
+        if not raw:
+            return None
+        try:
+            value, pk = json.loads(b64decode(raw.encode("ascii"), altchars=b"-_", validate=True))
+            return value, int(pk)
+        except (ValueError, TypeError, binascii.Error):
+            raise NotFound("잘못된 cursor 입니다.")
+
+    def encode_cursor(self, value, pk):
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        return urlsafe_b64encode(json.dumps([value, pk]).encode("ascii")).decode("ascii")
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, self.next_cursor
+        )
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "cursor": self.next_cursor,
+                "results": data,
+            }
+        )
@@ -1,12 +1,15 @@
-import requests
 from django.conf import settings
 
+from utils import upstream
+
+EXAM_SCHEDULE_PATH = "/B490007/qualExamSchd/getQualExamSchdList"
+
 def fetch_exam_plans_from_qnet(jmcd, year):
     from django.conf import settings
 
     print(">>> 인증키:", settings.QNET_API_KEY)  # ✅ 출력 필수
 
-    url = "https://apis.data.go.kr/B490007/qualExamSchd/getQualExamSchdList"
+    url = settings.DATA_GO_KR_BASE_URL + EXAM_SCHEDULE_PATH
     params = {
         "serviceKey": settings.QNET_API_KEY,
         "implYy": year,
@@ -17,6 +20,6 @@ def fetch_exam_plans_from_qnet(jmcd, year):
         "numOfRows": 50,
     }
 
-    response = requests.get(url, params=params, timeout=5)
+    response = upstream.get(url, params=params)
     print(">>> 최종 요청 URL:", response.request.url)
     print(">>> 응답:", response.text)
@@ -0,0 +1,170 @@
+# utils/standin.py
+"""
+work24(310L01/310L03) · Q-Net 일정 API 로컬 대역 서버 (부하 테스트용).
+- 녹화해 둔 응답(fixture)을 그대로 재생 (인증키 불필요)
+- 310L01 은 fixture 레코드를 반복해 total_rows 건까지 늘린 뒤 pageNum/pageSize 로 페이지 제공
+- 응답마다 지연(latency + jitter), 일정 비율 503 오류 주입
+- 표준 라이브러리 ThreadingHTTPServer 만 사용
+settings.WORK24_BASE_URL / DATA_GO_KR_BASE_URL 을 이 서버 주소로 바꾸면 앱이 그대로 붙는다.
+"""
+import copy
+import json
+import math
+import random
+import re
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+from xml.etree import ElementTree as ET
+
+WORK24_LIST_PATH = "/cm/openApi/call/hr/callOpenApiSvcInfo310L01.do"
+WORK24_DETAIL_PATH = "/cm/openApi/call/hr/callOpenApiSvcInfo310L03.do"
+QNET_SCHEDULE_PATH = "/B490007/qualExamSchd/getQualExamSchdList"
+
+MAX_PAGE_SIZE = 100  # work24 와 동일한 상한
+
+
+@dataclass
+class StandinConfig:
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0  # 0 ~ 1, 해당 비율만큼 503
+    total_rows: int = 0  # 0 이면 fixture 레코드 수 그대로
+    verbose: bool = False
+
+
+class Fixtures:
+    """녹화 응답 로드 + 요청별 응답 생성"""
+
+    def __init__(self, list_path, detail_path, qnet_path):
+        root = ET.parse(list_path).getroot()
+        self.records = list(root.iter("scn_list"))
+        if not self.records:
+            raise ValueError(f"310L01 fixture 에 scn_list 가 없습니다: {list_path}")
+        with open(detail_path, "rb") as f:
+            self.detail = f.read()
+        with open(qnet_path, encoding="utf-8") as f:
+            self.qnet = json.load(f)
+
+    def _record(self, index):
+        """index 번째 가상 레코드 (fixture 를 한 바퀴 돌 때마다 회차를 100씩 올림)"""
+        base = self.records[index % len(self.records)]
+        cycle = index // len(self.records)
+        if cycle == 0:
+            return base
+        record = copy.deepcopy(base)
+        degree = record.find("trprDegr")
+        if degree is not None:
+            degree.text = str(int(degree.text or 0) + cycle * 100)
+        return record
+
+    def list_page(self, total_rows, page_num, page_size, trpr_id=None):
+        total = total_rows or len(self.records)
+        if trpr_id:
+            # 과정ID 검색(기관ID 역조회): 해당 과정의 가상 레코드만
+            bases = [
+                i for i, r in enumerate(self.records) if r.findtext("trprId") == trpr_id
+            ]
+            cycles = math.ceil(total / len(self.records))
+            indices = [
+                c * len(self.records) + i
+                for c in range(cycles)
+                for i in bases
+                if c * len(self.records) + i < total
+            ]
+        else:
+            indices = range(total)
+
+        start = (page_num - 1) * page_size
+        page = indices[start : start + page_size]
+        body = "".join(
+            ET.tostring(self._record(i), encoding="unicode") for i in page
+        )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n<HRDNet>'
+            f"<pageNum>{page_num}</pageNum><pageSize>{page_size}</pageSize>"
+            f"<scn_cnt>{len(indices)}</scn_cnt><srchList>{body}</srchList></HRDNet>"
+        ).encode("utf-8")
+
+    def detail_for(self, trpr_id, degree):
+        content = self.detail
+        if trpr_id:
+            content = re.sub(
+                rb"<trprId>[^<]*</trprId>",
+                b"<trprId>" + trpr_id.encode() + b"</trprId>",
+                content,
+            )
+        if degree:
+            content = re.sub(
+                rb"<trprDegr>[^<]*</trprDegr>",
+                b"<trprDegr>" + degree.encode() + b"</trprDegr>",
+                content,
+            )
+        return content
+
+    def qnet_for(self, year):
+        doc = copy.deepcopy(self.qnet)
+        if year:
+            for item in doc.get("body", {}).get("items", []):
+                item["implYy"] = year
+        return json.dumps(doc, ensure_ascii=False).encode("utf-8")
+
+
+def make_handler(fixtures, config):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive (커넥션 풀 재사용 확인용)
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+
+            delay = config.latency_ms + random.uniform(0, config.jitter_ms)
+            if delay > 0:
+                time.sleep(delay / 1000)
+            if config.error_rate and random.random() < config.error_rate:
+                return self._send(503, b"Service Unavailable", "text/plain")
+
+            if url.path == WORK24_LIST_PATH:
+                page_num = max(_int(query.get("pageNum"), 1), 1)
+                page_size = min(max(_int(query.get("pageSize"), 10), 1), MAX_PAGE_SIZE)
+                body = fixtures.list_page(
+                    config.total_rows, page_num, page_size, query.get("srchTrprId")
+                )
+                return self._send(200, body, "application/xml; charset=UTF-8")
+            if url.path == WORK24_DETAIL_PATH:
+                body = fixtures.detail_for(
+                    query.get("srchTrprId"), query.get("srchTrprDegr")
+                )
+                return self._send(200, body, "application/xml; charset=UTF-8")
+            if url.path == QNET_SCHEDULE_PATH:
+                body = fixtures.qnet_for(query.get("implYy"))
+                return self._send(200, body, "application/json; charset=UTF-8")
+            return self._send(404, b"Not Found", "text/plain")
+
+        def _send(self, status, body, content_type):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            if config.verbose:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def build_server(host, port, fixtures, config):
+    """serve_forever() 로 실행 (port=0 이면 빈 포트 자동 할당)"""
+    server = ThreadingHTTPServer((host, port), make_handler(fixtures, config))
+    server.daemon_threads = True
+    return server
+
+
+def _int(value, default):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
@@ -0,0 +1,28 @@
+# utils/testing.py
+"""앱별 테스트가 같이 쓰는 검증 도우미 (운영 코드에서는 import 하지 않음)"""
+
+
+class ConditionalGetAssertions:
+    """utils.conditional 을 쓰는 목록 API 의 ETag/304 검증 (APITestCase 와 함께 상속)"""
+
+    def revalidate(self, url, etag):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def assert_304_until_changed(self, url, change):
+        first = self.client.get(url)
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+        self.assertIn("s-maxage", first["Cache-Control"])
+        self.assertIn("Accept-Encoding", first["Vary"])
+
+        res = self.revalidate(url, etag)
+        self.assertEqual(res.status_code, 304)
+        self.assertEqual(res["ETag"], etag)
+        self.assertEqual(res.content, b"")
+        # 약한 비교: W/ 접두어여도 일치
+        self.assertEqual(self.revalidate(url, "W/" + etag).status_code, 304)
+
+        change()
+        res = self.revalidate(url, etag)
+        self.assertEqual(res.status_code, 200)
+        self.assertNotEqual(res["ETag"], etag)
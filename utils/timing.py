@@ -0,0 +1,139 @@
+# utils/timing.py
+"""
+요청 단위 구간(span) 계측 + Server-Timing 헤더.
+- with span("upstream"): ... 처럼 이름 붙은 구간 시간을 contextvar 에 누적
+  (같은 이름은 합산, 횟수 기록. 요청 밖에서 호출하면 아무것도 하지 않음)
+- ServerTimingMiddleware 가 요청마다 수집을 시작하고
+  · DB 쿼리(db), 응답 렌더링(render), 전체(total)를 자동으로 더함
+  · 관리자(is_staff)/DEBUG/샘플링된 요청에만 Server-Timing 헤더 노출
+  · 샘플링/느린 요청은 request_timing 구조화 로그로 남김
+  · X-Elapsed-ms(전체 시간)는 항상 설정
+"""
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+_spans = ContextVar("server_timing_spans", default=None)
+
+
+def start():
+    """현재 컨텍스트에서 수집 시작 → 수집용 dict"""
+    spans = {}
+    _spans.set(spans)
+    return spans
+
+
+def record(name, ms):
+    """이미 잰 시간을 구간에 더함 (타이밍 훅 등)"""
+    spans = _spans.get()
+    if spans is None:
+        return
+    total, count = spans.get(name, (0.0, 0))
+    spans[name] = (total + ms, count + 1)
+
+
+@contextmanager
+def span(name):
+    if _spans.get() is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - t0) * 1000)
+
+
+def header_value(spans):
+    """{"db": (12.3, 4)} → 'db;dur=12.3;desc="4"' (순서 유지)"""
+    parts = []
+    for name, (ms, count) in spans.items():
+        part = f"{name};dur={ms:.1f}"
+        if count > 1:
+            part += f';desc="{count}"'
+        parts.append(part)
+    return ", ".join(parts)
+
+
+def _db_span(execute, sql, params, many, context):
+    with span("db"):
+        return execute(sql, params, many, context)
+
+
+def _install_db_span(connection, **kwargs):
+    if _db_span not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_db_span)
+
+
+connection_created.connect(_install_db_span)
+
+
+class ServerTimingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        spans, t0 = self._begin()
+        response = self.get_response(request)
+        return self._finish(request, response, spans, t0)
+
+    async def __acall__(self, request):
+        spans, t0 = self._begin()
+        response = await self.get_response(request)
+        return self._finish(request, response, spans, t0)
+
+    def _begin(self):
+        # 이미 열린 커넥션(요청 스레드)에도 DB 계측 연결
+        for connection in connections.all(initialized_only=True):
+            _install_db_span(connection)
+        return start(), time.perf_counter()
+
+    def process_template_response(self, request, response):
+        # DRF Response 는 이 뒤에 렌더링됨 → 렌더링 시간은 콜백에서 기록
+        t_render = time.perf_counter()
+        response.add_post_render_callback(
+            lambda r: record("render", (time.perf_counter() - t_render) * 1000)
+        )
+        return response
+
+    def _finish(self, request, response, spans, t0):
+        total_ms = (time.perf_counter() - t0) * 1000
+        spans["total"] = (total_ms, 1)
+        _spans.set(None)
+
+        response["X-Elapsed-ms"] = f"{total_ms:.1f}"
+        sampled = random.random() < getattr(settings, "SERVER_TIMING_SAMPLE_RATE", 0)
+        user = getattr(request, "user", None)
+        if sampled or settings.DEBUG or getattr(user, "is_staff", False):
+            response["Server-Timing"] = header_value(spans)
+
+        slow_ms = getattr(settings, "SERVER_TIMING_SLOW_MS", 1000)
+        if sampled or total_ms >= slow_ms:
+            logger.info(
+                "request_timing",
+                extra={
+                    "method": request.method,
+                    "path": request.path,
+                    "status": response.status_code,
+                    "total_ms": round(total_ms, 1),
+                    "spans": {k: round(v[0], 1) for k, v in spans.items()},
+                },
+            )
+        return response
@@ -0,0 +1,189 @@
+# utils/upstream.py
+"""
+공공데이터(work24 / data.go.kr) 공용 HTTP 클라이언트.
+- 프로세스당 하나의 requests.Session (keep-alive 커넥션 풀 재사용)
+- 호스트별 타임아웃은 settings.UPSTREAM_TIMEOUTS (없는 호스트는 DEFAULT_TIMEOUT)
+- 연결 오류/502·503·504 에 한해 지터 포함 지수 백오프 재시도
+  (읽기 타임아웃은 재시도하지 않음 → 호출 하나가 요청 스레드를 read 타임아웃 x 3 동안 잡지 않게)
+- 호출마다 타이밍 훅 실행 (로깅/메트릭)
+- settings.UPSTREAM_BREAKERS 에 등록된 호스트는 서킷 브레이커 경유
+"""
+import logging
+import os
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+from utils import timing
+from utils.breaker import CircuitBreaker, CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+POOL_CONNECTIONS = 10  # 호스트 수
+POOL_MAXSIZE = 32  # 호스트당 유지 커넥션 수
+
+# (connect, read) 초 — settings.UPSTREAM_TIMEOUTS 에 없는 호스트용
+DEFAULT_TIMEOUT = (3.05, 10)
+
+MAX_RETRIES = 2
+BACKOFF_BASE = 0.2  # 초
+BACKOFF_MAX = 2.0
+RETRY_STATUSES = {502, 503, 504}
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+_timing_hooks = []
+
+
+def get_session():
+    """프로세스 단위 세션 (gunicorn fork 이후에는 새로 생성)"""
+    global _session, _session_pid
+    pid = os.getpid()
+    if _session is None or _session_pid != pid:
+        with _session_lock:
+            if _session is None or _session_pid != pid:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _session, _session_pid = session, pid
+    return _session
+
+
+def timeout_for(url):
+    host = urlsplit(url).hostname or ""
+    timeouts = getattr(settings, "UPSTREAM_TIMEOUTS", None) or {}
+    return timeouts.get(host) or DEFAULT_TIMEOUT
+
+
+def breaker_for(url_or_host):
+    """호스트별 브레이커 (설정에 없으면 None)"""
+    host = urlsplit(url_or_host).hostname or url_or_host
+    config = (getattr(settings, "UPSTREAM_BREAKERS", None) or {}).get(host)
+    # 상태는 캐시에 있으므로 객체는 매번 만들어도 된다
+    return CircuitBreaker(host, **config) if config else None
+
+
+def circuit_states():
+    """설정된 호스트별 브레이커 상태 (헬스체크/메트릭용)"""
+    hosts = getattr(settings, "UPSTREAM_BREAKERS", None) or {}
+    return {host: breaker_for(host).state() for host in hosts}
+
+
+def add_timing_hook(hook):
+    """hook(host=..., url=..., status=..., elapsed_ms=..., attempt=..., error=...)"""
+    if hook not in _timing_hooks:
+        _timing_hooks.append(hook)
+
+
+def remove_timing_hook(hook):
+    if hook in _timing_hooks:
+        _timing_hooks.remove(hook)
+
+
+def _emit(**info):
+    for hook in list(_timing_hooks):
+        try:
+            hook(**info)
+        except Exception:
+            logger.exception("upstream_hook_fail")
+
+
+def _log_hook(**info):
+    logger.info("upstream_call", extra=info)
+
+
+def _span_hook(elapsed_ms, **info):
+    # 요청 중이면 Server-Timing 의 upstream 구간에 합산
+    timing.record("upstream", elapsed_ms)
+
+
+add_timing_hook(_log_hook)
+add_timing_hook(_span_hook)
+
+
+def _backoff(attempt):
+    # full jitter: 0 ~ min(max, base * 2^attempt)
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2**attempt)))
+
+
+def get(url, params=None, timeout=None, retries=MAX_RETRIES):
+    """
+    GET 호출 후 raise_for_status 까지 수행한 Response 반환.
+    연결 오류(연결 타임아웃 포함)와 502/503/504 만 재시도한다 (읽기 타임아웃은 바로 실패).
+    브레이커가 열려 있으면 호출 없이 CircuitOpenError.
+    """
+    host = urlsplit(url).hostname or ""
+    breaker = breaker_for(host)
+    if breaker and not breaker.allow():
+        _emit(
+            host=host,
+            url=url,
+            status=None,
+            elapsed_ms=0.0,
+            attempt=0,
+            error=CircuitOpenError.__name__,
+        )
+        raise CircuitOpenError(host)
+
+    try:
+        resp = _get(url, params, timeout or timeout_for(url), retries, host)
+    except (requests.ConnectionError, requests.Timeout):
+        if breaker:
+            breaker.record_failure()
+        raise
+    except requests.HTTPError as e:
+        if breaker:
+            if e.response is not None and e.response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                # 4xx 는 요청 문제라 성공/실패 어느 쪽으로도 세지 않음 (probe 자리만 반납)
+                breaker.release_probe()
+        raise
+    if breaker:
+        breaker.record_success()
+    return resp
+
+
+def _get(url, params, timeout, retries, host):
+    session = get_session()
+    for attempt in range(retries + 1):
+        t0 = time.perf_counter()
+        try:
+            resp = session.get(url, params=params, timeout=timeout)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            _emit(
+                host=host,
+                url=url,
+                status=None,
+                elapsed_ms=(time.perf_counter() - t0) * 1000,
+                attempt=attempt,
+                error=type(e).__name__,
+            )
+            # ConnectTimeout 은 ConnectionError 이기도 하므로 재시도, ReadTimeout 은 바로 실패
+            if attempt >= retries or not isinstance(e, requests.ConnectionError):
+                raise
+            time.sleep(_backoff(attempt))
+            continue
+
+        _emit(
+            host=host,
+            url=url,
+            status=resp.status_code,
+            elapsed_ms=(time.perf_counter() - t0) * 1000,
+            attempt=attempt,
+            error=None,
+        )
+        if resp.status_code in RETRY_STATUSES and attempt < retries:
+            time.sleep(_backoff(attempt))
+            continue
+        resp.raise_for_status()
+        return resp
@@ -0,0 +1,136 @@
+# utils/upstream_async.py
+"""
+공공데이터 비동기 HTTP 클라이언트 (ASGI 뷰용, aiohttp).
+- 이벤트 루프당 ClientSession 하나 (TCPConnector 커넥션 풀 재사용)
+- 타임아웃/재시도/타이밍 훅/서킷 브레이커는 utils.upstream 과 같은 설정을 공유
+- aiohttp 는 ASGI 경로에서만 필요하므로 처음 호출할 때 import
+"""
+import asyncio
+import time
+import weakref
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+
+from utils import upstream
+from utils.breaker import CircuitOpenError
+
+POOL_LIMIT = 200  # 프로세스 전체 동시 커넥션
+POOL_LIMIT_PER_HOST = 100
+DNS_CACHE_TTL = 300
+
+_sessions = weakref.WeakKeyDictionary()
+
+
+class UpstreamStatusError(Exception):
+    """4xx/5xx 응답 (재시도 후에도 실패)"""
+
+    def __init__(self, url, status):
+        super().__init__(f"{status} for url: {url}")
+        self.url = url
+        self.status = status
+
+
+def get_session():
+    """현재 이벤트 루프의 공용 세션"""
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    session = _sessions.get(loop)
+    if session is None or session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=POOL_LIMIT,
+            limit_per_host=POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        session = _sessions[loop] = aiohttp.ClientSession(connector=connector)
+    return session
+
+
+def _client_timeout(url):
+    import aiohttp
+
+    connect, read = upstream.timeout_for(url)
+    return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+
+async def get(url, params=None, retries=upstream.MAX_RETRIES):
+    """
+    GET 호출 후 본문 bytes 반환. 재시도 기준은 utils.upstream.get 과 동일.
+    브레이커가 열려 있으면 호출 없이 CircuitOpenError.
+    """
+    host = urlsplit(url).hostname or ""
+    breaker = upstream.breaker_for(host)
+    # 브레이커 상태는 캐시 조회뿐이라 DB 스레드를 잡지 않는다
+    if breaker and not await sync_to_async(breaker.allow, thread_sensitive=False)():
+        raise CircuitOpenError(host)
+
+    try:
+        content = await _get(url, params, retries, host)
+    except UpstreamStatusError as e:
+        if breaker:
+            # 4xx 는 성공/실패 어느 쪽으로도 세지 않음 (utils.upstream.get 과 동일)
+            record = breaker.record_failure if e.status >= 500 else breaker.release_probe
+            await sync_to_async(record, thread_sensitive=False)()
+        raise
+    except Exception:
+        if breaker:
+            await sync_to_async(breaker.record_failure, thread_sensitive=False)()
+        raise
+    if breaker:
+        await sync_to_async(breaker.record_success, thread_sensitive=False)()
+    return content
+
+
+def _retryable(error):
+    """연결 오류/연결 타임아웃만 재시도 (읽기 타임아웃은 requests 쪽과 같이 바로 실패)"""
+    import aiohttp
+
+    connect_timeout = getattr(aiohttp, "ConnectionTimeoutError", ())  # aiohttp 3.10+
+    if isinstance(error, asyncio.TimeoutError):
+        return bool(connect_timeout) and isinstance(error, connect_timeout)
+    return True
+
+
+async def _get(url, params, retries, host):
+    import aiohttp
+
+    session = get_session()
+    timeout = _client_timeout(url)
+    # aiohttp 는 None 값을 허용하지 않음 (requests 는 생략)
+    params = {k: v for k, v in (params or {}).items() if v is not None}
+
+    for attempt in range(retries + 1):
+        t0 = time.perf_counter()
+        try:
+            async with session.get(url, params=params, timeout=timeout) as resp:
+                status = resp.status
+                content = await resp.read()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            upstream._emit(
+                host=host,
+                url=url,
+                status=None,
+                elapsed_ms=(time.perf_counter() - t0) * 1000,
+                attempt=attempt,
+                error=type(e).__name__,
+            )
+            if attempt >= retries or not _retryable(e):
+                raise
+            await asyncio.sleep(upstream._backoff(attempt))
+            continue
+
+        upstream._emit(
+            host=host,
+            url=url,
+            status=status,
+            elapsed_ms=(time.perf_counter() - t0) * 1000,
+            attempt=attempt,
+            error=None,
+        )
+        if status in upstream.RETRY_STATUSES and attempt < retries:
+            await asyncio.sleep(upstream._backoff(attempt))
+            continue
+        if status >= 400:
+            raise UpstreamStatusError(url, status)
+        return content
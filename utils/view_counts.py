@@ -0,0 +1,189 @@
+# utils/view_counts.py
+"""
+조회수 버퍼링.
+상세 조회마다 UPDATE ... SET views = views + 1 을 하면 인기 글 한 행에 쓰기가 몰리므로
+- 조회는 공유 캐시 카운터만 올림 (record_view)
+- 모아 둔 증가분은 flush() 가 모델마다 UPDATE 1번(Case/When)으로 반영
+- 응답의 조회수는 DB 값 + 아직 반영 안 된 증가분
+
+카운터는 세대(epoch) 단위로 나눠 둔다.
+- flush 는 세대를 하나 올리고, 한 세대 전에 닫힌 세대까지만 반영
+  (세대를 읽은 직후 flush 가 끼어든 요청의 증가분도 잃지 않도록 한 주기 유예)
+- 세대마다 처음 올린 카운터만 목록(log)에 등록 → flush 는 목록에 있는 카운터만 읽음
+- 반영한 세대는 DB(ViewCountFlush)에 UPDATE 와 같은 트랜잭션으로 기록
+  → 커밋 직후 프로세스가 죽어도 같은 세대를 다시 더하지 않음 (캐시 표시는 읽기용 사본)
+- 세대 번호는 캐시마다 따로 매겨지므로 반영 기록도 캐시 ID(캐시 안에 둔 무작위 값)별 1행
+  (Redis 를 같이 쓰면 1행, 프로세스별 locmem 이나 캐시가 비워진 뒤에는 새 행에서 다시 시작)
+- 주기(VIEW_COUNT_FLUSH_INTERVAL 초)마다 그 시점에 조회한 요청 하나가 직접 flush
+  수동/배포 전: python manage.py flush_view_counts (--drain 이면 유예 없이 전부)
+"""
+import logging
+import uuid
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Case, F, Value, When
+
+from utils.models import ViewCountFlush
+
+logger = logging.getLogger(__name__)
+
+EPOCH_KEY = "views:epoch"
+FLUSHED_KEY = "views:flushed"  # 마지막으로 반영한 세대 (ViewCountFlush 의 캐시 사본)
+CACHE_ID_KEY = "views:cache-id"  # 반영 기록(ViewCountFlush)을 고르는 이 캐시의 ID
+FLUSH_LOCK_KEY = "views:flush-lock"  # 주기: 요청이 flush 할 차례인지
+FLUSH_MUTEX_KEY = "views:flush-running"  # 동시에 flush 하나만 (요청/커맨드 공통)
+FLUSH_MUTEX_TTL = 60
+COUNTER_TTL = 60 * 60 * 24  # flush 가 멈춰도 하루는 보관
+
+
+def _counter_key(epoch, label, field, pk):
+    return f"views:{epoch}:{label}:{field}:{pk}"
+
+
+def _log_size_key(epoch):
+    return f"views:{epoch}:n"
+
+
+def _log_key(epoch, n):
+    return f"views:{epoch}:log:{n}"
+
+
+def _epochs():
+    state = cache.get_many([EPOCH_KEY, FLUSHED_KEY])
+    return state.get(EPOCH_KEY, 0), state.get(FLUSHED_KEY, -1)
+
+
+def _incr(key):
+    cache.add(key, 0, COUNTER_TTL)
+    return cache.incr(key)
+
+
+def record_view(instance, field):
+    """
+    instance 조회수 +1 (캐시) → instance.<field> 를 DB 값 + 미반영 증가분으로 맞춤.
+    주기가 지났으면 이 요청이 flush 도 수행.
+    """
+    label = instance._meta.label
+    epoch, flushed = _epochs()
+    key = _counter_key(epoch, label, field, instance.pk)
+    if cache.add(key, 1, COUNTER_TTL):
+        # 이번 세대에서 처음 → flush 대상 목록에 등록
+        n = _incr(_log_size_key(epoch))
+        cache.set(_log_key(epoch, n), (label, field, instance.pk), COUNTER_TTL)
+        current = 1
+    else:
+        current = cache.incr(key)
+
+    older = [_counter_key(e, label, field, instance.pk) for e in range(flushed + 1, epoch)]
+    pending = current + sum(cache.get_many(older).values())
+    setattr(instance, field, getattr(instance, field) + pending)
+
+    interval = getattr(settings, "VIEW_COUNT_FLUSH_INTERVAL", 30)
+    if interval and cache.add(FLUSH_LOCK_KEY, 1, interval):
+        try:
+            flush()
+        except Exception:
+            # 반영 실패해도 카운터는 남아 있으므로 다음 주기에 다시 시도
+            logger.exception("view_count_flush_fail")
+    return pending
+
+
+def _collect(epoch):
+    """세대의 (label, field) → {pk: 증가분}, 읽은 캐시 키 목록"""
+    size = cache.get(_log_size_key(epoch), 0)
+    log_keys = [_log_key(epoch, n) for n in range(1, size + 1)]
+    entries = list(cache.get_many(log_keys).values())
+    counter_keys = {_counter_key(epoch, *entry): entry for entry in entries}
+    counts = cache.get_many(list(counter_keys))
+
+    deltas = {}
+    for key, (label, field, pk) in counter_keys.items():
+        if counts.get(key):
+            deltas.setdefault((label, field), {})[pk] = counts[key]
+    return deltas, [_log_size_key(epoch), *log_keys, *counter_keys]
+
+
+def _apply(label, field, deltas):
+    """{pk: 증가분} → UPDATE 1번 (field = field + CASE pk ... END)"""
+    model = apps.get_model(label)
+    bump = Case(
+        *(When(pk=pk, then=Value(n)) for pk, n in deltas.items()),
+        default=Value(0),
+    )
+    return model.objects.filter(pk__in=list(deltas)).update(**{field: F(field) + bump})
+
+
+def flush(drain=False):
+    """
+    닫힌 세대의 증가분을 DB 에 반영 → {(모델 라벨, 필드): 갱신 행 수}.
+    drain=True 면 방금 닫은 세대까지 전부 (테스트/배포 전 수동 실행용)
+    다른 flush 가 진행 중이면 아무것도 하지 않음
+    """
+    if not cache.add(FLUSH_MUTEX_KEY, 1, FLUSH_MUTEX_TTL):
+        return {}
+    try:
+        return _flush(drain)
+    finally:
+        cache.delete(FLUSH_MUTEX_KEY)
+
+
+def _has_counters(first, last):
+    sizes = cache.get_many([_log_size_key(e) for e in range(first, last + 1)])
+    return any(sizes.values())
+
+
+def _cache_id():
+    """이 캐시의 ID (처음 flush 때 만들어 캐시에 보관, 캐시가 비워지면 새 ID)"""
+    cache.add(CACHE_ID_KEY, uuid.uuid4().hex, None)
+    return cache.get(CACHE_ID_KEY)
+
+
+def _flush(drain):
+    epoch, cached = _epochs()
+    cache.set(EPOCH_KEY, epoch + 1, None)
+    upto = epoch if drain else epoch - 1
+    if not _has_counters(cached + 1, upto):
+        # 반영할 카운터가 없으면 DB 를 건드리지 않음 (주기 flush 대부분)
+        cache.set(FLUSHED_KEY, max(upto, cached), None)
+        return {}
+
+    with transaction.atomic():
+        # 반영 세대는 이 캐시의 DB 기록 기준 (행 잠금으로 같은 캐시를 쓰는 다른 서버와 직렬화)
+        marker, _ = ViewCountFlush.objects.select_for_update().get_or_create(
+            cache_id=_cache_id()
+        )
+        flushed = marker.epoch
+        if upto <= flushed:
+            cache.set(FLUSHED_KEY, flushed, None)
+            return {}
+
+        # 여러 세대가 밀려 있어도 합쳐서 모델·필드마다 UPDATE 1번
+        deltas, keys = {}, []
+        for e in range(flushed + 1, upto + 1):
+            epoch_deltas, epoch_keys = _collect(e)
+            keys += epoch_keys
+            for target, per_pk in epoch_deltas.items():
+                merged = deltas.setdefault(target, {})
+                for pk, n in per_pk.items():
+                    merged[pk] = merged.get(pk, 0) + n
+
+        result = {
+            (label, field): _apply(label, field, per_pk)
+            for (label, field), per_pk in deltas.items()
+        }
+        marker.epoch = upto
+        marker.save(update_fields=["epoch", "flushed_at"])
+
+    # 커밋된 뒤에만 캐시 사본 갱신/카운터 정리 (여기서 실패해도 다음 flush 가 DB 기준으로 건너뜀)
+    cache.set(FLUSHED_KEY, upto, None)
+    cache.delete_many(keys)
+
+    if result:
+        logger.info(
+            "view_count_flush",
+            extra={"epochs": [flushed + 1, upto], "rows": sum(result.values())},
+        )
+    return result